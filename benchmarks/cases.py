@@ -0,0 +1,383 @@
+"""
+Representative instances of every component for the benchmark suite.
+
+Each case pairs a scalar call (one timestep through compute() or the
+equivalent entry point) with a batch call over n timesteps. Parameters are
+plausible AHU/plant values; only the call overhead and the arithmetic are
+being measured, not the physics.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+import energy_models as em
+
+# Case name -> (scalar callable, scalar args, batch callable, batch args of n)
+Case = Tuple[
+    Callable[..., Any],
+    Tuple[Any, ...],
+    Callable[..., Any],
+    Callable[[int], Dict[str, np.ndarray]],
+]
+
+_RNG_SEED = 20240101
+
+
+def _rng() -> np.random.Generator:
+    return np.random.default_rng(_RNG_SEED)
+
+
+def hours(n: int) -> np.ndarray:
+    """Hour-of-year timestamps for n timesteps spread over one year."""
+    return np.linspace(0.0, 8760.0, n, endpoint=False)
+
+
+def office_schedule() -> Any:
+    return em.Scheduler(
+        default=[0.0] * 7 + [0.5] + [1.0] * 10 + [0.5] + [0.0] * 5,
+        weekend=[0.0] * 24,
+        interpolate=True,
+    )
+
+
+def speed_scaled_fan_curve(counter: Dict[str, int] = None) -> Callable[..., Any]:
+    """
+    (Q, RPM) → ΔP from a quadratic rated curve and the affinity laws.
+
+    Args:
+        counter (dict, optional): Incremented under "calls" on every call, to
+            count solver evaluations
+
+    Returns:
+        Callable: Fan curve accepting scalars or arrays
+    """
+    base = em.curve_quadratic(1200.0, 0.0, -40.0)
+    n_ref = 1500.0
+
+    def fan_curve(Q, rpm):
+        if counter is not None:
+            counter["calls"] += 1
+        ratio = rpm / n_ref
+        return ratio**2 * base(Q / ratio)
+
+    return fan_curve
+
+
+def curve_speed_fan(counter: Dict[str, int] = None) -> Any:
+    return em.CurveSpeedControlledFan(
+        rho=1.2,
+        area_outlet=0.5,
+        eta_fan=0.7,
+        eta_motor=0.92,
+        f_motor_to_air=1.0,
+        fan_curve=speed_scaled_fan_curve(counter),
+        system_pressure_func=em.curve_quadratic(50.0, 0.0, 20.0),
+        belt_loss_func=lambda w: 0.03 * w,
+        vfd_loss_func=lambda w: 0.02 * w,
+    )
+
+
+def _hydronic_network() -> Any:
+    net = em.HydronicNetwork()
+    net.set_reference("tank", pressure=100.0)
+    net.add_pump(
+        "P1", "tank", "supply", head_curve=em.curve_quadratic(250.0, 0.0, -0.02)
+    )
+    net.add_valve(
+        "V1",
+        "supply",
+        "coil_in",
+        valve=em.TwoWayControlValve(
+            kvs=25.0, x0=0.02, characteristic="equal_percentage", exponent=3.5, rho=998
+        ),
+    )
+    net.add_coil("C1", "coil_in", "return", k=0.05)
+    net.add_pipe("R1", "return", "tank", k=0.001)
+    net.compile()
+    return net
+
+
+def build_cases() -> Dict[str, Case]:
+    """
+    Build one benchmark case per component compute path.
+
+    Returns:
+        Dict[str, Case]: Case name → (scalar fn, scalar args, batch fn, batch
+        inputs factory)
+    """
+    schedule = office_schedule()
+    flow_fraction = em.make_flow_fraction_schedule(schedule)
+    available = em.make_availability_schedule(schedule)
+    cap_temp = em.curve_biquadratic((1.0, 0.01, 0.0, -0.02, 0.0, 0.0))
+    cap_flow = em.curve_biquadratic((0.2, 0.5, 0.0, 0.3, 0.0, 0.0))
+
+    def fan_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {"m_dot": rng.uniform(0.5, 3.0, n), "h_in": rng.uniform(2e4, 6e4, n)}
+
+    def schedule_inputs(n: int) -> Dict[str, np.ndarray]:
+        return {"t": hours(n) % 24, "h_in": _rng().uniform(2e4, 6e4, n)}
+
+    def coil_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {
+            "t": hours(n) % 24,
+            "T_air_in": rng.uniform(20.0, 32.0, n),
+            "T_water_in": rng.uniform(6.0, 8.0, n),
+            "V_dot_air": rng.uniform(0.5, 2.5, n),
+            "V_dot_water": rng.uniform(0.0005, 0.003, n),
+            "h_in": rng.uniform(4e4, 7e4, n),
+        }
+
+    cv = em.ConstantVolumeFan(
+        delta_p=600.0, rho=1.2, eta_fan=0.7, eta_motor=0.9, f_motor_to_air=1.0
+    )
+    vv = em.VariableVolumeFan(
+        m_dot_design=3.0,
+        delta_p=600.0,
+        rho=1.2,
+        eta_fan=0.7,
+        eta_motor=0.9,
+        f_motor_to_air=1.0,
+        power_curve=em.curve_quartic(0.0408, 0.088, -0.0729, 0.9437, 0.0),
+    )
+    onoff = em.OnOffFan(
+        m_dot_design=3.0,
+        delta_p=600.0,
+        rho=1.2,
+        eta_fan=0.7,
+        eta_motor=0.9,
+        f_motor_to_air=1.0,
+    )
+    component = em.ComponentFan(
+        rho=1.2,
+        area_outlet=0.5,
+        eta_fan=0.7,
+        eta_motor=0.92,
+        f_motor_to_air=1.0,
+        pressure_coeffs=(300.0, 50.0, -20.0, 1.0, 0.0, 0.0),
+        belt_loss_func=lambda w: 0.03 * w,
+        vfd_loss_func=lambda w: 0.02 * w,
+        static_reset_func=lambda Q: 150.0 + 25.0 * Q,
+    )
+    exhaust = em.ZoneExhaustFan(
+        V_dot_max=1.5,
+        delta_p=250.0,
+        rho=1.2,
+        eta_fan=0.6,
+        eta_total=0.5,
+        flow_fraction_schedule=flow_fraction,
+        availability_schedule=available,
+    )
+    night = em.NightVentilationFan(
+        V_dot_design=2.0,
+        delta_p_day=500.0,
+        delta_p_night=300.0,
+        rho=1.2,
+        eta_fan=0.7,
+        eta_total=0.6,
+        flow_fraction_day=flow_fraction,
+        availability_schedule=lambda t: True,
+        is_night_ventilation=lambda t: t < 6 or t >= 22,
+    )
+    cooling = em.CoolingWaterCoil(
+        Q_rated=50e3,
+        SHR=0.75,
+        rho_air=1.2,
+        availability_schedule=available,
+        cap_temp_curve=cap_temp,
+        cap_flow_curve=cap_flow,
+        pressure_drop_curve_air=em.curve_quadratic(0.0, 0.0, 40.0),
+        pressure_drop_curve_water=em.curve_quadratic(0.0, 0.0, 5e6),
+    )
+    heating = em.HeatingWaterCoil(
+        Q_rated=40e3,
+        rho_air=1.2,
+        availability_schedule=available,
+        cap_temp_curve=cap_temp,
+        cap_flow_curve=cap_flow,
+    )
+    electric = em.ElectricHeatingCoil(
+        q_nominal=10e3,
+        eta=0.98,
+        rho_air=1.2,
+        availability_schedule=available,
+        load_fraction_func=flow_fraction,
+    )
+    steam = em.SteamHeatingCoil(
+        h_fg=2.257e6,
+        cp_cond=4180.0,
+        deltaT_subcool_total=5.0,
+        m_dot_max=0.02,
+        availability_schedule=available,
+        control_schedule=flow_fraction,
+    )
+    curve_fan = curve_speed_fan()
+    two_way = em.TwoWayControlValve(
+        kvs=25.0, x0=0.02, characteristic="equal_percentage", exponent=3.5, rho=998
+    )
+    three_way = em.ThreeWayControlValve(kvs_a=25.0, kvs_b=25.0, rho=998)
+    network = _hydronic_network()
+    cubic = em.curve_cubic(0.0015, 0.0052, 1.1086, -0.1164)
+    biquadratic = cap_temp
+
+    def onoff_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {
+            "m_dot_requested": rng.uniform(0.0, 3.0, n),
+            "h_in": rng.uniform(2e4, 6e4, n),
+        }
+
+    def component_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {
+            "Q": rng.uniform(0.5, 3.0, n),
+            "P_o": rng.uniform(-10.0, 10.0, n),
+            "h_in": rng.uniform(2e4, 6e4, n),
+        }
+
+    def electric_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {
+            "t": hours(n) % 24,
+            "m_dot_air": rng.uniform(0.5, 3.0, n),
+            "h_in": rng.uniform(2e4, 6e4, n),
+        }
+
+    def curve_fan_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {"rpm": rng.uniform(600.0, 1800.0, n), "h_in": rng.uniform(2e4, 6e4, n)}
+
+    def valve_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {"x": rng.uniform(0.0, 1.0, n), "delta_p": rng.uniform(5.0, 60.0, n)}
+
+    def three_way_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {
+            "x": rng.uniform(0.0, 1.0, n),
+            "delta_p_a": rng.uniform(5.0, 60.0, n),
+            "delta_p_b": rng.uniform(5.0, 60.0, n),
+        }
+
+    def stroke_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {
+            "V_dot": rng.uniform(0.5, 20.0, n),
+            "delta_p": rng.uniform(5.0, 60.0, n),
+        }
+
+    def network_inputs(n: int) -> Dict[str, Any]:
+        return {"positions": {"V1": _rng().uniform(0.05, 1.0, n)}}
+
+    def curve_inputs(n: int) -> Dict[str, np.ndarray]:
+        return {"x": _rng().uniform(0.0, 1.2, n)}
+
+    def curve2_inputs(n: int) -> Dict[str, np.ndarray]:
+        rng = _rng()
+        return {"x": rng.uniform(15.0, 30.0, n), "z": rng.uniform(5.0, 9.0, n)}
+
+    def schedule_value_inputs(n: int) -> Dict[str, np.ndarray]:
+        return {"t": hours(n) % 24}
+
+    return {
+        "ConstantVolumeFan.compute": (
+            cv.compute,
+            (2.0, 4e4),
+            cv.compute_batch,
+            fan_inputs,
+        ),
+        "VariableVolumeFan.compute": (
+            vv.compute,
+            (2.0, 4e4),
+            vv.compute_batch,
+            fan_inputs,
+        ),
+        "OnOffFan.compute": (
+            onoff.compute,
+            (2.0, 4e4),
+            onoff.compute_batch,
+            onoff_inputs,
+        ),
+        "ComponentFan.compute": (
+            component.compute,
+            (2.0, 0.0, 4e4),
+            component.compute_batch,
+            component_inputs,
+        ),
+        "ZoneExhaustFan.compute": (
+            exhaust.compute,
+            (13.5, 4e4),
+            exhaust.compute_batch,
+            schedule_inputs,
+        ),
+        "NightVentilationFan.compute": (
+            night.compute,
+            (23.0, 4e4),
+            night.compute_batch,
+            schedule_inputs,
+        ),
+        "CurveSpeedControlledFan.compute": (
+            curve_fan.compute,
+            (1200.0, 4e4),
+            curve_fan.compute_batch,
+            curve_fan_inputs,
+        ),
+        "CoolingWaterCoil.compute": (
+            cooling.compute,
+            (13.5, 26.0, 7.0, 1.5, 0.002, 5.5e4),
+            cooling.compute_batch,
+            coil_inputs,
+        ),
+        "HeatingWaterCoil.compute": (
+            heating.compute,
+            (13.5, 26.0, 7.0, 1.5, 0.002, 5.5e4),
+            heating.compute_batch,
+            coil_inputs,
+        ),
+        "ElectricHeatingCoil.compute": (
+            electric.compute,
+            (13.5, 2.0, 4e4),
+            electric.compute_batch,
+            electric_inputs,
+        ),
+        "SteamHeatingCoil.compute": (
+            steam.compute,
+            (13.5,),
+            steam.compute_batch,
+            schedule_value_inputs,
+        ),
+        "TwoWayControlValve.compute": (
+            two_way.compute,
+            (0.6, 30.0),
+            two_way.compute,
+            valve_inputs,
+        ),
+        "TwoWayControlValve.solve_stroke": (
+            two_way.solve_stroke,
+            (8.0, 30.0),
+            two_way.solve_stroke,
+            stroke_inputs,
+        ),
+        "ThreeWayControlValve.compute": (
+            three_way.compute,
+            (0.6, 30.0, 20.0),
+            three_way.compute,
+            three_way_inputs,
+        ),
+        "HydronicNetwork.solve": (
+            network.solve,
+            ({"V1": 0.6},),
+            network.solve,
+            network_inputs,
+        ),
+        "Scheduler.get_value": (
+            schedule.get_value,
+            (13.5,),
+            schedule.get_value,
+            schedule_value_inputs,
+        ),
+        "curve_cubic": (cubic, (0.7,), cubic, curve_inputs),
+        "curve_biquadratic": (biquadratic, (26.0, 7.0), biquadratic, curve2_inputs),
+    }
@@ -0,0 +1,91 @@
+"""
+Compare two benchmark suite reports.
+
+    python benchmarks/compare.py before.json after.json --threshold 0.1
+
+Prints every shared metric with the ratio after/before and flags changes
+beyond the threshold in the bad direction. Exits 1 if any metric regressed.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, Tuple
+
+# Metric name -> True if larger is better
+_DIRECTION: Dict[str, bool] = {
+    "calls_per_s": True,
+    "batch_steps_per_s": True,
+    "loop_steps_per_s": True,
+    "speedup": True,
+    "us_per_call": False,
+    "scalar_evaluations_mean": False,
+    "scalar_evaluations_max": False,
+    "batch_iterations": False,
+    "batch_mb_per_million": False,
+    "scalar_mb_per_million": False,
+    "median_ms": False,
+    "max_rel_error": False,
+    "float32_mb_per_million": False,
+    "float64_mb_per_million": False,
+}
+
+
+def metrics(report: dict) -> Iterator[Tuple[str, str, str, float]]:
+    for section, entries in report.items():
+        if section == "meta":
+            continue
+        for case, values in entries.items():
+            for metric, value in values.items():
+                if metric in _DIRECTION and isinstance(value, (int, float)):
+                    yield section, case, metric, float(value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change counted as a regression (default 10%%)",
+    )
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    print(
+        f"before: {before['meta'].get('commit')}  after: {after['meta'].get('commit')}"
+    )
+    old = {(s, c, m): value for s, c, m, value in metrics(before)}
+    regressions = 0
+    for section, case, metric, new in metrics(after):
+        base = old.get((section, case, metric))
+        if base is None or base == 0:
+            continue
+        ratio = new / base
+        worse = (
+            ratio < 1 - args.threshold
+            if _DIRECTION[metric]
+            else (ratio > 1 + args.threshold)
+        )
+        better = (
+            ratio > 1 + args.threshold
+            if _DIRECTION[metric]
+            else (ratio < 1 - args.threshold)
+        )
+        flag = "  REGRESSION" if worse else ("  improved" if better else "")
+        regressions += worse
+        print(
+            f"{section:<8}{case:<40}{metric:<26}"
+            f"{base:14.4g} → {new:<14.4g} x{ratio:6.2f}{flag}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Cold-start import benchmark.
+
+Each measurement runs in a fresh interpreter so nothing is cached in
+sys.modules. Exits non-zero if importing the package (or a lightweight
+component) exceeds its budget or drags in NumPy/SciPy.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 30 --repeat 9
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+import energy_models
+{access}
+t1 = time.perf_counter()
+print(json.dumps({{
+    "seconds": t1 - t0,
+    "numpy": "numpy" in sys.modules,
+    "scipy": "scipy" in sys.modules,
+}}))
+"""
+
+# Case name -> (attribute accessed after import, heavy modules allowed)
+CASES: Dict[str, tuple] = {
+    "package": ("", False),
+    "ZoneExhaustFan": ("energy_models.ZoneExhaustFan", False),
+    "ComponentFan": ("energy_models.ComponentFan", False),
+    "CurveSpeedControlledFan": ("energy_models.CurveSpeedControlledFan", False),
+    "Scheduler": ("energy_models.Scheduler", False),
+    "TwoWayControlValve": ("energy_models.TwoWayControlValve", True),
+    "HydronicNetwork": ("energy_models.HydronicNetwork", True),
+}
+
+
+def measure(access: str, repeat: int) -> Dict[str, object]:
+    env = dict(
+        os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", "")
+    )
+    runs: List[dict] = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(access=access)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+        runs.append(json.loads(out.stdout))
+    return {
+        "median_ms": 1000 * statistics.median(r["seconds"] for r in runs),
+        "numpy": runs[0]["numpy"],
+        "scipy": runs[0]["scipy"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        help="Budget for cases that must not import NumPy/SciPy",
+    )
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    failures = []
+    results = {}
+    for name, (access, heavy_ok) in CASES.items():
+        res = measure(access, args.repeat)
+        results[name] = res
+        flag = ""
+        if not heavy_ok:
+            if res["numpy"] or res["scipy"]:
+                flag = "  FAIL: imports NumPy/SciPy"
+            elif res["median_ms"] > args.budget_ms:
+                flag = f"  FAIL: over {args.budget_ms:.0f} ms budget"
+        if flag:
+            failures.append(name)
+        print(f"{name:<26}{res['median_ms']:8.1f} ms{flag}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
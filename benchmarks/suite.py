@@ -0,0 +1,328 @@
+"""
+Benchmark suite for every component compute path.
+
+Runs offline and writes machine-readable JSON so two commits can be compared
+with benchmarks/compare.py:
+
+    python benchmarks/suite.py --json before.json
+    python benchmarks/suite.py --json after.json
+    python benchmarks/compare.py before.json after.json
+
+Sections (select with --only):
+    scalar   compute() calls per second, one timestep per call
+    annual   8760-step timeseries throughput, compute_batch() and scalar loop
+    solver   root-find evaluations of CurveSpeedControlledFan per operating point
+    memory   bytes held per million results, batch arrays vs scalar dicts
+    precision  float32 vs float64 compute_batch(): worst relative error per
+             output and memory per million results
+    import   cold-start import time (see benchmarks/import_time.py)
+    threads  ChunkedExecutor speedup over compute_batch() against thread
+             count, on a 10-year hourly timeseries
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+
+import cases  # noqa: E402
+import import_time  # noqa: E402
+
+from energy_models.parallel.ChunkedExecutor import ChunkedExecutor  # noqa: E402
+
+ANNUAL_STEPS = 8760
+THREAD_STEPS = 10 * ANNUAL_STEPS
+SECTIONS = ("scalar", "annual", "solver", "memory", "precision", "import", "threads")
+
+
+def rate(func: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """
+    Best calls per second of func over `repeat` timing runs.
+
+    Each run loops func for at least min_time seconds (timeit autorange
+    style) so fast calls are not dominated by timer resolution.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    runs = [elapsed] + timer.repeat(repeat=repeat - 1, number=number)
+    return number / min(runs)
+
+
+def bench_scalar(all_cases: Dict[str, cases.Case], min_time: float, repeat: int):
+    results = {}
+    for name, (func, args, _, _) in all_cases.items():
+        calls = rate(lambda: func(*args), min_time, repeat)
+        results[name] = {"calls_per_s": calls, "us_per_call": 1e6 / calls}
+        print(f"  {name:<34}{calls:14,.0f} calls/s")
+    return results
+
+
+def bench_annual(
+    all_cases: Dict[str, cases.Case], min_time: float, repeat: int, steps: int
+):
+    results = {}
+    for name, (func, _, batch, make_inputs) in all_cases.items():
+        inputs = make_inputs(steps)
+        batch_rate = rate(lambda: batch(**inputs), min_time, repeat)
+
+        if name == "HydronicNetwork.solve":
+            columns = [{"V1": float(x)} for x in inputs["positions"]["V1"]]
+            loop = lambda: [func(c) for c in columns]  # noqa: E731
+        else:
+            columns = list(zip(*(np.asarray(v).tolist() for v in inputs.values())))
+            loop = lambda: [func(*c) for c in columns]  # noqa: E731
+        loop_rate = rate(loop, min_time, 1)
+
+        results[name] = {
+            "steps": steps,
+            "batch_steps_per_s": batch_rate * steps,
+            "loop_steps_per_s": loop_rate * steps,
+            "speedup": batch_rate / loop_rate,
+        }
+        print(
+            f"  {name:<34}{batch_rate * steps:14,.0f} steps/s batch"
+            f"{loop_rate * steps:14,.0f} steps/s loop  x{batch_rate / loop_rate:7.1f}"
+        )
+    return results
+
+
+def bench_solver(points: int):
+    counter = {"calls": 0}
+    fan = cases.curve_speed_fan(counter)
+    rpms = np.linspace(600.0, 1800.0, points)
+
+    evaluations: List[int] = []
+    for rpm in rpms:
+        counter["calls"] = 0
+        fan.compute(float(rpm), 4e4)
+        # compute() evaluates the curve once more at the converged flow
+        evaluations.append(counter["calls"] - 1)
+
+    counter["calls"] = 0
+    fan.compute_batch(rpms, np.full(points, 4e4))
+    # Two bracket evaluations plus one final evaluation around the iterations
+    batch_iterations = counter["calls"] - 3
+
+    result = {
+        "points": points,
+        "scalar_evaluations_mean": statistics.mean(evaluations),
+        "scalar_evaluations_max": max(evaluations),
+        "scalar_evaluations_min": min(evaluations),
+        "batch_iterations": batch_iterations,
+    }
+    print(
+        "  CurveSpeedControlledFan brentq evaluations: "
+        f"mean {result['scalar_evaluations_mean']:.2f}, "
+        f"max {result['scalar_evaluations_max']}, "
+        f"batch iterations {batch_iterations}"
+    )
+    return {"CurveSpeedControlledFan": result}
+
+
+def _peak_bytes(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    kept = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return peak
+
+
+def bench_memory(all_cases: Dict[str, cases.Case], steps: int):
+    results = {}
+    for name, (func, _, batch, make_inputs) in all_cases.items():
+        if name == "HydronicNetwork.solve":
+            continue
+        inputs = make_inputs(steps)
+        batch_bytes = _peak_bytes(lambda: batch(**inputs))
+
+        scalar_steps = min(steps, 20_000)
+        columns = list(
+            zip(*(np.asarray(v)[:scalar_steps].tolist() for v in inputs.values()))
+        )
+        scalar_bytes = _peak_bytes(lambda: [func(*c) for c in columns])
+
+        results[name] = {
+            "batch_mb_per_million": batch_bytes / steps,
+            "scalar_mb_per_million": scalar_bytes / scalar_steps,
+        }
+        print(
+            f"  {name:<34}{batch_bytes / steps:10.1f} MB/M batch"
+            f"{scalar_bytes / scalar_steps:10.1f} MB/M scalar"
+        )
+    return results
+
+
+def bench_precision(all_cases: Dict[str, cases.Case], steps: int):
+    from energy_models.batch.batch import precision
+
+    results = {}
+    for name, (_, _, batch, make_inputs) in all_cases.items():
+        if name == "HydronicNetwork.solve" or "Valve" in name:
+            continue  # float64 only
+        inputs = make_inputs(steps)
+        exact = batch(**inputs)
+        # Single-precision runs would hold their inputs in float32 too
+        inputs32 = {
+            k: v if k == "t" else np.asarray(v, dtype=np.float32)
+            for k, v in inputs.items()
+        }
+        with precision(np.float32):
+            single = batch(**inputs32)
+            single_bytes = _peak_bytes(lambda: batch(**inputs32))
+        double_bytes = _peak_bytes(lambda: batch(**inputs))
+        if not isinstance(exact, dict):
+            exact, single = {"value": exact}, {"value": single}
+
+        # Error relative to the output's largest magnitude, so outputs that
+        # cross zero do not blow up
+        errors = {}
+        for key, value in exact.items():
+            value = np.asarray(value, dtype=float)
+            scale = np.max(np.abs(value)) if value.size else 0.0
+            diff = np.max(np.abs(np.asarray(single[key], dtype=float) - value))
+            errors[key] = float(diff / scale) if scale > 0 else float(diff)
+        worst = max(errors, key=errors.get)
+        results[name] = {
+            "max_rel_error": errors[worst],
+            "errors": errors,
+            "float32_mb_per_million": single_bytes / steps,
+            "float64_mb_per_million": double_bytes / steps,
+        }
+        print(
+            f"  {name:<34}{errors[worst]:10.1e} ({worst})"
+            f"{single_bytes / steps:8.1f} /{double_bytes / steps:6.1f} MB/M"
+        )
+    return results
+
+
+def bench_import(repeat: int):
+    results = {}
+    for name, (access, _) in import_time.CASES.items():
+        res = import_time.measure(access, repeat)
+        results[name] = res
+        print(f"  {name:<34}{res['median_ms']:10.1f} ms")
+    return results
+
+
+def thread_counts() -> List[int]:
+    # 1, 2, 4, ... up to the CPU count, which is always included
+    cpus = os.cpu_count() or 1
+    counts = [1 << k for k in range(cpus.bit_length()) if 1 << k < cpus]
+    return counts + [cpus]
+
+
+def bench_threads(
+    all_cases: Dict[str, cases.Case], min_time: float, repeat: int, steps: int
+):
+    results = {}
+    for name, (_, _, batch, make_inputs) in all_cases.items():
+        inputs = make_inputs(steps)
+        serial = rate(lambda: batch(**inputs), min_time, repeat)
+        line = f"  {name:<34}{serial * steps:14,.0f} steps/s serial"
+        for workers in thread_counts():
+            executor = ChunkedExecutor(max_workers=workers)
+            chunked = rate(lambda: executor.run(batch, inputs), min_time, repeat)
+            results[f"{name} x{workers}"] = {
+                "threads": workers,
+                "batch_steps_per_s": chunked * steps,
+                "speedup": chunked / serial,
+            }
+            line += f"  x{chunked / serial:5.2f} ({workers})"
+        print(line)
+    return results
+
+
+def metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="+", choices=SECTIONS, default=SECTIONS)
+    parser.add_argument("--cases", nargs="+", help="Substrings of case names to run")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--quick", action="store_true", help="Shorter timings and smaller arrays"
+    )
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    min_time, repeat, memory_steps = args.min_time, args.repeat, 1_000_000
+    thread_steps = THREAD_STEPS
+    if args.quick:
+        min_time, repeat, memory_steps = 0.05, 3, 100_000
+        thread_steps = ANNUAL_STEPS
+
+    all_cases = cases.build_cases()
+    if args.cases:
+        all_cases = {
+            name: case
+            for name, case in all_cases.items()
+            if any(s in name for s in args.cases)
+        }
+
+    report: Dict[str, Any] = {"meta": metadata()}
+    for section in args.only:
+        print(f"[{section}]")
+        if section == "scalar":
+            report[section] = bench_scalar(all_cases, min_time, repeat)
+        elif section == "annual":
+            report[section] = bench_annual(all_cases, min_time, repeat, ANNUAL_STEPS)
+        elif section == "solver":
+            report[section] = bench_solver(points=200)
+        elif section == "memory":
+            report[section] = bench_memory(all_cases, memory_steps)
+        elif section == "precision":
+            report[section] = bench_precision(all_cases, memory_steps)
+        elif section == "import":
+            report[section] = bench_import(repeat)
+        elif section == "threads":
+            report[section] = bench_threads(all_cases, min_time, repeat, thread_steps)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Energy Modelling Tool Kit.
+
+Every component is exposed from this namespace but imported lazily on first
+attribute access (PEP 562), so `import energy_models` stays cheap and heavy
+dependencies such as NumPy and SciPy load only with the component that needs
+them. The valve modules live in digit-prefixed directories that cannot be
+imported with a plain `import` statement; access them from here instead.
+"""
+
+import importlib
+from typing import Any, Dict, List
+
+__version__ = "0.1.0"
+
+_CURVES = "energy_models.curves.curves"
+_SCHEDULER = "energy_models.scheduler.Scheduler"
+_FLEET = "energy_models.fleet.Fleet"
+_READERS = "energy_models.timeseries.readers"
+_STREAMING = "energy_models.timeseries.streaming"
+_CALIBRATION = "energy_models.calibration.calibration"
+_BATCH = "energy_models.batch.batch"
+
+# Public name -> module that defines it
+_LAZY: Dict[str, str] = {
+    # Coils
+    "CoolingWaterCoil": "energy_models.coils.cooling_water.CoolingWaterCoil",
+    "ElectricHeatingCoil": "energy_models.coils.heating_electric.HeatingElectricCoil",
+    "SteamHeatingCoil": "energy_models.coils.heating_steam.HeatingSteamCoil",
+    "HeatingWaterCoil": "energy_models.coils.heating_water.HeatingWaterCoil",
+    # Fans
+    "ComponentFan": "energy_models.fans.component_model.ComponentFan",
+    "ConstantVolumeFan": "energy_models.fans.constant_volume.ConstantVolumeFan",
+    "CurveSpeedControlledFan": (
+        "energy_models.fans.curve_speed_controlled.CurveSpeedControlledFan"
+    ),
+    "NightVentilationFan": "energy_models.fans.night_ventilation.NightVentilation",
+    "OnOffFan": "energy_models.fans.on_off.OnOffFan",
+    "VariableVolumeFan": "energy_models.fans.variable_volume.VariableVolumeFan",
+    "ZoneExhaustFan": "energy_models.fans.zone_exhaust.ZoneExhaust",
+    # Drivetrain losses
+    "DriveLoss": "energy_models.drivetrain.DriveLoss",
+    "BeltLoss": "energy_models.drivetrain.BeltLoss",
+    "MotorLoss": "energy_models.drivetrain.MotorLoss",
+    "VFDLoss": "energy_models.drivetrain.VFDLoss",
+    # Valves
+    "TwoWayControlValve": "energy_models.valves.2_way_control.2WayControlValve",
+    "ThreeWayControlValve": "energy_models.valves.3_way_control.3WayControlValve",
+    # Fleets
+    "ComponentFanFleet": _FLEET,
+    "ConstantVolumeFanFleet": _FLEET,
+    "NightVentilationFanFleet": _FLEET,
+    "OnOffFanFleet": _FLEET,
+    "VariableVolumeFanFleet": _FLEET,
+    "ZoneExhaustFanFleet": _FLEET,
+    "CoolingWaterCoilFleet": _FLEET,
+    "HeatingWaterCoilFleet": _FLEET,
+    "ElectricHeatingCoilFleet": _FLEET,
+    "SteamHeatingCoilFleet": _FLEET,
+    # Batch evaluation
+    "precision": _BATCH,
+    "run_batch": _BATCH,
+    "derivative_batch": _BATCH,
+    "compute_by_day": _BATCH,
+    # Air loop
+    "AirLoop": "energy_models.airloop.AirLoop",
+    "IncrementalComponent": "energy_models.incremental.IncrementalComponent",
+    # Hydronics
+    "HydronicNetwork": "energy_models.hydronics.HydronicNetwork",
+    # Simulation driver
+    "AdaptiveSimulation": "energy_models.simulation.AdaptiveSimulation",
+    # Timeseries I/O
+    "read_epw": _READERS,
+    "read_csv": _READERS,
+    "load_results": _READERS,
+    "NpyWriter": "energy_models.timeseries.NpyWriter",
+    "ArrowWriter": "energy_models.timeseries.ArrowWriter",
+    "map_chunks": _STREAMING,
+    "run_stream": _STREAMING,
+    # IDF import
+    "IDFImporter": "energy_models.idf.IDFImporter",
+    # Result cache
+    "ResultCache": "energy_models.cache.ResultCache",
+    # Meters
+    "Meter": "energy_models.meters.Meter",
+    # Profiling
+    "Profiler": "energy_models.profiling.Profiler",
+    # Parametric studies
+    "ParametricSweep": "energy_models.sweep.ParametricSweep",
+    # Parallel execution
+    "SharedMemoryPool": "energy_models.parallel.SharedMemoryPool",
+    "ChunkedExecutor": "energy_models.parallel.ChunkedExecutor",
+    # Calibration
+    "fit_linear": _CALIBRATION,
+    "calibrate": _CALIBRATION,
+    "goodness_of_fit": _CALIBRATION,
+    # Optimization
+    "optimize_static_reset": "energy_models.optimization.static_reset",
+    # Uncertainty
+    "UncertaintyAnalysis": "energy_models.uncertainty.UncertaintyAnalysis",
+    # Real-time service
+    "RealtimeService": "energy_models.realtime.RealtimeService",
+    # Scheduler
+    "Scheduler": _SCHEDULER,
+    "make_flow_fraction_schedule": _SCHEDULER,
+    "make_availability_schedule": _SCHEDULER,
+    # Curves
+    "curve_linear": _CURVES,
+    "curve_quadratic": _CURVES,
+    "curve_cubic": _CURVES,
+    "curve_quartic": _CURVES,
+    "curve_exponent": _CURVES,
+    "curve_quadratic_linear": _CURVES,
+    "curve_cubic_linear": _CURVES,
+    "curve_biquadratic": _CURVES,
+    "curve_bicubic": _CURVES,
+    "curve_triquadratic": _CURVES,
+    "curve_functional_pressure_drop": _CURVES,
+    "curve_fan_pressure_rise": _CURVES,
+    "curve_rectangular_hyperbola_2": _CURVES,
+    "make_speed_scaled_fan_curve": _CURVES,
+    "derivative": _CURVES,
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
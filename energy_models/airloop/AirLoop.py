@@ -0,0 +1,384 @@
+import inspect
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+def _split(port: str) -> Tuple[str, str]:
+    component, sep, name = port.partition(".")
+    if not sep or not component or not name:
+        raise ValueError(f"Port must be written as 'component.port', got {port!r}")
+    return component, name
+
+
+class AirLoop:
+    def __init__(self) -> None:
+        """
+        Declarative chain of air-side components connected by named ports.
+
+        Components (fans, coils, valves) are added under a name; their inputs
+        are the parameters of compute_batch() (compute() for the valves) and
+        their outputs are the keys of the returned dict. connect() wires an
+        output to an input, e.g. "fan.h_out" → "cooling.h_in". compile()
+        checks the topology once and returns an AirLoopPlan that evaluates
+        whole timeseries one stage at a time.
+        """
+        self._components: Dict[str, Any] = {}
+        self._inputs: Dict[str, List[str]] = {}
+        self._connections: Dict[Tuple[str, str], Tuple[str, str, float]] = {}
+
+    def add(self, name: str, component: Any) -> None:
+        """
+        Register a component.
+
+        Args:
+            name (str): Unique component name used in port references
+            component: Any model with compute_batch() or array-aware compute()
+        """
+        if name in self._components:
+            raise ValueError(f"Duplicate component name: {name}")
+        if "." in name:
+            raise ValueError(f"Component name may not contain '.': {name}")
+        method = getattr(component, "compute_batch", None) or component.compute
+        self._components[name] = component
+        self._inputs[name] = list(inspect.signature(method).parameters)
+
+    def connect(self, source: str, target: str, scale: float = 1.0) -> None:
+        """
+        Feed an output port into an input port.
+
+        Args:
+            source (str): Output port, "component.output_key"
+            target (str): Input port, "component.parameter"
+            scale (float): Factor applied on the way, e.g. for unit conversion
+        """
+        src, key = _split(source)
+        dst, param = _split(target)
+        for name in (src, dst):
+            if name not in self._components:
+                raise ValueError(f"Unknown component: {name}")
+        if param not in self._inputs[dst]:
+            raise ValueError(
+                f"{dst} has no input {param!r}; inputs are {self._inputs[dst]}"
+            )
+        if (dst, param) in self._connections:
+            raise ValueError(f"Input {target} is already connected")
+        self._connections[(dst, param)] = (src, key, scale)
+
+    def compile(
+        self,
+        inputs: Optional[Iterable[str]] = None,
+        outputs: Optional[Iterable[str]] = None,
+    ) -> "AirLoopPlan":
+        """
+        Check the topology and build the execution plan.
+
+        Args:
+            inputs (Iterable[str], optional): Names of the external inputs that
+                run() will receive, "component.parameter" or a bare parameter
+                name shared by every unconnected input of that name. When
+                given, every unconnected input is checked against it now.
+            outputs (Iterable[str], optional): Output ports to return from
+                run(). Defaults to every output of the components that feed
+                nothing downstream.
+
+        Returns:
+            AirLoopPlan: Compiled plan
+
+        Raises:
+            ValueError: On cycles or unbound inputs.
+        """
+        order = self._topological_order()
+        position = {name: i for i, name in enumerate(order)}
+
+        if inputs is not None:
+            available = set(inputs)
+            missing = [
+                f"{name}.{param}"
+                for name in order
+                for param in self._inputs[name]
+                if (name, param) not in self._connections
+                and f"{name}.{param}" not in available
+                and param not in available
+            ]
+            if missing:
+                raise ValueError(f"Unbound inputs: {missing}")
+
+        # Last stage that reads each intermediate, so it can be freed after it
+        last_use: Dict[Tuple[str, str], int] = {}
+        for (dst, _), (src, key, _) in self._connections.items():
+            last_use[(src, key)] = max(last_use.get((src, key), -1), position[dst])
+
+        keep: Optional[Set[Tuple[str, str]]] = None
+        if outputs is not None:
+            keep = {_split(port) for port in outputs}
+            for name, _ in keep:
+                if name not in self._components:
+                    raise ValueError(f"Unknown component: {name}")
+
+        sinks = set(order) - {src for src, _, _ in self._connections.values()}
+        stages = []
+        for name in order:
+            component = self._components[name]
+            method = getattr(component, "compute_batch", None) or component.compute
+            bindings = [
+                (param, self._connections.get((name, param)))
+                for param in self._inputs[name]
+            ]
+            free_after = [
+                port for port, stage in last_use.items() if stage == position[name]
+            ]
+            stages.append((name, method, bindings, free_after))
+        return AirLoopPlan(stages, last_use, keep, sinks)
+
+    def compile_incremental(
+        self,
+        outputs: Optional[Iterable[str]] = None,
+        rtol: float = 0.0,
+        atol: float = 0.0,
+        tolerances: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> "IncrementalPlan":
+        """
+        Build a change-detecting plan for scalar, tick-by-tick evaluation.
+
+        Every component is wrapped in an IncrementalComponent calling its
+        scalar compute(). A component is only looked at when one of its
+        external inputs changed beyond tolerance or an upstream component was
+        recomputed this tick (its "dirty" flag), so unchanged branches of the
+        chain cost nothing.
+
+        Args:
+            outputs (Iterable[str], optional): Output ports to return from
+                step(); defaults to every output of the sink components
+            rtol (float): Relative input tolerance for every component
+            atol (float): Absolute input tolerance for every component
+            tolerances (dict, optional): Per component, absolute tolerance per
+                input replacing atol and rtol, e.g. {"cooling": {"h_in": 50.0}}
+
+        Returns:
+            IncrementalPlan: Compiled plan
+        """
+        from energy_models.incremental.IncrementalComponent import (
+            IncrementalComponent,
+        )
+
+        order = self._topological_order()
+        tolerances = tolerances or {}
+        keep = None if outputs is None else {_split(port) for port in outputs}
+        sinks = set(order) - {src for src, _, _ in self._connections.values()}
+        stages = []
+        for name in order:
+            wrapped = IncrementalComponent(
+                self._components[name], rtol, atol, tolerances.get(name)
+            )
+            bindings = [
+                (param, self._connections.get((name, param)))
+                for param in wrapped.inputs
+            ]
+            stages.append((name, wrapped, bindings))
+        return IncrementalPlan(stages, keep, sinks)
+
+    def _topological_order(self) -> List[str]:
+        # Kahn's algorithm, keeping insertion order among ready components
+        upstream: Dict[str, Set[str]] = {name: set() for name in self._components}
+        for (dst, _), (src, _, _) in self._connections.items():
+            upstream[dst].add(src)
+        order: List[str] = []
+        ready = [name for name in self._components if not upstream[name]]
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for other in self._components:
+                if name in upstream[other]:
+                    upstream[other].discard(name)
+                    if (
+                        not upstream[other]
+                        and other not in order
+                        and other not in ready
+                    ):
+                        ready.append(other)
+        if len(order) != len(self._components):
+            cycle = [name for name in self._components if name not in order]
+            raise ValueError(f"Air loop contains a cycle through: {cycle}")
+        return order
+
+
+class AirLoopPlan:
+    def __init__(
+        self,
+        stages: List[Tuple[str, Any, List[Tuple[str, Any]], List[Tuple[str, str]]]],
+        last_use: Dict[Tuple[str, str], int],
+        keep: Optional[Set[Tuple[str, str]]],
+        sinks: Set[str],
+    ):
+        """
+        Compiled execution plan of an AirLoop; build it with AirLoop.compile().
+
+        Args:
+            stages: (component name, batch method, input bindings, ports freed
+                after the stage) in execution order
+            last_use: Intermediate port → index of the last stage reading it
+            keep: Output ports returned by run(), or None for every sink output
+            sinks: Components that feed nothing downstream
+        """
+        self.stages = stages
+        self._last_use = last_use
+        self._keep = keep
+        self._sinks = sinks
+
+    @property
+    def order(self) -> List[str]:
+        """Component names in execution order."""
+        return [name for name, _, _, _ in self.stages]
+
+    def run(self, inputs: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every stage on whole input arrays.
+
+        Intermediate arrays are held only until their last consumer has run.
+
+        Args:
+            inputs (dict): External inputs keyed "component.parameter" or by a
+                bare parameter name shared across components
+
+        Returns:
+            dict: Requested outputs keyed "component.output_key"
+
+        Raises:
+            ValueError: If an input is missing or a connected output does not
+                exist on its component.
+        """
+        buffers: Dict[Tuple[str, str], Any] = {}
+        results: Dict[str, np.ndarray] = {}
+
+        for name, method, bindings, free_after in self.stages:
+            kwargs = {}
+            for param, source in bindings:
+                if source is not None:
+                    src, key, scale = source
+                    value = buffers[(src, key)]
+                    kwargs[param] = value if scale == 1.0 else value * scale
+                elif f"{name}.{param}" in inputs:
+                    kwargs[param] = inputs[f"{name}.{param}"]
+                elif param in inputs:
+                    kwargs[param] = inputs[param]
+                else:
+                    raise ValueError(f"Missing input: {name}.{param}")
+
+            out = method(**kwargs)
+            del kwargs
+
+            for key, value in out.items():
+                port = (name, key)
+                if port in self._last_use:
+                    buffers[port] = value
+                if self._keep is None:
+                    if name in self._sinks:
+                        results[f"{name}.{key}"] = value
+                elif port in self._keep:
+                    results[f"{name}.{key}"] = value
+
+            expected = [key for src, key in self._last_use if src == name]
+            if self._keep is not None:
+                expected += [key for src, key in self._keep if src == name]
+            for key in expected:
+                if key not in out:
+                    raise ValueError(f"{name} has no output {key!r}")
+            del out
+
+            for port in free_after:
+                del buffers[port]
+
+        return results
+
+
+class IncrementalPlan:
+    def __init__(
+        self,
+        stages: List[Tuple[str, Any, List[Tuple[str, Any]]]],
+        keep: Optional[Set[Tuple[str, str]]],
+        sinks: Set[str],
+    ):
+        """
+        Change-detecting AirLoop plan; build it with AirLoop.compile_incremental().
+
+        Args:
+            stages: (component name, IncrementalComponent, input bindings) in
+                execution order
+            keep: Output ports returned by step(), or None for every sink output
+            sinks: Components that feed nothing downstream
+        """
+        self.stages = stages
+        self._keep = keep
+        self._sinks = sinks
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._external: Dict[str, Dict[str, Any]] = {}
+        self.recomputed: List[str] = []
+
+    @property
+    def components(self) -> Dict[str, Any]:
+        """IncrementalComponent wrappers by name, e.g. for hit statistics."""
+        return {name: wrapped for name, wrapped, _ in self.stages}
+
+    def step(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate one tick, recomputing only what changed.
+
+        Args:
+            inputs (dict): External inputs keyed "component.parameter" or by a
+                bare parameter name shared across components
+
+        Returns:
+            dict: Requested outputs keyed "component.output_key"; the names of
+            the components recomputed this tick are in `recomputed`
+
+        Raises:
+            ValueError: If an input is missing or a connected output does not
+                exist on its component.
+        """
+        dirty: Set[str] = set()
+        self.recomputed = []
+        results: Dict[str, Any] = {}
+
+        for name, wrapped, bindings in self.stages:
+            external = {}
+            upstream_dirty = False
+            for param, source in bindings:
+                if source is not None:
+                    upstream_dirty |= source[0] in dirty
+                elif f"{name}.{param}" in inputs:
+                    external[param] = inputs[f"{name}.{param}"]
+                elif param in inputs:
+                    external[param] = inputs[param]
+                else:
+                    raise ValueError(f"Missing input: {name}.{param}")
+
+            if (
+                upstream_dirty
+                or name not in self._results
+                or external != self._external.get(name)
+            ):
+                kwargs = dict(external)
+                for param, source in bindings:
+                    if source is not None:
+                        src, key, scale = source
+                        try:
+                            value = self._results[src][key]
+                        except KeyError:
+                            raise ValueError(f"{src} has no output {key!r}") from None
+                        kwargs[param] = value if scale == 1.0 else value * scale
+                self._results[name] = wrapped.compute(**kwargs)
+                self._external[name] = external
+                if wrapped.changed:
+                    dirty.add(name)
+                    self.recomputed.append(name)
+
+            out = self._results[name]
+            for key, value in out.items():
+                if self._keep is None:
+                    if name in self._sinks:
+                        results[f"{name}.{key}"] = value
+                elif (name, key) in self._keep:
+                    results[f"{name}.{key}"] = value
+
+        return results
@@ -0,0 +1,307 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# -------------------------------
+# 🔹 Batch Evaluation Helpers
+# -------------------------------
+#
+# Shared by the compute_batch() methods of the fan and coil models. Inputs are
+# broadcast to float arrays, injected callables (curves, schedules, loss
+# functions) are called on whole arrays when they support it and element by
+# element otherwise, and divisions by a zero mass flow fall back to the inlet
+# state exactly as the scalar compute() methods do.
+#
+# Inputs are cast to the working precision, float64 unless a precision()
+# block selects float32; NumPy keeps float32 through arithmetic with Python
+# float parameters, so the whole computation runs at that precision.
+
+_precision: ContextVar = ContextVar("precision", default=np.dtype(np.float64))
+
+
+@contextmanager
+def precision(dtype: Any) -> Iterator[None]:
+    """
+    Run compute_batch() calls inside the block at the given precision.
+
+    Args:
+        dtype: np.float32 or np.float64
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"precision must be float32 or float64, got {dtype}")
+    token = _precision.set(dtype)
+    try:
+        yield
+    finally:
+        _precision.reset(token)
+
+
+def run_batch(
+    method: Callable[..., Dict[str, Any]],
+    inputs: Dict[str, Any],
+    dtype: Any = np.float64,
+    outputs: Optional[Sequence[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Call a batch compute path at a chosen precision, keeping selected outputs.
+
+    Args:
+        method (Callable): compute_batch() of a component or fleet
+        inputs (dict): Keyword arguments of method
+        dtype: np.float32 or np.float64
+        outputs (Sequence[str], optional): Result keys to keep (default all);
+            the others are released as soon as the call returns
+
+    Returns:
+        Dict[str, np.ndarray]: Result of method
+    """
+    with precision(dtype):
+        result = method(**inputs)
+    if outputs is not None:
+        result = {key: result[key] for key in outputs}
+    return result
+
+
+def compute_by_day(component: Any, t: Any, *args: Any) -> Dict[str, np.ndarray]:
+    """
+    compute_batch() evaluated once per distinct day type and time of day.
+
+    Applies to components that list their schedule callables in
+    `schedule_attributes` (zone exhaust and night ventilation fans, electric
+    and steam heating coils). When every one of those is built from a
+    Scheduler (make_flow_fraction_schedule(), make_availability_schedule())
+    or left at its constructor default, and the other inputs are constant,
+    each day's results depend only on the day types of the schedules. One
+    representative day per day type is computed and the results are
+    expanded over the calendar by indexing: a year of a weekday/weekend/
+    holiday Scheduler costs 3 days of evaluations instead of 365.
+
+    Any other component or input falls back to a plain compute_batch().
+
+    Args:
+        component: Component with compute_batch(t, ...)
+        t (np.ndarray): Time in hours; use Scheduler(start_date=...) so that
+            t runs across calendar days
+        *args: Remaining compute_batch() arguments, e.g. h_in
+
+    Returns:
+        Dict[str, np.ndarray]: Same as component.compute_batch(t, *args)
+    """
+    t, *arrays = as_arrays(t, *args, exact=(0,))
+    days = _day_keys(component, t)
+    if days is None or not all(a.size == 0 or (a == a.flat[0]).all() for a in arrays):
+        plain: Dict[str, np.ndarray] = component.compute_batch(t, *arrays)
+        return plain
+
+    # Timesteps sharing a day key and a time of day share their result
+    times, time_index = np.unique(np.mod(t, 24.0), return_inverse=True)
+    keys = days.astype(np.int64) * times.size + time_index.reshape(t.shape)
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    flat = t.reshape(-1)
+    result = component.compute_batch(
+        flat[first], *(a.reshape(-1)[first] for a in arrays)
+    )
+    return {key: value[inverse].reshape(t.shape) for key, value in result.items()}
+
+
+def _day_keys(component: Any, t: np.ndarray) -> Optional[np.ndarray]:
+    # Day types of every distinct Scheduler combined into one integer per
+    # timestep, or None if some schedule input is not Scheduler-based
+    import inspect
+
+    names = getattr(component, "schedule_attributes", None)
+    if names is None or t.size == 0:
+        return None
+    defaults = inspect.signature(type(component)).parameters
+    schedulers = {}
+    for name in names:
+        func = getattr(component, name)
+        scheduler = getattr(func, "scheduler", None)
+        if scheduler is not None:
+            schedulers[id(scheduler)] = scheduler
+        elif name not in defaults or func is not defaults[name].default:
+            return None
+    keys = np.zeros(t.shape, dtype=np.int64)
+    for scheduler in schedulers.values():
+        keys = keys * 3 + scheduler.day_types(t)
+    return keys
+
+
+def as_arrays(*values: Any, exact: Sequence[int] = ()) -> Tuple[np.ndarray, ...]:
+    """
+    Broadcast inputs together as float arrays of the working precision.
+
+    Args:
+        *values: Scalars or array-likes
+        exact (Sequence[int]): Positions kept in float64 at any precision,
+            for timestamps: schedules floor t to whole minutes, and float32
+            rounding would move samples across step edges
+
+    Returns:
+        Tuple[np.ndarray, ...]: Arrays of one common shape
+    """
+    dtype = _precision.get()
+    return tuple(
+        np.broadcast_arrays(
+            *(
+                np.asarray(v, dtype=np.float64 if i in exact else dtype)
+                for i, v in enumerate(values)
+            )
+        )
+    )
+
+
+def evaluate(func: Callable[..., Any], *args: np.ndarray) -> np.ndarray:
+    """
+    Call func on whole arrays, falling back to element-wise calls.
+
+    Curve lambdas from curves.py accept arrays directly. Callables with
+    scalar-only logic (e.g. `if t < 6`) raise on arrays and are applied
+    element by element instead. Constant results (e.g. `lambda t: 1.0`) are
+    broadcast to the input shape.
+
+    Args:
+        func (Callable): Scalar callable, possibly array-aware
+        *args (np.ndarray): Arrays of one common shape
+
+    Returns:
+        np.ndarray: func(*args) with the shape of the inputs
+    """
+    shape = np.shape(args[0]) if args else ()
+    try:
+        result = _working(np.asarray(func(*args)))
+        if result.shape == shape:
+            return result
+        return np.broadcast_to(result, shape).copy()
+    except (TypeError, ValueError):
+        pass
+    flat = [np.ravel(a) for a in args]
+    values = [func(*(float(a[i]) for a in flat)) for i in range(flat[0].size)]
+    return _working(np.asarray(values).reshape(shape))
+
+
+def derivative_batch(func: Callable[..., Any], *args: np.ndarray) -> Tuple:
+    """
+    Partial derivatives of func on whole arrays (see curves.derivative()).
+
+    Uses the analytic derivative of curves from curves.py and central
+    differences through evaluate() for any other callable, so scalar-only
+    callables are differentiated element by element.
+
+    Args:
+        func (Callable): Scalar callable, possibly array-aware
+        *args (np.ndarray): Arrays of one common shape
+
+    Returns:
+        Tuple[np.ndarray, ...]: One partial derivative per argument, each
+        with the shape of the inputs
+    """
+    from energy_models.curves.curves import derivative
+
+    shape = np.shape(args[0]) if args else ()
+    if hasattr(func, "derivative"):
+        partials = derivative(func, *args)
+        partials = partials if isinstance(partials, tuple) else (partials,)
+        return tuple(
+            _working(np.broadcast_to(np.asarray(p, dtype=float), shape).copy())
+            for p in partials
+        )
+    dtype = _precision.get()
+    args = tuple(np.asarray(a, dtype=np.float64) for a in args)
+    partials = []
+    # Differences are taken in float64; a float32 step would be rounding noise
+    with precision(np.float64):
+        for i, x in enumerate(args):
+            h = 1e-6 * (np.abs(x) + 1.0)
+            up = evaluate(func, *args[:i], x + h, *args[i + 1 :])
+            down = evaluate(func, *args[:i], x - h, *args[i + 1 :])
+            partials.append(((up - down) / (2 * h)).astype(dtype, copy=False))
+    return tuple(partials)
+
+
+def _working(result: np.ndarray) -> np.ndarray:
+    # Float results of injected callables follow the working precision
+    if result.dtype.kind == "f":
+        return result.astype(_precision.get(), copy=False)
+    return result
+
+
+def divide_or_zero(
+    numerator: Union[float, np.ndarray], denominator: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    numerator / denominator where denominator > 0, else 0.
+
+    Mirrors the scalar pattern `h_in + Q / m_dot if m_dot > 0 else h_in`.
+    """
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    out = np.zeros(numerator.shape, dtype=np.result_type(numerator, np.float32))
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def solve_bracketed(
+    func: Callable[[np.ndarray], np.ndarray],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    xtol: float = 2e-12,
+    rtol: float = 8.9e-16,
+    maxiter: int = 100,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Element-wise root of func inside [lo, hi] for a whole array at once.
+
+    Uses the Illinois variant of regula falsi, falling back to bisection
+    when the interpolated point leaves the bracket. Each iteration makes one
+    vectorized call to func; converged elements are frozen.
+
+    Args:
+        func (Callable): Residual of an array of candidates, same shape out
+        lo (np.ndarray): Lower bracket
+        hi (np.ndarray): Upper bracket
+        xtol (float): Absolute tolerance on the root
+        rtol (float): Relative tolerance on the root
+        maxiter (int): Maximum iterations
+
+    Returns:
+        Tuple: (root, converged mask, iterations used)
+
+    Raises:
+        ValueError: If func does not change sign over a bracket.
+    """
+    a, b = np.broadcast_arrays(np.asarray(lo, dtype=float), np.asarray(hi, dtype=float))
+    a, b = a.copy(), b.copy()
+    fa, fb = func(a), func(b)
+    if np.any(fa * fb > 0):
+        raise ValueError("f(a) and f(b) must have different signs")
+
+    x = np.where(fa == 0, a, np.where(fb == 0, b, 0.5 * (a + b)))
+    done = (fa == 0) | (fb == 0)
+    side = np.zeros(a.shape, dtype=np.int8)
+    for iteration in range(1, maxiter + 1):
+        if done.all():
+            return x, done, iteration - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = (a * fb - b * fa) / (fb - fa)
+        outside = ~np.isfinite(c) | (c <= np.minimum(a, b)) | (c >= np.maximum(a, b))
+        c = np.where(outside, 0.5 * (a + b), c)
+        fc = func(c)
+
+        active = ~done
+        move_b = active & (fc * fb > 0)
+        move_a = active & ~move_b
+        # Illinois: halve the stale end when the same end moves twice in a row
+        fa = np.where(move_b & (side == 1), 0.5 * fa, fa)
+        fb = np.where(move_a & (side == -1), 0.5 * fb, fb)
+        b, fb = np.where(move_b, c, b), np.where(move_b, fc, fb)
+        a, fa = np.where(move_a, c, a), np.where(move_a, fc, fa)
+        side = np.where(move_b, 1, np.where(move_a, -1, side)).astype(np.int8)
+
+        tol = xtol + rtol * np.abs(c)
+        step = np.abs(c - x)
+        x = np.where(active, c, x)
+        done |= active & ((fc == 0) | (step <= tol) | (np.abs(b - a) <= tol))
+    return x, done, maxiter
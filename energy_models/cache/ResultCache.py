@@ -0,0 +1,306 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import types
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+import energy_models
+from energy_models.timeseries.readers import load_results
+
+# Bumped whenever the entry layout or the fingerprint encoding changes, so
+# stale entries are never read
+_CACHE_VERSION = 3
+
+_META = "meta.json"
+
+
+class ResultCache:
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 2**30):
+        """
+        Content-addressed on-disk cache of compute results.
+
+        An entry is keyed by a fingerprint of the component (every parameter,
+        including the coefficients and code of curve and schedule callables),
+        the method name, the inputs and the package version, so any change
+        to one of them is a different entry: nothing is invalidated by hand.
+        Each output is stored as one .npy file and returned memory-mapped,
+        so a hit costs hashing the inputs and opening the files; nested
+        result dicts (e.g. the flows per branch of HydronicNetwork.solve())
+        become sub-directories. When the
+        cache grows over max_bytes, the least recently used entries are
+        deleted.
+
+        Args:
+            cache_dir (str, optional): Cache directory; default
+                ~/.cache/energy_models/results
+            max_bytes (int): Size limit of all entries together
+        """
+        self.cache_dir = (
+            os.path.join(os.path.expanduser("~"), ".cache", "energy_models", "results")
+            if cache_dir is None
+            else cache_dir
+        )
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def compute(
+        self, component: Any, *args: Any, method: str = "compute_batch", **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Cached call of component.<method>(*args, **kwargs).
+
+        Args:
+            component: Any model or fleet
+            *args: Positional arguments of the method
+            method (str): Method to call, e.g. "compute_batch" or "compute"
+            **kwargs: Keyword arguments of the method
+
+        Returns:
+            Dict[str, Any]: The method's result; on a hit, arrays are
+            read-only memory maps of the cached files
+        """
+        func = getattr(component, method)
+        inputs = inspect.signature(func).bind(*args, **kwargs).arguments
+        key = fingerprint(
+            (_CACHE_VERSION, energy_models.__version__, component, method, inputs)
+        )
+        entry = os.path.join(self.cache_dir, key)
+        result = self._read(entry)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        computed: Dict[str, Any] = func(**inputs)
+        self._store(entry, computed)
+        return computed
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    # ---- 🔹 Storage ----
+
+    def _read(self, entry: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(entry, _META)) as f:
+                scalars = set(json.load(f)["scalars"])
+            result = _load(entry, scalars)
+        except (OSError, ValueError, KeyError):
+            # Missing, partial or unreadable entry: compute again
+            return None
+        # Recently used: eviction goes by modification time
+        os.utime(entry)
+        return result
+
+    def _store(self, entry: str, result: Dict[str, Any]) -> None:
+        # Written to a private directory, then renamed into place, so
+        # concurrent readers never see a partial entry
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        try:
+            scalars = _save(tmp, result)
+            with open(os.path.join(tmp, _META), "w") as f:
+                json.dump({"scalars": scalars}, f)
+            os.rename(tmp, entry)
+        except OSError:
+            # Stored by another process meanwhile, or not writable
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self._evict(keep=entry)
+
+    def _evict(self, keep: str) -> None:
+        # Least recently used entries first, until the cache fits
+        entries = [stat for stat in map(_stat, self._entries()) if stat]
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry != keep:
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+
+    def _entries(self) -> List[str]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if not name.endswith(".tmp")
+        ]
+
+
+# -------------------------------
+# 🔹 Fingerprints
+# -------------------------------
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Stable content hash of a component, its parameters or its inputs.
+
+    Arrays are hashed by dtype, shape and bytes. Functions, including the
+    lambdas returned by the curves.py factories and the Scheduler factories,
+    are hashed by their code, defaults, closure values (e.g. curve
+    coefficients), attributes and the module globals their code reads,
+    recursively for global helper functions; modules by name. Other objects
+    are hashed by class and the state they would pickle.
+
+    Args:
+        value: Anything built from numbers, strings, arrays, containers,
+            functions and picklable objects
+
+    Returns:
+        str: 32-character hex digest, equal across processes and sessions
+
+    Raises:
+        ValueError: If some part of value has no stable state.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, value, {})
+    return digest.hexdigest()
+
+
+def _feed(digest: Any, value: Any, seen: Dict[int, Any]) -> None:
+    # Every value is written as a type tag followed by its content, so that
+    # e.g. 1, 1.0, "1" and (1,) all hash differently
+    def tag(text: str) -> None:
+        digest.update(f"{text}\x00".encode())
+
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        tag(f"{type(value).__name__}:{value!r}")
+        return
+    if isinstance(value, bytes):
+        tag(f"bytes:{len(value)}")
+        digest.update(value)
+        return
+    if isinstance(value, (np.ndarray, np.generic)):
+        array = np.asarray(value)
+        array = array if array.flags.c_contiguous else array.copy()
+        tag(f"ndarray:{array.dtype.str}:{array.shape}")
+        if array.dtype.hasobject:
+            _feed(digest, array.tolist(), seen)
+        else:
+            digest.update(array.reshape(-1).view(np.uint8).data)
+        return
+    if isinstance(value, (type, types.BuiltinFunctionType, np.ufunc)):
+        name = getattr(value, "__qualname__", value.__name__)
+        tag(f"global:{getattr(value, '__module__', '')}.{name}")
+        return
+
+    # Containers and objects may be shared or cyclic (e.g. a schedule
+    # function and its Scheduler); repeats are written as back-references
+    if id(value) in seen:
+        tag(f"ref:{seen[id(value)][0]}")
+        return
+    seen[id(value)] = (len(seen), value)
+
+    if isinstance(value, (list, tuple)):
+        tag(f"{type(value).__name__}:{len(value)}")
+        for item in value:
+            _feed(digest, item, seen)
+    elif isinstance(value, dict):
+        tag(f"dict:{len(value)}")
+        for key in sorted(value, key=repr):
+            _feed(digest, key, seen)
+            _feed(digest, value[key], seen)
+    elif isinstance(value, (set, frozenset)):
+        tag(f"set:{len(value)}")
+        for item in sorted(value, key=repr):
+            _feed(digest, item, seen)
+    elif isinstance(value, types.FunctionType):
+        tag(f"function:{value.__module__}.{value.__qualname__}")
+        closure = [cell.cell_contents for cell in value.__closure__ or ()]
+        _feed(digest, value.__code__, seen)
+        _feed(digest, (value.__defaults__, value.__kwdefaults__, closure), seen)
+        _feed(digest, value.__dict__, seen)
+        # Module globals the code reads, e.g. a constant or a helper function
+        # (which is hashed the same way, its own globals included)
+        _feed(digest, _globals(value), seen)
+    elif isinstance(value, types.ModuleType):
+        tag(f"module:{value.__name__}")
+    elif isinstance(value, types.CodeType):
+        tag(f"code:{value.co_name}")
+        _feed(digest, (value.co_code, value.co_consts, value.co_names), seen)
+    elif isinstance(value, types.MethodType):
+        tag("method")
+        _feed(digest, (value.__func__, value.__self__), seen)
+    else:
+        _feed_object(digest, value, seen, tag)
+
+
+def _feed_object(
+    digest: Any, value: Any, seen: Dict[int, Any], tag: Callable[[str], None]
+) -> None:
+    # Class plus the state pickle would record (__getstate__ included)
+    try:
+        reduced = value.__reduce_ex__(4)
+    except Exception as exc:
+        raise ValueError(
+            f"Cannot fingerprint {type(value).__qualname__} object: {exc}"
+        ) from exc
+    tag(f"object:{type(value).__module__}.{type(value).__qualname__}")
+    if isinstance(reduced, str):
+        tag(reduced)
+    else:
+        _feed(digest, reduced[1:], seen)
+
+
+# ---- 🔹 Helpers ----
+
+
+def _globals(func: types.FunctionType) -> Dict[str, Any]:
+    # Global names read by func's code and by the code of nested functions,
+    # comprehensions and lambdas; builtins are not in __globals__
+    names: Set[str] = set()
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes += [c for c in code.co_consts if isinstance(c, types.CodeType)]
+    return {name: func.__globals__[name] for name in names if name in func.__globals__}
+
+
+def _save(directory: str, result: Dict[str, Any], prefix: str = "") -> List[str]:
+    # One .npy file per output and one sub-directory per nested dict;
+    # returns the paths of the outputs that were not arrays
+    scalars = []
+    for key, value in result.items():
+        if isinstance(value, dict):
+            os.makedirs(os.path.join(directory, key), exist_ok=True)
+            scalars += _save(os.path.join(directory, key), value, f"{prefix}{key}/")
+            continue
+        np.save(os.path.join(directory, f"{key}.npy"), np.asarray(value))
+        if not isinstance(value, np.ndarray):
+            scalars.append(f"{prefix}{key}")
+    return scalars
+
+
+def _load(directory: str, scalars: set, prefix: str = "") -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        key: value.item() if f"{prefix}{key}" in scalars else value
+        for key, value in load_results(directory).items()
+    }
+    for e in sorted(os.scandir(directory), key=lambda e: e.name):
+        if e.is_dir():
+            result[e.name] = _load(e.path, scalars, f"{prefix}{e.name}/")
+    return result
+
+
+def _size(directory: str) -> int:
+    return sum(
+        _size(e.path) if e.is_dir() else e.stat().st_size for e in os.scandir(directory)
+    )
+
+
+def _stat(entry: str) -> Optional[Tuple[float, int, str]]:
+    # (last use, size, path), or None if another process just removed it
+    try:
+        return os.path.getmtime(entry), _size(entry), entry
+    except OSError:
+        return None
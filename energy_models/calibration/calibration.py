@@ -0,0 +1,310 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# -------------------------------
+# 🔹 Calibration Against Trend Data
+# -------------------------------
+#
+# Parameters are fitted by evaluating the batch compute path on whole trend
+# arrays. Many parameters enter an output linearly (Q_rated, the pressure
+# coefficients, f_motor_to_air) or through their reciprocal (efficiencies),
+# so the model itself provides the columns of a least-squares problem that
+# is solved in closed form. Fleet classes with a (units × timesteps) trend
+# calibrate every unit at once.
+
+# Parameters an output is linear in through 1/p, e.g. W_electric ∝ 1/eta_fan
+_RECIPROCAL = ("eta_fan", "eta_motor", "eta", "eta_total")
+
+_Slot = Tuple[str, Optional[int]]
+
+
+def goodness_of_fit(
+    measured: np.ndarray, predicted: np.ndarray, n_params: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Fit statistics along the last axis, ignoring NaN samples.
+
+    CV(RMSE) and NMBE follow ASHRAE Guideline 14, with n - p degrees of
+    freedom.
+
+    Args:
+        measured (np.ndarray): Measured trend, (T,) or (N, T)
+        predicted (np.ndarray): Model output of the same shape
+        n_params (int): Number of fitted parameters p
+
+    Returns:
+        dict: "r2", "rmse", "cv_rmse", "nmbe" and sample count "n", one
+        value per unit
+    """
+    measured, predicted = np.broadcast_arrays(
+        np.asarray(measured, dtype=float), np.asarray(predicted, dtype=float)
+    )
+    mask = np.isfinite(measured) & np.isfinite(predicted)
+    n = mask.sum(axis=-1)
+    residual = np.where(mask, measured - predicted, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(mask, measured, 0.0).sum(axis=-1) / n
+        ss_res = (residual**2).sum(axis=-1)
+        ss_tot = (np.where(mask, measured - mean[..., None], 0.0) ** 2).sum(axis=-1)
+        dof = np.maximum(n - n_params, 1)
+        return {
+            "r2": 1.0 - ss_res / ss_tot,
+            "rmse": np.sqrt(ss_res / n),
+            "cv_rmse": np.sqrt(ss_res / dof) / mean,
+            "nmbe": residual.sum(axis=-1) / (dof * mean),
+            "n": n,
+        }
+
+
+def least_squares(y: np.ndarray, X: np.ndarray) -> np.ndarray:
+    """
+    Closed-form least squares for a stack of independent problems.
+
+    Solves the normal equations of y ≈ X·c for every leading index at once;
+    samples with a NaN in y or X are left out, and rank-deficient problems
+    (a parameter the trend never excites) get the minimum-norm solution.
+
+    Args:
+        y (np.ndarray): Targets, (..., T)
+        X (np.ndarray): Regressors, (..., T, K)
+
+    Returns:
+        np.ndarray: Coefficients, (..., K)
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mask = np.isfinite(y) & np.isfinite(X).all(axis=-1)
+    X = np.where(mask[..., None], X, 0.0)
+    y = np.where(mask, y, 0.0)
+    A = np.einsum("...tk,...tj->...kj", X, X)
+    b = np.einsum("...tk,...t->...k", X, y)
+    c: np.ndarray = (np.linalg.pinv(A) @ b[..., None])[..., 0]
+    return c
+
+
+def fit_linear(
+    component: type,
+    base: Dict[str, Any],
+    params: Sequence[str],
+    inputs: Dict[str, Any],
+    output: str,
+    measured: np.ndarray,
+    rtol: float = 1e-6,
+) -> Dict[str, Any]:
+    """
+    Fit parameters an output depends on linearly, in closed form.
+
+    The model is evaluated once at zero and once per parameter (K + 1 batch
+    evaluations over the whole trend), which gives the exact columns of
+    output = a + X·u with u = p, or u = 1/p for efficiencies. One more
+    evaluation checks that the output really is affine in u.
+
+    Typical targets: W_electric for eta_fan or eta_motor (only their product
+    is identifiable from W_electric alone), DeltaP_total for
+    "pressure_coeffs" (all six), Q_total for Q_rated, h_out or Q_to_air for
+    f_motor_to_air.
+
+    Args:
+        component (type): Component or fleet class, e.g. ComponentFan or
+            ComponentFanFleet for per-unit results
+        base (dict): Constructor arguments; fitted ones are replaced
+        params (Sequence[str]): Parameters to fit jointly
+        inputs (dict): compute_batch() arguments covering the trend
+        output (str): Result key compared with measured
+        measured (np.ndarray): Trend, (T,) or (N, T) for N units; NaN marks
+            missing samples
+        rtol (float): Tolerance of the linearity check
+
+    Returns:
+        dict: "params" (name → value, or (N,) per unit; pressure_coeffs as
+        (..., 6)), "fit" (see goodness_of_fit()) and "predicted"
+
+    Raises:
+        ValueError: If output is not affine in the parameters.
+    """
+    slots = _slots(params, base)
+    ref = np.array([_reference(base, slot) for slot in slots])
+    K = len(slots)
+
+    y0 = _output(component, base, slots, np.zeros(K), inputs, output)
+    columns = [
+        _output(component, base, slots, ref * np.eye(K)[k], inputs, output) - y0
+        for k in range(K)
+    ]
+    X = np.stack(np.broadcast_arrays(*columns), axis=-1) if K else y0[..., None]
+
+    # Affine in u ⇔ the output at another point matches the prediction
+    probe = np.linspace(0.5, 1.5, K)
+    expected = y0 + X @ probe
+    actual = _output(component, base, slots, ref * probe, inputs, output)
+    scale = np.nanmax(np.abs(expected)) if np.size(expected) else 0.0
+    if not np.allclose(actual, expected, rtol=rtol, atol=rtol * scale, equal_nan=True):
+        raise ValueError(
+            f"{output!r} is not linear in {list(params)}; use calibrate() instead."
+        )
+
+    measured = np.asarray(measured, dtype=float)
+    y0, X = np.broadcast_to(y0, measured.shape), np.broadcast_to(
+        X, measured.shape + (K,)
+    )
+    coef = least_squares(measured - y0, X)
+    predicted = y0 + np.einsum("...tk,...k->...t", X, coef)
+    u = coef * ref
+
+    values: Dict[str, Any] = {}
+    for k, (name, index) in enumerate(slots):
+        value = _from_linear(name, u[..., k])
+        if index is None:
+            values[name] = value
+        else:
+            values.setdefault(name, []).append(value)
+    if "pressure_coeffs" in values:
+        values["pressure_coeffs"] = np.stack(values["pressure_coeffs"], axis=-1)
+    return {
+        "params": values,
+        "fit": goodness_of_fit(measured, predicted, K),
+        "predicted": predicted,
+    }
+
+
+def calibrate(
+    component: type,
+    base: Dict[str, Any],
+    params: Sequence[str],
+    inputs: Dict[str, Any],
+    output: str,
+    measured: np.ndarray,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    **options: Any,
+) -> Dict[str, Any]:
+    """
+    Fit any scalar parameters by nonlinear least squares on the batch path.
+
+    Every residual evaluation is one compute_batch() call over the whole
+    trend. With a fleet class and an (N, T) trend, all units are fitted in
+    one problem whose Jacobian is block diagonal; the solver is told the
+    sparsity, so a finite-difference Jacobian costs K fleet evaluations
+    regardless of N.
+
+    Args:
+        component (type): Component or fleet class
+        base (dict): Constructor arguments, also the starting point
+        params (Sequence[str]): Scalar constructor parameters to fit
+        inputs (dict): compute_batch() arguments covering the trend
+        output (str): Result key compared with measured
+        measured (np.ndarray): Trend, (T,) or (N, T) for N units
+        bounds (dict, optional): Parameter → (lower, upper)
+        **options: Passed to scipy.optimize.least_squares()
+
+    Returns:
+        dict: "params" (name → value, or (N,) per unit), "fit",
+        "predicted", "success" and "nfev"
+    """
+    from scipy import sparse
+    from scipy.optimize import least_squares as solve
+
+    if "pressure_coeffs" in params:
+        raise ValueError("Fit pressure_coeffs with fit_linear().")
+    measured = np.asarray(measured, dtype=float)
+    n_units = measured.shape[0] if measured.ndim == 2 else 1
+    K = len(params)
+    mask = np.isfinite(measured)
+
+    x0 = np.stack(
+        [np.broadcast_to(np.asarray(base[p], float), (n_units,)) for p in params],
+        axis=-1,
+    ).ravel()
+    bounds = bounds or {}
+    lower = np.tile([bounds.get(p, (-np.inf, np.inf))[0] for p in params], n_units)
+    upper = np.tile([bounds.get(p, (-np.inf, np.inf))[1] for p in params], n_units)
+
+    def predict(x: np.ndarray) -> np.ndarray:
+        x = x.reshape(n_units, K)
+        values = {
+            p: (x[:, k] if measured.ndim == 2 else float(x[0, k]))
+            for k, p in enumerate(params)
+        }
+        model = component(**{**base, **values})
+        result = model.compute_batch(**inputs)[output]
+        return np.broadcast_to(np.asarray(result, dtype=float), measured.shape)
+
+    def residual(x: np.ndarray) -> np.ndarray:
+        return np.where(mask, predict(x) - measured, 0.0).ravel()
+
+    if measured.ndim == 2:
+        block = np.ones((measured.shape[1], K))
+        options.setdefault("jac_sparsity", sparse.block_diag([block] * n_units))
+    options.setdefault("x_scale", "jac")
+    sol = solve(residual, x0, bounds=(lower, upper), **options)
+
+    x = sol.x.reshape(n_units, K)
+    predicted = predict(sol.x)
+    return {
+        "params": {
+            p: (x[:, k] if measured.ndim == 2 else float(x[0, k]))
+            for k, p in enumerate(params)
+        },
+        "fit": goodness_of_fit(measured, predicted, K),
+        "predicted": predicted,
+        "success": sol.success,
+        "nfev": sol.nfev,
+    }
+
+
+# ---- 🔹 Helpers ----
+
+
+def _slots(params: Sequence[str], base: Dict[str, Any]) -> List[_Slot]:
+    # One slot per scalar coefficient; pressure_coeffs expands to C1-C6
+    slots: List[_Slot] = []
+    for name in params:
+        if name == "pressure_coeffs":
+            slots.extend((name, i) for i in range(len(base[name])))
+        else:
+            slots.append((name, None))
+    return slots
+
+
+def _reference(base: Dict[str, Any], slot: _Slot) -> float:
+    # Scale of each column: the base value in the linear coordinate, or 1
+    name, index = slot
+    value = base.get(name, 1.0) if index is None else base[name][index]
+    value = float(np.mean(_to_linear(name, value)))
+    return value if np.isfinite(value) and value != 0.0 else 1.0
+
+
+def _to_linear(name: str, value: Any) -> Any:
+    if name in _RECIPROCAL:
+        return 1.0 / np.asarray(value, dtype=float)
+    return value
+
+
+def _from_linear(name: str, u: Any) -> Any:
+    if name in _RECIPROCAL:
+        with np.errstate(divide="ignore"):
+            u = 1.0 / u
+    return float(u) if np.ndim(u) == 0 else u
+
+
+def _output(
+    component: type,
+    base: Dict[str, Any],
+    slots: List[_Slot],
+    u: np.ndarray,
+    inputs: Dict[str, Any],
+    output: str,
+) -> np.ndarray:
+    kwargs = dict(base)
+    coeffs = list(base.get("pressure_coeffs", ()))
+    for (name, index), value in zip(slots, u):
+        if name in _RECIPROCAL:
+            value = 1.0 / value if value != 0.0 else float("inf")
+        if index is None:
+            kwargs[name] = float(value)
+        else:
+            coeffs[index] = float(value)
+    if any(index is not None for _, index in slots):
+        kwargs["pressure_coeffs"] = tuple(coeffs)
+    result = component(**kwargs).compute_batch(**inputs)[output]
+    return np.asarray(result, dtype=float)
@@ -1,4 +1,7 @@
-from typing import Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class CoolingWaterCoil:
@@ -95,3 +98,240 @@ class CoolingWaterCoil:
             "DeltaP_air": delta_p_air,
             "DeltaP_water": delta_p_water,
         }
+
+    def compute_batch(
+        self,
+        t: "np.ndarray",
+        T_air_in: "np.ndarray",
+        T_water_in: "np.ndarray",
+        V_dot_air: "np.ndarray",
+        V_dot_water: "np.ndarray",
+        h_in: "np.ndarray",
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of time and inlet conditions.
+
+        Args:
+            t (np.ndarray): Current time (e.g., in hours)
+            T_air_in (np.ndarray): Inlet air temperature (°C)
+            T_water_in (np.ndarray): Inlet water temperature (°C)
+            V_dot_air (np.ndarray): Air volumetric flow rate (m³/s)
+            V_dot_water (np.ndarray): Water volumetric flow rate (m³/s)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        t, T_air_in, T_water_in, V_dot_air, V_dot_water, h_in = as_arrays(
+            t, T_air_in, T_water_in, V_dot_air, V_dot_water, h_in, exact=(0,)
+        )
+        available = evaluate(self.availability_schedule, t).astype(bool)
+
+        f_temp = evaluate(self.cap_temp_curve, T_air_in, T_water_in)
+        f_flow = evaluate(self.cap_flow_curve, V_dot_air, V_dot_water)
+
+        Q_total = np.where(available, self.Q_rated * f_temp * f_flow, 0.0)
+        Q_sensible = self.SHR * Q_total
+        Q_latent = Q_total - Q_sensible
+
+        m_dot_air = self.rho_air * V_dot_air
+        h_out = h_in - divide_or_zero(Q_total, m_dot_air)
+
+        zeros = np.zeros_like(t)
+        delta_p_air = (
+            np.where(available, evaluate(self.pressure_drop_curve_air, V_dot_air), 0.0)
+            if self.pressure_drop_curve_air
+            else zeros
+        )
+        delta_p_water = (
+            np.where(
+                available, evaluate(self.pressure_drop_curve_water, V_dot_water), 0.0
+            )
+            if self.pressure_drop_curve_water
+            else zeros
+        )
+
+        return {
+            "Q_total": Q_total,
+            "Q_sensible": Q_sensible,
+            "Q_latent": Q_latent,
+            "h_out": h_out,
+            "DeltaP_air": delta_p_air,
+            "DeltaP_water": delta_p_water,
+        }
+
+    def jacobian(
+        self,
+        t: float,
+        T_air_in: float,
+        T_water_in: float,
+        V_dot_air: float,
+        V_dot_water: float,
+        h_in: float,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Analytic partial derivatives of the outputs w.r.t. the inlet conditions.
+
+        Derivatives are zero while the coil is unavailable, except
+        ∂h_out/∂h_in = 1. Time is not differentiated.
+
+        Args:
+            t (float): Current time (e.g., in hours)
+            T_air_in (float): Inlet air temperature (°C)
+            T_water_in (float): Inlet water temperature (°C)
+            V_dot_air (float): Air volumetric flow rate (m³/s)
+            V_dot_water (float): Water volumetric flow rate (m³/s)
+            h_in (float): Inlet air enthalpy (J/kg)
+
+        Returns:
+            dict: output → {input → ∂output/∂input} for the keys of compute()
+        """
+        from energy_models.curves.curves import derivative
+
+        if not self.availability_schedule(t):
+            zero = {
+                "T_air_in": 0.0,
+                "T_water_in": 0.0,
+                "V_dot_air": 0.0,
+                "V_dot_water": 0.0,
+            }
+            return {
+                "Q_total": dict(zero),
+                "Q_sensible": dict(zero),
+                "Q_latent": dict(zero),
+                "h_out": {**zero, "h_in": 1.0},
+                "DeltaP_air": {"V_dot_air": 0.0},
+                "DeltaP_water": {"V_dot_water": 0.0},
+            }
+
+        f_temp = self.cap_temp_curve(T_air_in, T_water_in)
+        f_flow = self.cap_flow_curve(V_dot_air, V_dot_water)
+        temp_slopes = derivative(self.cap_temp_curve, T_air_in, T_water_in)
+        flow_slopes = derivative(self.cap_flow_curve, V_dot_air, V_dot_water)
+        d_total = {
+            "T_air_in": self.Q_rated * temp_slopes[0] * f_flow,
+            "T_water_in": self.Q_rated * temp_slopes[1] * f_flow,
+            "V_dot_air": self.Q_rated * f_temp * flow_slopes[0],
+            "V_dot_water": self.Q_rated * f_temp * flow_slopes[1],
+        }
+
+        m_dot_air = self.rho_air * V_dot_air
+        if m_dot_air > 0:
+            d_h_out = {k: -d / m_dot_air for k, d in d_total.items()}
+            d_h_out["V_dot_air"] += (
+                self.Q_rated * f_temp * f_flow * self.rho_air / m_dot_air**2
+            )
+        else:
+            d_h_out = {k: 0.0 for k in d_total}
+
+        return {
+            "Q_total": d_total,
+            "Q_sensible": {k: self.SHR * d for k, d in d_total.items()},
+            "Q_latent": {k: (1 - self.SHR) * d for k, d in d_total.items()},
+            "h_out": {**d_h_out, "h_in": 1.0},
+            "DeltaP_air": {
+                "V_dot_air": (
+                    derivative(self.pressure_drop_curve_air, V_dot_air)
+                    if self.pressure_drop_curve_air
+                    else 0.0
+                )
+            },
+            "DeltaP_water": {
+                "V_dot_water": (
+                    derivative(self.pressure_drop_curve_water, V_dot_water)
+                    if self.pressure_drop_curve_water
+                    else 0.0
+                )
+            },
+        }
+
+    def jacobian_batch(
+        self,
+        t: "np.ndarray",
+        T_air_in: "np.ndarray",
+        T_water_in: "np.ndarray",
+        V_dot_air: "np.ndarray",
+        V_dot_water: "np.ndarray",
+        h_in: "np.ndarray",
+    ) -> "Dict[str, Dict[str, np.ndarray]]":
+        """
+        Vectorized jacobian() over arrays of time and inlet conditions.
+
+        Args:
+            t (np.ndarray): Current time (e.g., in hours)
+            T_air_in (np.ndarray): Inlet air temperature (°C)
+            T_water_in (np.ndarray): Inlet water temperature (°C)
+            V_dot_air (np.ndarray): Air volumetric flow rate (m³/s)
+            V_dot_water (np.ndarray): Water volumetric flow rate (m³/s)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as jacobian(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import (
+            as_arrays,
+            derivative_batch,
+            divide_or_zero,
+            evaluate,
+        )
+
+        t, T_air_in, T_water_in, V_dot_air, V_dot_water, h_in = as_arrays(
+            t, T_air_in, T_water_in, V_dot_air, V_dot_water, h_in, exact=(0,)
+        )
+        available = evaluate(self.availability_schedule, t).astype(bool)
+
+        f_temp = evaluate(self.cap_temp_curve, T_air_in, T_water_in)
+        f_flow = evaluate(self.cap_flow_curve, V_dot_air, V_dot_water)
+        temp_slopes = derivative_batch(self.cap_temp_curve, T_air_in, T_water_in)
+        flow_slopes = derivative_batch(self.cap_flow_curve, V_dot_air, V_dot_water)
+        scale = np.where(available, self.Q_rated, 0.0).astype(h_in.dtype)
+        d_total = {
+            "T_air_in": scale * temp_slopes[0] * f_flow,
+            "T_water_in": scale * temp_slopes[1] * f_flow,
+            "V_dot_air": scale * f_temp * flow_slopes[0],
+            "V_dot_water": scale * f_temp * flow_slopes[1],
+        }
+
+        m_dot_air = self.rho_air * V_dot_air
+        d_h_out = {k: -divide_or_zero(d, m_dot_air) for k, d in d_total.items()}
+        d_h_out["V_dot_air"] += divide_or_zero(
+            scale * f_temp * f_flow * self.rho_air, m_dot_air**2
+        )
+
+        zeros = np.zeros_like(h_in)
+        return {
+            "Q_total": d_total,
+            "Q_sensible": {k: self.SHR * d for k, d in d_total.items()},
+            "Q_latent": {k: (1 - self.SHR) * d for k, d in d_total.items()},
+            "h_out": {**d_h_out, "h_in": np.ones_like(h_in)},
+            "DeltaP_air": {
+                "V_dot_air": (
+                    np.where(
+                        available,
+                        derivative_batch(self.pressure_drop_curve_air, V_dot_air)[0],
+                        0.0,
+                    )
+                    if self.pressure_drop_curve_air
+                    else zeros
+                )
+            },
+            "DeltaP_water": {
+                "V_dot_water": (
+                    np.where(
+                        available,
+                        derivative_batch(self.pressure_drop_curve_water, V_dot_water)[
+                            0
+                        ],
+                        0.0,
+                    )
+                    if self.pressure_drop_curve_water
+                    else zeros
+                )
+            },
+        }
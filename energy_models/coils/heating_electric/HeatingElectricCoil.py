@@ -1,7 +1,13 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ElectricHeatingCoil:
+    # Callables of t only (see batch.compute_by_day())
+    schedule_attributes = ("availability_schedule", "load_fraction_func")
+
     def __init__(
         self,
         q_nominal: float,
@@ -57,3 +63,34 @@ class ElectricHeatingCoil:
             "W_electric": w_electric,
             "h_out": h_out,
         }
+
+    def compute_batch(
+        self, t: "np.ndarray", m_dot_air: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of time and inlet conditions.
+
+        Args:
+            t (np.ndarray): Current time (e.g., in hours)
+            m_dot_air (np.ndarray): Air mass flow rate (kg/s)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        t, m_dot_air, h_in = as_arrays(t, m_dot_air, h_in, exact=(0,))
+        available = evaluate(self.availability_schedule, t).astype(bool)
+        load_frac = np.clip(evaluate(self.load_fraction_func, t), 0.0, 1.0)
+        q_total = np.where(available, self.q_nominal * load_frac, 0.0)
+        w_electric = divide_or_zero(q_total, self.eta)
+        h_out = h_in + divide_or_zero(q_total, m_dot_air)
+
+        return {
+            "Q_total": q_total,
+            "W_electric": w_electric,
+            "h_out": h_out,
+        }
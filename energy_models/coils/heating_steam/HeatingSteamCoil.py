@@ -1,6 +1,12 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class SteamHeatingCoil:
+    # Callables of t only (see batch.compute_by_day())
+    schedule_attributes = ("availability_schedule", "control_schedule")
+
     def __init__(
         self,
         h_fg: float,  # Latent heat of vaporization (J/kg)
@@ -54,3 +60,36 @@ class SteamHeatingCoil:
             "Q_sensible": Q_sensible,
             "m_dot_steam": m_dot_steam,
         }
+
+    def compute_batch(self, t: "np.ndarray") -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over an array of times.
+
+        Unavailable timesteps report zeros for every key, so all four keys
+        are always present.
+
+        Args:
+            t (np.ndarray): Simulation time in hours
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, evaluate
+
+        (t,) = as_arrays(t, exact=(0,))
+        available = evaluate(self.availability_schedule, t).astype(bool)
+        load_fraction = np.clip(evaluate(self.control_schedule, t), 0.0, 1.0)
+        m_dot_steam = np.where(available, self.m_dot_max * load_fraction, 0.0)
+
+        Q_latent = m_dot_steam * self.h_fg
+        Q_sensible = m_dot_steam * self.cp_cond * self.deltaT_subcool_total
+        Q_total = Q_latent + Q_sensible
+
+        return {
+            "Q_total": Q_total,
+            "Q_latent": Q_latent,
+            "Q_sensible": Q_sensible,
+            "m_dot_steam": m_dot_steam,
+        }
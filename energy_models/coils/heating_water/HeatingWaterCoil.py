@@ -1,4 +1,7 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class HeatingWaterCoil:
@@ -66,3 +69,47 @@ class HeatingWaterCoil:
             "Q_total": Q_total,
             "h_out": h_out,
         }
+
+    def compute_batch(
+        self,
+        t: "np.ndarray",
+        T_air_in: "np.ndarray",
+        T_water_in: "np.ndarray",
+        V_dot_air: "np.ndarray",
+        V_dot_water: "np.ndarray",
+        h_in: "np.ndarray",
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of time and inlet conditions.
+
+        Args:
+            t (np.ndarray): Time (e.g., in hours)
+            T_air_in (np.ndarray): Inlet air temperature (°C)
+            T_water_in (np.ndarray): Inlet water temperature (°C)
+            V_dot_air (np.ndarray): Air volumetric flow rate (m³/s)
+            V_dot_water (np.ndarray): Water volumetric flow rate (m³/s)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        t, T_air_in, T_water_in, V_dot_air, V_dot_water, h_in = as_arrays(
+            t, T_air_in, T_water_in, V_dot_air, V_dot_water, h_in, exact=(0,)
+        )
+        available = evaluate(self.availability_schedule, t).astype(bool)
+
+        f_temp = evaluate(self.cap_temp_curve, T_air_in, T_water_in)
+        f_flow = evaluate(self.cap_flow_curve, V_dot_air, V_dot_water)
+
+        Q_total = np.where(available, self.Q_rated * f_temp * f_flow, 0.0)
+        m_dot_air = self.rho_air * V_dot_air
+        h_out = h_in + divide_or_zero(Q_total, m_dot_air)
+
+        return {
+            "Q_total": Q_total,
+            "h_out": h_out,
+        }
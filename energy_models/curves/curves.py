@@ -1,4 +1,39 @@
-from typing import Callable, Tuple
+from typing import Any, Callable, Tuple
+
+# Every curve carries its analytic derivative as a `derivative` attribute:
+# a function of the same arguments returning dy/dx for one-variable curves
+# and a tuple of partial derivatives otherwise. derivative() uses it when
+# present and central differences for any other callable.
+
+
+def _with_derivative(curve: Callable, slope: Callable) -> Callable:
+    setattr(curve, "derivative", slope)
+    return curve
+
+
+def derivative(func: Callable, *args: Any, step: float = 1e-6) -> Any:
+    """
+    Partial derivatives of a curve (or any callable) at the given arguments.
+
+    Args:
+        func (Callable): Curve from this module, or any callable
+        *args: Point of evaluation, floats or arrays for array-aware callables
+        step (float): Relative step of the central-difference fallback
+
+    Returns:
+        float | tuple: df/dx for one argument, else one partial per argument
+    """
+    slope = getattr(func, "derivative", None)
+    if slope is not None:
+        return slope(*args)
+    partials = []
+    for i, x in enumerate(args):
+        h = step * (abs(x) + 1.0)
+        up = args[:i] + (x + h,) + args[i + 1 :]
+        down = args[:i] + (x - h,) + args[i + 1 :]
+        partials.append((func(*up) - func(*down)) / (2 * h))
+    return partials[0] if len(partials) == 1 else tuple(partials)
+
 
 # -------------------------------
 # 🔹 Single-variable Curves
@@ -7,29 +42,39 @@ from typing import Callable, Tuple
 
 def curve_linear(c1: float, c2: float) -> Callable[[float], float]:
     """y = C1 + C2 * x"""
-    return lambda x: c1 + c2 * x
+    return _with_derivative(lambda x: c1 + c2 * x, lambda x: c2 + 0 * x)
 
 
 def curve_quadratic(c1: float, c2: float, c3: float) -> Callable[[float], float]:
     """y = C1 + C2 * x + C3 * x^2"""
-    return lambda x: c1 + c2 * x + c3 * x**2
+    return _with_derivative(
+        lambda x: c1 + c2 * x + c3 * x**2, lambda x: c2 + 2 * c3 * x
+    )
 
 
 def curve_cubic(c1: float, c2: float, c3: float, c4: float) -> Callable[[float], float]:
     """y = C1 + C2 * x + C3 * x^2 + C4 * x^3"""
-    return lambda x: c1 + c2 * x + c3 * x**2 + c4 * x**3
+    return _with_derivative(
+        lambda x: c1 + c2 * x + c3 * x**2 + c4 * x**3,
+        lambda x: c2 + 2 * c3 * x + 3 * c4 * x**2,
+    )
 
 
 def curve_quartic(
     c1: float, c2: float, c3: float, c4: float, c5: float
 ) -> Callable[[float], float]:
     """y = C1 + C2 * x + C3 * x^2 + C4 * x^3 + C5 * x^4"""
-    return lambda x: c1 + c2 * x + c3 * x**2 + c4 * x**3 + c5 * x**4
+    return _with_derivative(
+        lambda x: c1 + c2 * x + c3 * x**2 + c4 * x**3 + c5 * x**4,
+        lambda x: c2 + 2 * c3 * x + 3 * c4 * x**2 + 4 * c5 * x**3,
+    )
 
 
 def curve_exponent(c1: float, c2: float, c3: float) -> Callable[[float], float]:
     """y = C1 + C2 * x^C3"""
-    return lambda x: c1 + c2 * (x**c3)
+    return _with_derivative(
+        lambda x: c1 + c2 * (x**c3), lambda x: c2 * c3 * x ** (c3 - 1)
+    )
 
 
 # -------------------------------
@@ -43,13 +88,17 @@ def curve_quadratic_linear(
     """
     y = C1 + C2*x + C3*x^2 + C4*z + C5*x*z + C6*x^2*z
     """
-    return (
+    return _with_derivative(
         lambda x, z: c[0]
         + c[1] * x
         + c[2] * x**2
         + c[3] * z
         + c[4] * x * z
-        + c[5] * x**2 * z
+        + c[5] * x**2 * z,
+        lambda x, z: (
+            c[1] + 2 * c[2] * x + c[4] * z + 2 * c[5] * x * z,
+            c[3] + c[4] * x + c[5] * x**2,
+        ),
     )
 
 
@@ -59,7 +108,7 @@ def curve_cubic_linear(
     """
     y = C1 + C2*x + C3*x^2 + C4*x^3 + C5*z + C6*x*z + C7*x^2*z + C8*x^3*z
     """
-    return (
+    return _with_derivative(
         lambda x, z: c[0]
         + c[1] * x
         + c[2] * x**2
@@ -67,7 +116,16 @@ def curve_cubic_linear(
         + c[4] * z
         + c[5] * x * z
         + c[6] * x**2 * z
-        + c[7] * x**3 * z
+        + c[7] * x**3 * z,
+        lambda x, z: (
+            c[1]
+            + 2 * c[2] * x
+            + 3 * c[3] * x**2
+            + c[5] * z
+            + 2 * c[6] * x * z
+            + 3 * c[7] * x**2 * z,
+            c[4] + c[5] * x + c[6] * x**2 + c[7] * x**3,
+        ),
     )
 
 
@@ -77,13 +135,17 @@ def curve_biquadratic(
     """
     y = C1 + C2*x + C3*x^2 + C4*z + C5*z^2 + C6*x*z
     """
-    return (
+    return _with_derivative(
         lambda x, z: c[0]
         + c[1] * x
         + c[2] * x**2
         + c[3] * z
         + c[4] * z**2
-        + c[5] * x * z
+        + c[5] * x * z,
+        lambda x, z: (
+            c[1] + 2 * c[2] * x + c[5] * z,
+            c[3] + 2 * c[4] * z + c[5] * x,
+        ),
     )
 
 
@@ -91,20 +153,42 @@ def curve_bicubic(c: Tuple[float, ...]) -> Callable[[float, float], float]:
     """
     Full 13-coefficient bi-cubic curve
     """
-    return lambda x, z: (
-        c[0]
-        + c[1] * x
-        + c[2] * x**2
-        + c[3] * x**3
-        + c[4] * z
-        + c[5] * z**2
-        + c[6] * z**3
-        + c[7] * x * z
-        + c[8] * x**2 * z
-        + c[9] * x * z**2
-        + c[10] * x**2 * z**2
-        + c[11] * x * z**3
-        + c[12] * x**3 * z
+    return _with_derivative(
+        lambda x, z: (
+            c[0]
+            + c[1] * x
+            + c[2] * x**2
+            + c[3] * x**3
+            + c[4] * z
+            + c[5] * z**2
+            + c[6] * z**3
+            + c[7] * x * z
+            + c[8] * x**2 * z
+            + c[9] * x * z**2
+            + c[10] * x**2 * z**2
+            + c[11] * x * z**3
+            + c[12] * x**3 * z
+        ),
+        lambda x, z: (
+            c[1]
+            + 2 * c[2] * x
+            + 3 * c[3] * x**2
+            + c[7] * z
+            + 2 * c[8] * x * z
+            + c[9] * z**2
+            + 2 * c[10] * x * z**2
+            + c[11] * z**3
+            + 3 * c[12] * x**2 * z,
+            c[4]
+            + 2 * c[5] * z
+            + 3 * c[6] * z**2
+            + c[7] * x
+            + c[8] * x**2
+            + 2 * c[9] * x * z
+            + 2 * c[10] * x**2 * z
+            + 3 * c[11] * x * z**2
+            + c[12] * x**3,
+        ),
     )
 
 
@@ -118,18 +202,25 @@ def curve_triquadratic(c: Tuple[float, ...]) -> Callable[[float, float, float],
     w = C1 + C2*x + C3*x^2 + C4*y + C5*y^2 + C6*z + C7*z^2 +
         C8*x*y + C9*x*z + C10*y*z + C11*x*y*z
     """
-    return lambda x, y, z: (
-        c[0]
-        + c[1] * x
-        + c[2] * x**2
-        + c[3] * y
-        + c[4] * y**2
-        + c[5] * z
-        + c[6] * z**2
-        + c[7] * x * y
-        + c[8] * x * z
-        + c[9] * y * z
-        + c[10] * x * y * z
+    return _with_derivative(
+        lambda x, y, z: (
+            c[0]
+            + c[1] * x
+            + c[2] * x**2
+            + c[3] * y
+            + c[4] * y**2
+            + c[5] * z
+            + c[6] * z**2
+            + c[7] * x * y
+            + c[8] * x * z
+            + c[9] * y * z
+            + c[10] * x * y * z
+        ),
+        lambda x, y, z: (
+            c[1] + 2 * c[2] * x + c[7] * y + c[8] * z + c[10] * y * z,
+            c[3] + 2 * c[4] * y + c[7] * x + c[9] * z + c[10] * x * z,
+            c[5] + 2 * c[6] * z + c[8] * x + c[9] * y + c[10] * x * y,
+        ),
     )
 
 
@@ -142,7 +233,7 @@ def curve_functional_pressure_drop(c1: float, c2: float) -> Callable[[float], fl
     """
     ΔP = C1 + C2 * V^2
     """
-    return lambda v: c1 + c2 * v**2
+    return _with_derivative(lambda v: c1 + c2 * v**2, lambda v: 2 * c2 * v)
 
 
 def curve_fan_pressure_rise(
@@ -151,13 +242,19 @@ def curve_fan_pressure_rise(
     """
     ΔP = C1 + C2*Q + C3*Q^2 + C4*Pduct + C5*Pduct^2 + C6*Q*Pduct
     """
-    return lambda q, p_duct: (
-        c[0]
-        + c[1] * q
-        + c[2] * q**2
-        + c[3] * p_duct
-        + c[4] * p_duct**2
-        + c[5] * q * p_duct
+    return _with_derivative(
+        lambda q, p_duct: (
+            c[0]
+            + c[1] * q
+            + c[2] * q**2
+            + c[3] * p_duct
+            + c[4] * p_duct**2
+            + c[5] * q * p_duct
+        ),
+        lambda q, p_duct: (
+            c[1] + 2 * c[2] * q + c[5] * p_duct,
+            c[3] + 2 * c[4] * p_duct + c[5] * q,
+        ),
     )
 
 
@@ -167,7 +264,11 @@ def curve_rectangular_hyperbola_2(
     """
     y = (C1 * x) / (C2 + x) + C3 * x
     """
-    return lambda x: (c1 * x) / (c2 + x) + c3 * x
+    return _with_derivative(
+        lambda x: (c1 * x) / (c2 + x) + c3 * x,
+        lambda x: c1 * c2 / (c2 + x) ** 2 + c3,
+    )
+
 
 def make_speed_scaled_fan_curve(
     base_curve: Callable[[float, float], float],
@@ -183,5 +284,15 @@ def make_speed_scaled_fan_curve(
     Returns:
         Callable[[float, float, float], float]: ΔP = f(Q, P_duct, RPM)
     """
-    return lambda Q, P_duct, N: (N / N_ref) ** 2 * base_curve(Q / (N / N_ref), P_duct)
 
+    def slope(Q: Any, P_duct: Any, N: Any) -> Tuple:
+        # ΔP = s² f(Q/s, P) with s = N / N_ref
+        s = N / N_ref
+        f = base_curve(Q / s, P_duct)
+        f_q, f_p = derivative(base_curve, Q / s, P_duct)
+        return s * f_q, s**2 * f_p, (2 * s * f - Q * f_q) / N_ref
+
+    return _with_derivative(
+        lambda Q, P_duct, N: (N / N_ref) ** 2 * base_curve(Q / (N / N_ref), P_duct),
+        slope,
+    )
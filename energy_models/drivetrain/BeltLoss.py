@@ -0,0 +1,60 @@
+import math
+from typing import Callable, Optional, Sequence, Union
+
+from energy_models.drivetrain.DriveLoss import DriveLoss
+
+# Watts per horsepower; the EnergyPlus maximum efficiency curves take ln(hp)
+W_PER_HP = 745.7
+
+
+class BeltLoss(DriveLoss):
+    def __init__(
+        self,
+        rated_power: float,
+        eta_max: Union[float, Callable[[float], float]],
+        part_load: Optional[Sequence[Callable[[float], float]]] = None,
+        transition: float = 0.0,
+        x_max: float = 1.5,
+        n_breakpoints: int = 64,
+    ):
+        """
+        Belt drive loss after Fan:ComponentModel, as a belt_loss_func.
+
+        Efficiency is η_belt = η_belt,max · f(x) with x = W_shaft / rated
+        power, where f is picked by region as in EnergyPlus: region 1 below
+        the transition load, region 2 from there up to full load and
+        region 3 above it.
+
+        Args:
+            rated_power (float): Maximum belt output power (W), i.e. maximum
+                fan shaft power × belt sizing factor
+            eta_max (float | Callable): Maximum belt efficiency, or the
+                "Maximum Belt Efficiency Curve" giving ln(η_belt,max) from
+                ln(rated power in hp) (e.g. a curve_quartic)
+            part_load (Sequence[Callable], optional): Normalized efficiency
+                curves of x, one for all loads or one per region 1-3;
+                default 1 (constant efficiency)
+            transition (float): Normalized load between regions 1 and 2
+            x_max (float): Highest tabulated normalized load
+            n_breakpoints (int): Breakpoints of the loss table
+
+        Raises:
+            ValueError: If part_load does not have 1 or 3 curves.
+        """
+        if callable(eta_max):
+            eta_max = math.exp(eta_max(math.log(rated_power / W_PER_HP)))
+        curves = tuple(part_load or (lambda x: 1.0,))
+        if len(curves) not in (1, 3):
+            raise ValueError(f"part_load needs 1 or 3 curves, got {len(curves)}")
+        self.eta_max = eta_max
+        self.transition = transition
+
+        def efficiency(x: float) -> float:
+            if len(curves) == 1:
+                return eta_max * curves[0](x)
+            region = 0 if x < transition else 1 if x <= 1.0 else 2
+            return eta_max * curves[region](x)
+
+        super().__init__(
+            rated_power, efficiency, x_max, n_breakpoints, (transition, 1.0)
+        )
@@ -0,0 +1,140 @@
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class DriveLoss:
+    def __init__(
+        self,
+        rated_power: float,
+        efficiency: Callable[[float], float],
+        x_max: float = 1.5,
+        n_breakpoints: int = 64,
+        breakpoints: Sequence[float] = (),
+    ):
+        """
+        Power loss of a drive element (belt, motor or VFD) from its output power.
+
+        The part-load efficiency η(x), with x = P_out / rated_power, is
+        tabulated once at construction as the loss per unit of rated power,
+
+            loss(P_out) = P_out · (1/η(x) - 1)
+
+        on breakpoints that are denser at low load. Calls interpolate
+        linearly between them, so evaluation costs one lookup whatever the
+        efficiency curves are, works on scalars and arrays alike, and the
+        object holds only numbers: it pickles, unlike the lambdas it replaces.
+        Loads above x_max extrapolate the last segment; zero or negative
+        output power (the fan is off) has no loss.
+
+        Args:
+            rated_power (float): Rated output power of the element (W)
+            efficiency (Callable): η(x) of the normalized load x (0-1)
+            x_max (float): Highest tabulated normalized load
+            n_breakpoints (int): Breakpoints of the table over [0, x_max]
+            breakpoints (Sequence[float]): Boundaries of part-load regions,
+                where the efficiency may jump; added to the table
+
+        Raises:
+            ValueError: If rated_power is not positive or η(x) is not
+                positive at a breakpoint.
+        """
+        if rated_power <= 0:
+            raise ValueError(f"rated_power must be positive, got {rated_power}")
+        self.rated_power = rated_power
+        grid = {x_max * (k / n_breakpoints) ** 2 for k in range(n_breakpoints + 1)}
+        # Region boundaries get a point just below and just above them, so a
+        # jump in efficiency stays a jump instead of spreading over a segment,
+        # whichever region the boundary itself belongs to
+        for x in breakpoints:
+            if 0.0 < x < x_max:
+                grid.update((x * (1.0 - 1e-9), x, x * (1.0 + 1e-9)))
+        self.x = tuple(sorted(grid))
+        self.loss = tuple(_loss_fraction(efficiency, x, self.x[1]) for x in self.x)
+        self.slopes = tuple(
+            (l1 - l0) / (x1 - x0)
+            for x0, x1, l0, l1 in zip(self.x, self.x[1:], self.loss, self.loss[1:])
+        )
+
+    def __call__(self, P: Any) -> Any:
+        """
+        Loss (W) at output power P (W), a float or an array like P.
+        """
+        if not isinstance(P, (int, float)):
+            return self._array(P, True)
+        if P <= 0:
+            return 0.0
+        x = P / self.rated_power
+        i = self._segment(x)
+        return self.rated_power * (self.loss[i] + self.slopes[i] * (x - self.x[i]))
+
+    def derivative(self, P: Any) -> Any:
+        """
+        d loss / d P at output power P, used by the fans' jacobian().
+        """
+        if not isinstance(P, (int, float)):
+            return self._array(P, False)
+        if P <= 0:
+            return 0.0
+        return self.slopes[self._segment(P / self.rated_power)]
+
+    def efficiency(self, P: Any) -> Any:
+        """
+        Efficiency P / (P + loss) at output power P, 1 where P <= 0.
+        """
+        loss = self(P)
+        if isinstance(loss, float):
+            return P / (P + loss) if P > 0 else 1.0
+        import numpy as np
+
+        P = np.asarray(P, dtype=float)
+        return np.where(P > 0, P / np.where(P > 0, P + loss, 1.0), 1.0)
+
+    def __getstate__(self) -> dict:
+        # The NumPy tables are rebuilt on demand; pickles (and result cache
+        # fingerprints) do not depend on whether they were built
+        return {k: v for k, v in self.__dict__.items() if k != "_tables"}
+
+    def _segment(self, x: float) -> int:
+        return min(max(bisect_right(self.x, x) - 1, 0), len(self.slopes) - 1)
+
+    def _array(self, P: Any, table: bool) -> "np.ndarray":
+        # Linear interpolation in the table, or the segment slopes
+        import numpy as np
+
+        xs, losses, slopes = self._arrays()
+        P = np.asarray(P)
+        x = P / self.rated_power
+        i = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, slopes.size - 1)
+        if table:
+            value = self.rated_power * (losses[i] + slopes[i] * (x - xs[i]))
+        else:
+            value = slopes[i]
+        return np.where(P > 0, value, 0.0)
+
+    def _arrays(self) -> tuple:
+        # The table as NumPy arrays, built on the first array call
+        if "_tables" not in self.__dict__:
+            import numpy as np
+
+            self._tables = tuple(
+                np.asarray(v) for v in (self.x, self.loss, self.slopes)
+            )
+        return self._tables
+
+
+# ---- 🔹 Helpers ----
+
+
+def _loss_fraction(
+    efficiency: Callable[[float], float], x: float, first: float
+) -> float:
+    # Loss per unit rated power, x · (1/η - 1); at zero load the limit is
+    # taken just above it, since η may vanish there (no-load loss)
+    x_eval = x if x > 0 else 1e-6 * first
+    eta = float(efficiency(x_eval))
+    if eta <= 0:
+        raise ValueError(f"Efficiency must be positive, got {eta} at load {x_eval:g}")
+    return x_eval * (1.0 / eta - 1.0)
@@ -0,0 +1,40 @@
+import math
+from typing import Callable, Optional, Union
+
+from energy_models.drivetrain.BeltLoss import W_PER_HP
+from energy_models.drivetrain.DriveLoss import DriveLoss
+
+
+class MotorLoss(DriveLoss):
+    def __init__(
+        self,
+        rated_power: float,
+        eta_max: Union[float, Callable[[float], float]],
+        part_load: Optional[Callable[[float], float]] = None,
+        x_max: float = 1.5,
+        n_breakpoints: int = 64,
+    ):
+        """
+        Motor loss after Fan:ComponentModel, as a motor_loss_func.
+
+        Efficiency is η_motor = η_motor,max · g(x) with x = motor output
+        (shaft plus belt loss) / rated power. Pass it with eta_motor=1 so the
+        fan's constant motor efficiency does not apply on top.
+
+        Args:
+            rated_power (float): Maximum motor output power (W)
+            eta_max (float | Callable): Maximum motor efficiency, or the
+                "Maximum Motor Efficiency Curve" giving η_motor,max from
+                ln(rated power in hp)
+            part_load (Callable, optional): Normalized efficiency curve of x;
+                default 1 (constant efficiency)
+            x_max (float): Highest tabulated normalized load
+            n_breakpoints (int): Breakpoints of the loss table
+        """
+        if callable(eta_max):
+            eta_max = eta_max(math.log(rated_power / W_PER_HP))
+        curve = part_load or (lambda x: 1.0)
+        self.eta_max = eta_max
+        super().__init__(
+            rated_power, lambda x: eta_max * curve(x), x_max, n_breakpoints
+        )
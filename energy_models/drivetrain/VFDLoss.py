@@ -0,0 +1,29 @@
+from typing import Callable, Union
+
+from energy_models.drivetrain.DriveLoss import DriveLoss
+
+
+class VFDLoss(DriveLoss):
+    def __init__(
+        self,
+        rated_power: float,
+        efficiency: Union[float, Callable[[float], float]],
+        x_max: float = 1.5,
+        n_breakpoints: int = 64,
+    ):
+        """
+        Variable frequency drive loss after Fan:ComponentModel, as a
+        vfd_loss_func.
+
+        Efficiency follows the "VFD Efficiency Curve" of the power-based
+        type: η_VFD as a function of x = motor input power / rated power.
+
+        Args:
+            rated_power (float): Maximum VFD output power (W)
+            efficiency (float | Callable): Constant efficiency, or η_VFD(x)
+                (e.g. a curve_rectangular_hyperbola_2)
+            x_max (float): Highest tabulated normalized load
+            n_breakpoints (int): Breakpoints of the loss table
+        """
+        curve = efficiency if callable(efficiency) else (lambda x: efficiency)
+        super().__init__(rated_power, curve, x_max, n_breakpoints)
@@ -1,4 +1,7 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ComponentFan:
@@ -13,6 +16,7 @@ class ComponentFan:
         belt_loss_func: Callable[[float], float] = lambda x: 0.0,
         vfd_loss_func: Callable[[float], float] = lambda x: 0.0,
         static_reset_func: Callable[[float], float] = lambda Q: 0.0,
+        motor_loss_func: Callable[[float], float] = lambda x: 0.0,
     ):
         """
         Initialize the Fan:ComponentModel.
@@ -27,6 +31,8 @@ class ComponentFan:
             belt_loss_func (Callable): Function returning belt losses (W) from shaft power
             vfd_loss_func (Callable): Function returning VFD losses (W) from motor input
             static_reset_func (Callable): Function returning duct static pressure setpoint (Pa)
+            motor_loss_func (Callable): Function returning part-load motor losses (W)
+                from motor output (shaft + belt), added before eta_motor
         """
         self.rho = rho
         self.area_outlet = area_outlet
@@ -37,6 +43,7 @@ class ComponentFan:
         self.belt_loss_func = belt_loss_func
         self.vfd_loss_func = vfd_loss_func
         self.static_reset_func = static_reset_func
+        self.motor_loss_func = motor_loss_func
 
     def compute(self, Q: float, P_o: float, h_in: float) -> Dict[str, float]:
         """
@@ -65,7 +72,8 @@ class ComponentFan:
 
         W_shaft = Q * delta_P_total / self.eta_fan
         W_belt = self.belt_loss_func(W_shaft)
-        W_motor_in = (W_shaft + W_belt) / self.eta_motor
+        W_motor_out = W_shaft + W_belt
+        W_motor_in = (W_motor_out + self.motor_loss_func(W_motor_out)) / self.eta_motor
         W_vfd = self.vfd_loss_func(W_motor_in)
         W_electric = W_motor_in + W_vfd
 
@@ -86,3 +94,171 @@ class ComponentFan:
             "h_out": h_out,
             "m_dot": m_dot,
         }
+
+    def compute_batch(
+        self, Q: "np.ndarray", P_o: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of operating points.
+
+        Args:
+            Q (np.ndarray): Volumetric flow rate (m³/s)
+            P_o (np.ndarray): Ambient/zone static pressure (Pa)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            "Dict[str, np.ndarray]": Same keys as compute(), one array each
+        """
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        Q, P_o, h_in = as_arrays(Q, P_o, h_in)
+        P_sm = evaluate(self.static_reset_func, Q)
+        dP = P_sm - P_o
+        delta_P_total = (
+            self.C1
+            + self.C2 * Q
+            + self.C3 * Q**2
+            + self.C4 * dP
+            + self.C5 * dP**2
+            + self.C6 * Q * dP
+        )
+
+        velocity_out = Q / self.area_outlet
+        delta_P_static = delta_P_total - 0.5 * self.rho * velocity_out**2
+
+        W_shaft = Q * delta_P_total / self.eta_fan
+        W_belt = evaluate(self.belt_loss_func, W_shaft)
+        W_motor_out = W_shaft + W_belt
+        W_motor_in = (
+            W_motor_out + evaluate(self.motor_loss_func, W_motor_out)
+        ) / self.eta_motor
+        W_vfd = evaluate(self.vfd_loss_func, W_motor_in)
+        W_electric = W_motor_in + W_vfd
+
+        Q_to_air = self.f_motor_to_air * (W_electric - W_shaft - W_belt)
+        m_dot = self.rho * Q
+        h_out = h_in + divide_or_zero(Q_to_air, m_dot)
+
+        return {
+            "P_static_setpoint": P_sm,
+            "DeltaP_total": delta_P_total,
+            "DeltaP_static": delta_P_static,
+            "W_shaft": W_shaft,
+            "W_belt": W_belt,
+            "W_motor_in": W_motor_in,
+            "W_vfd": W_vfd,
+            "W_electric": W_electric,
+            "Q_to_air": Q_to_air,
+            "h_out": h_out,
+            "m_dot": m_dot,
+        }
+
+    def jacobian(
+        self, Q: float, P_o: float, h_in: float
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Analytic partial derivatives of the key outputs at one operating point.
+
+        Curve slopes come from the curves' analytic derivatives (central
+        differences for other callables, e.g. the default loss functions).
+
+        Args:
+            Q (float): Volumetric flow rate (m³/s)
+            P_o (float): Ambient/zone static pressure (Pa)
+            h_in (float): Inlet air enthalpy (J/kg)
+
+        Returns:
+            Dict[str, Dict[str, float]]: output → {input → ∂output/∂input} for
+            DeltaP_total, DeltaP_static, W_shaft, W_electric, Q_to_air and
+            h_out; inputs an output does not depend on are omitted
+        """
+        from energy_models.curves.curves import derivative
+
+        r = self.compute(Q, P_o, h_in)
+        slopes = (
+            derivative(self.static_reset_func, Q),
+            derivative(self.belt_loss_func, r["W_shaft"]),
+            derivative(self.motor_loss_func, r["W_shaft"] + r["W_belt"]),
+            derivative(self.vfd_loss_func, r["W_motor_in"]),
+        )
+        jac = self._chain(Q, P_o, r, *slopes)
+        m_dot = r["m_dot"]
+        jac["h_out"] = (
+            {
+                "Q": (jac["Q_to_air"]["Q"] * Q - r["Q_to_air"]) / (m_dot * Q),
+                "P_o": jac["Q_to_air"]["P_o"] / m_dot,
+                "h_in": 1.0,
+            }
+            if m_dot > 0
+            else {"h_in": 1.0}
+        )
+        return jac
+
+    def jacobian_batch(
+        self, Q: "np.ndarray", P_o: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, Dict[str, np.ndarray]]":
+        """
+        Vectorized jacobian() over arrays of operating points.
+
+        Args:
+            Q (np.ndarray): Volumetric flow rate (m³/s)
+            P_o (np.ndarray): Ambient/zone static pressure (Pa)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            "Dict[str, Dict[str, np.ndarray]]": Same keys as jacobian(), one
+            array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import (
+            as_arrays,
+            derivative_batch,
+            divide_or_zero,
+        )
+
+        Q, P_o, h_in = as_arrays(Q, P_o, h_in)
+        r = self.compute_batch(Q, P_o, h_in)
+        (s,) = derivative_batch(self.static_reset_func, Q)
+        (b,) = derivative_batch(self.belt_loss_func, r["W_shaft"])
+        (m,) = derivative_batch(self.motor_loss_func, r["W_shaft"] + r["W_belt"])
+        (v,) = derivative_batch(self.vfd_loss_func, r["W_motor_in"])
+        jac = self._chain(Q, P_o, r, s, b, m, v)
+        m_dot = r["m_dot"]
+        jac["h_out"] = {
+            "Q": divide_or_zero(jac["Q_to_air"]["Q"] * Q - r["Q_to_air"], m_dot * Q),
+            "P_o": divide_or_zero(jac["Q_to_air"]["P_o"], m_dot),
+            "h_in": np.ones_like(h_in),
+        }
+        return jac
+
+    def _chain(
+        self, Q: Any, P_o: Any, r: Dict[str, Any], s: Any, b: Any, m: Any, v: Any
+    ) -> Dict[str, Dict[str, Any]]:
+        # Chain rule through pressure rise, shaft, belt, motor and VFD, given
+        # the slopes of the static reset (s), belt (b), motor (m) and VFD (v)
+        # losses
+        dP = r["P_static_setpoint"] - P_o
+        g = self.C4 + 2 * self.C5 * dP + self.C6 * Q  # ∂ΔP/∂(P_sm - P_o)
+        d_total = {
+            "Q": self.C2 + 2 * self.C3 * Q + self.C6 * dP + g * s,
+            "P_o": -g,
+        }
+        d_shaft = {
+            "Q": (r["DeltaP_total"] + Q * d_total["Q"]) / self.eta_fan,
+            "P_o": Q * d_total["P_o"] / self.eta_fan,
+        }
+        electric = (1 + v) * (1 + m) * (1 + b) / self.eta_motor
+        return {
+            "DeltaP_total": d_total,
+            "DeltaP_static": {
+                "Q": d_total["Q"] - self.rho * Q / self.area_outlet**2,
+                "P_o": d_total["P_o"],
+            },
+            "W_shaft": d_shaft,
+            "W_electric": {k: electric * d for k, d in d_shaft.items()},
+            "Q_to_air": {
+                k: self.f_motor_to_air * (electric - 1 - b) * d
+                for k, d in d_shaft.items()
+            },
+        }
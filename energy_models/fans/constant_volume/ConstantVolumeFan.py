@@ -2,6 +2,11 @@
 Variable speed constant volume fan model.
 """
 
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class ConstantVolumeFan:
     def __init__(
@@ -52,3 +57,32 @@ class ConstantVolumeFan:
             "Q_to_air": Q_to_air,
             "h_out": h_out,
         }
+
+    def compute_batch(
+        self, m_dot: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """Vectorized compute() over arrays of mass flow and inlet enthalpy.
+
+        Zero-flow entries return h_out = h_in instead of dividing by zero.
+
+        Args:
+            m_dot: Mass flow rate (kg/s).
+            h_in: Inlet air enthalpy (J/kg).
+
+        Returns:
+            dict: Same keys as compute(), one array each.
+        """
+        from energy_models.batch.batch import as_arrays, divide_or_zero
+
+        m_dot, h_in = as_arrays(m_dot, h_in)
+        W_shaft = (m_dot * self.delta_p) / (self.rho * self.eta_fan)
+        W_electric = W_shaft / self.eta_motor
+        Q_to_air = self.f_motor_to_air * (W_electric - W_shaft)
+        h_out = h_in + divide_or_zero(Q_to_air, m_dot)
+
+        return {
+            "W_shaft": W_shaft,
+            "W_electric": W_electric,
+            "Q_to_air": Q_to_air,
+            "h_out": h_out,
+        }
@@ -1,5 +1,9 @@
-from typing import Callable, Dict
-from scipy.optimize import root_scalar
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from energy_models.profiling.Profiler import record_solver
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class CurveSpeedControlledFan:
@@ -14,6 +18,7 @@ class CurveSpeedControlledFan:
         system_pressure_func: Callable[[float], float],
         belt_loss_func: Callable[[float], float] = lambda x: 0.0,
         vfd_loss_func: Callable[[float], float] = lambda x: 0.0,
+        motor_loss_func: Callable[[float], float] = lambda x: 0.0,
     ):
         """
         High-fidelity variable-speed fan model with system pressure feedback.
@@ -28,6 +33,7 @@ class CurveSpeedControlledFan:
             system_pressure_func (Callable[[float], float]): Function mapping Q to downstream system pressure loss (Pa).
             belt_loss_func (Callable[[float], float], optional): Returns belt loss (W) from shaft power.
             vfd_loss_func (Callable[[float], float], optional): Returns VFD loss (W) from motor input power.
+            motor_loss_func (Callable[[float], float], optional): Returns motor loss (W) from motor output power, before eta_motor.
         """
         self.rho = rho
         self.area_outlet = area_outlet
@@ -38,6 +44,7 @@ class CurveSpeedControlledFan:
         self.system_pressure_func = system_pressure_func
         self.belt_loss_func = belt_loss_func
         self.vfd_loss_func = vfd_loss_func
+        self.motor_loss_func = motor_loss_func
 
     def compute(self, rpm: float, h_in: float) -> Dict[str, float]:
         """
@@ -63,10 +70,21 @@ class CurveSpeedControlledFan:
                 - "h_out" (float): Outlet air enthalpy (J/kg).
                 - "m_dot" (float): Air mass flow rate (kg/s).
         """
+        # Imported on first solve: SciPy dominates this module's import time
+        from scipy.optimize import root_scalar
+
         def residual(Q: float) -> float:
             return self.fan_curve(Q, rpm) - self.system_pressure_func(Q)
 
-        sol = root_scalar(residual, bracket=[0.01, 20.0], method='brentq')
+        try:
+            sol = root_scalar(residual, bracket=[0.01, 20.0], method="brentq")
+        except ValueError:
+            # No sign change over the bracket
+            record_solver(self, "brentq", 0, 0, 1)
+            raise
+        record_solver(
+            self, "brentq", sol.iterations, int(sol.converged), int(not sol.converged)
+        )
         if not sol.converged:
             raise RuntimeError("Fan flow solver did not converge.")
         Q = sol.root
@@ -78,7 +96,8 @@ class CurveSpeedControlledFan:
 
         W_shaft = Q * delta_p_fan / self.eta_fan
         W_belt = self.belt_loss_func(W_shaft)
-        W_motor_in = (W_shaft + W_belt) / self.eta_motor
+        W_motor_out = W_shaft + W_belt
+        W_motor_in = (W_motor_out + self.motor_loss_func(W_motor_out)) / self.eta_motor
         W_vfd = self.vfd_loss_func(W_motor_in)
         W_electric = W_motor_in + W_vfd
 
@@ -100,4 +119,200 @@ class CurveSpeedControlledFan:
             "Q_to_air": Q_to_air,
             "h_out": h_out,
             "m_dot": m_dot,
-        }
\ No newline at end of file
+        }
+
+    def compute_batch(
+        self, rpm: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of fan speed and inlet enthalpy.
+
+        The operating point of every element is solved together with a
+        vectorized bracketed root find on the same [0.01, 20] m³/s bracket as
+        compute(). fan_curve and system_pressure_func are called on whole
+        arrays when they support it.
+
+        Args:
+            rpm (np.ndarray): Fan rotational speed (RPM).
+            h_in (np.ndarray): Inlet air enthalpy (J/kg).
+
+        Returns:
+            Dict[str, np.ndarray]: Same keys as compute(), one array each.
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import (
+            as_arrays,
+            divide_or_zero,
+            evaluate,
+            precision,
+            solve_bracketed,
+        )
+
+        rpm, h_in = as_arrays(rpm, h_in)
+
+        def residual(Q: np.ndarray) -> np.ndarray:
+            fan = evaluate(self.fan_curve, Q, rpm)
+            gap: np.ndarray = fan - evaluate(self.system_pressure_func, Q)
+            return gap
+
+        try:
+            # The root find always runs in float64; float32 residuals are too
+            # coarse to meet its tolerance
+            with precision(np.float64):
+                Q, converged, iterations = solve_bracketed(
+                    residual, np.full(rpm.shape, 0.01), np.full(rpm.shape, 20.0)
+                )
+        except ValueError:
+            record_solver(self, "illinois", 0, 0, rpm.size)
+            raise
+        n_converged = int(np.count_nonzero(converged))
+        record_solver(
+            self, "illinois", iterations, n_converged, converged.size - n_converged
+        )
+        if not converged.all():
+            raise RuntimeError("Fan flow solver did not converge.")
+        Q = Q.astype(rpm.dtype, copy=False)
+
+        delta_p_fan = evaluate(self.fan_curve, Q, rpm)
+        v_out = Q / self.area_outlet
+        p_velocity = 0.5 * self.rho * v_out**2
+        delta_p_static = delta_p_fan - p_velocity
+
+        W_shaft = Q * delta_p_fan / self.eta_fan
+        W_belt = evaluate(self.belt_loss_func, W_shaft)
+        W_motor_out = W_shaft + W_belt
+        W_motor_in = (
+            W_motor_out + evaluate(self.motor_loss_func, W_motor_out)
+        ) / self.eta_motor
+        W_vfd = evaluate(self.vfd_loss_func, W_motor_in)
+        W_electric = W_motor_in + W_vfd
+
+        m_dot = self.rho * Q
+        Q_to_air = self.f_motor_to_air * (W_electric - W_shaft - W_belt)
+        h_out = h_in + divide_or_zero(Q_to_air, m_dot)
+
+        return {
+            "Q": Q,
+            "RPM": rpm,
+            "v_out": v_out,
+            "DeltaP_fan": delta_p_fan,
+            "DeltaP_static": delta_p_static,
+            "W_shaft": W_shaft,
+            "W_belt": W_belt,
+            "W_motor_in": W_motor_in,
+            "W_vfd": W_vfd,
+            "W_electric": W_electric,
+            "Q_to_air": Q_to_air,
+            "h_out": h_out,
+            "m_dot": m_dot,
+        }
+
+    def jacobian(self, rpm: float, h_in: float) -> Dict[str, Dict[str, float]]:
+        """
+        Analytic partial derivatives of the key outputs w.r.t. fan speed.
+
+        The flow is solved as in compute(); its sensitivity follows from
+        implicit differentiation of fan_curve(Q, RPM) = system_pressure_func(Q)
+        at the solved operating point, without re-solving:
+
+            dQ/dRPM = -(∂fan_curve/∂RPM) / (∂fan_curve/∂Q - dsystem/dQ)
+
+        Args:
+            rpm (float): Fan rotational speed (RPM).
+            h_in (float): Inlet air enthalpy (J/kg).
+
+        Returns:
+            Dict[str, Dict[str, float]]: output → {input → ∂output/∂input} for
+                Q, DeltaP_fan, W_shaft, W_electric, Q_to_air, h_out and m_dot;
+                inputs an output does not depend on are omitted.
+        """
+        from energy_models.curves.curves import derivative
+
+        r = self.compute(rpm, h_in)
+        Q = r["Q"]
+        fan_q, fan_n = derivative(self.fan_curve, Q, rpm)
+        slopes = (
+            fan_q,
+            fan_n,
+            derivative(self.system_pressure_func, Q),
+            derivative(self.belt_loss_func, r["W_shaft"]),
+            derivative(self.motor_loss_func, r["W_shaft"] + r["W_belt"]),
+            derivative(self.vfd_loss_func, r["W_motor_in"]),
+        )
+        jac = self._chain(r, *slopes)
+        m_dot = r["m_dot"]
+        jac["h_out"] = (
+            {
+                "rpm": (jac["Q_to_air"]["rpm"] * Q - r["Q_to_air"] * jac["Q"]["rpm"])
+                / (m_dot * Q),
+                "h_in": 1.0,
+            }
+            if m_dot > 0
+            else {"h_in": 1.0}
+        )
+        return jac
+
+    def jacobian_batch(
+        self, rpm: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, Dict[str, np.ndarray]]":
+        """
+        Vectorized jacobian() over arrays of fan speed and inlet enthalpy.
+
+        Args:
+            rpm (np.ndarray): Fan rotational speed (RPM).
+            h_in (np.ndarray): Inlet air enthalpy (J/kg).
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: Same keys as jacobian(), one array each.
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import (
+            as_arrays,
+            derivative_batch,
+            divide_or_zero,
+        )
+
+        rpm, h_in = as_arrays(rpm, h_in)
+        r = self.compute_batch(rpm, h_in)
+        Q = r["Q"]
+        fan_q, fan_n = derivative_batch(self.fan_curve, Q, rpm)
+        (system_q,) = derivative_batch(self.system_pressure_func, Q)
+        (b,) = derivative_batch(self.belt_loss_func, r["W_shaft"])
+        (m,) = derivative_batch(self.motor_loss_func, r["W_shaft"] + r["W_belt"])
+        (v,) = derivative_batch(self.vfd_loss_func, r["W_motor_in"])
+        jac = self._chain(r, fan_q, fan_n, system_q, b, m, v)
+        jac["h_out"] = {
+            "rpm": divide_or_zero(
+                jac["Q_to_air"]["rpm"] * Q - r["Q_to_air"] * jac["Q"]["rpm"],
+                r["m_dot"] * Q,
+            ),
+            "h_in": np.ones_like(h_in),
+        }
+        return jac
+
+    def _chain(
+        self,
+        r: Dict[str, Any],
+        fan_q: Any,
+        fan_n: Any,
+        system_q: Any,
+        b: Any,
+        m: Any,
+        v: Any,
+    ) -> Dict[str, Dict[str, Any]]:
+        # Implicit derivative of the operating point, then the chain rule through
+        # shaft, belt (slope b), motor (slope m) and VFD (slope v)
+        d_Q = -fan_n / (fan_q - system_q)
+        d_fan = fan_q * d_Q + fan_n
+        d_shaft = (d_Q * r["DeltaP_fan"] + r["Q"] * d_fan) / self.eta_fan
+        electric = (1 + v) * (1 + m) * (1 + b) / self.eta_motor
+        return {
+            "Q": {"rpm": d_Q},
+            "DeltaP_fan": {"rpm": d_fan},
+            "W_shaft": {"rpm": d_shaft},
+            "W_electric": {"rpm": electric * d_shaft},
+            "Q_to_air": {"rpm": self.f_motor_to_air * (electric - 1 - b) * d_shaft},
+            "m_dot": {"rpm": self.rho * d_Q},
+        }
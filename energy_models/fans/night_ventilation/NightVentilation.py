@@ -1,7 +1,18 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class NightVentilationFan:
+    # Callables of t only (see batch.compute_by_day())
+    schedule_attributes = (
+        "flow_fraction_day",
+        "flow_fraction_night",
+        "availability_schedule",
+        "is_night_ventilation",
+    )
+
     def __init__(
         self,
         V_dot_design: float,
@@ -85,3 +96,49 @@ class NightVentilationFan:
             "Q_to_air": Q_to_air,
             "h_out": h_out,
         }
+
+    def compute_batch(
+        self, t: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of time and inlet enthalpy.
+
+        Args:
+            t (np.ndarray): Simulation time (in hours)
+            h_in (np.ndarray): Inlet air enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        t, h_in = as_arrays(t, h_in, exact=(0,))
+        available = evaluate(self.availability_schedule, t).astype(bool)
+        night = evaluate(self.is_night_ventilation, t).astype(bool)
+
+        flow_frac = np.where(
+            night,
+            evaluate(self.flow_fraction_night, t),
+            evaluate(self.flow_fraction_day, t),
+        )
+        flow_frac = np.where(available, np.clip(flow_frac, 0.0, 1.0), 0.0)
+        delta_p = np.where(night, self.delta_p_night, self.delta_p_day)
+
+        V_dot = flow_frac * self.V_dot_design
+        m_dot = self.rho * V_dot
+
+        W_shaft = (m_dot * delta_p) / (self.rho * self.eta_fan)
+        W_electric = (m_dot * delta_p) / (self.rho * self.eta_total)
+        Q_to_air = W_electric - W_shaft
+        h_out = h_in + divide_or_zero(Q_to_air, m_dot)
+
+        return {
+            "V_dot": V_dot,
+            "m_dot": m_dot,
+            "W_shaft": W_shaft,
+            "W_electric": W_electric,
+            "Q_to_air": Q_to_air,
+            "h_out": h_out,
+        }
@@ -1,4 +1,7 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class OnOffFan:
@@ -68,3 +71,39 @@ class OnOffFan:
             "h_out": h_out,
             "m_dot": m_dot,
         }
+
+    def compute_batch(
+        self, m_dot_requested: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of requested flow and inlet enthalpy.
+
+        Args:
+            m_dot_requested (np.ndarray): Requested air mass flow rate (kg/s)
+            h_in (np.ndarray): Inlet specific enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero
+
+        m_dot_requested, h_in = as_arrays(m_dot_requested, h_in)
+        R = np.clip(m_dot_requested / self.m_dot_design, 0.0, 1.0)
+        m_dot = R * self.m_dot_design
+
+        w_electric_avg = R * self.w_electric_design
+        w_shaft_avg = R * self.w_shaft_design
+        q_to_air = self.f_motor_to_air * (w_electric_avg - w_shaft_avg)
+
+        h_out = h_in + divide_or_zero(q_to_air, m_dot)
+
+        return {
+            "RuntimeFraction": R,
+            "W_electric_avg": w_electric_avg,
+            "W_shaft_avg": w_shaft_avg,
+            "Q_to_air": q_to_air,
+            "h_out": h_out,
+            "m_dot": m_dot,
+        }
@@ -1,4 +1,7 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class VariableVolumeFan:
@@ -63,3 +66,119 @@ class VariableVolumeFan:
             "Q_to_air": q_to_air,
             "h_out": h_out,
         }
+
+    def compute_batch(
+        self, m_dot: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of mass flow and inlet enthalpy.
+
+        Args:
+            m_dot (np.ndarray): Actual mass flow rate (kg/s)
+            h_in (np.ndarray): Inlet specific enthalpy (J/kg)
+
+        Returns:
+            "Dict[str, np.ndarray]": Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        m_dot, h_in = as_arrays(m_dot, h_in)
+        plr = np.clip(divide_or_zero(m_dot, self.m_dot_design), 0.0, 1.0)
+        p_frac = evaluate(self.power_curve, plr)
+
+        w_shaft = (m_dot * self.delta_p) / (self.rho * self.eta_fan)
+        w_electric = p_frac * self.w_electric_design
+        q_to_air = self.f_motor_to_air * (w_electric - w_shaft)
+        h_out = h_in + divide_or_zero(q_to_air, m_dot)
+
+        return {
+            "PLR": plr,
+            "P_frac": p_frac,
+            "W_shaft": w_shaft,
+            "W_electric": w_electric,
+            "Q_to_air": q_to_air,
+            "h_out": h_out,
+        }
+
+    def jacobian(self, m_dot: float, h_in: float) -> Dict[str, Dict[str, float]]:
+        """
+        Analytic partial derivatives of the key outputs at one operating point.
+
+        PLR is clamped to [0, 1], so outside 0 ≤ m_dot ≤ m_dot_design the
+        power curve no longer responds to the flow.
+
+        Args:
+            m_dot (float): Actual mass flow rate (kg/s)
+            h_in (float): Inlet specific enthalpy (J/kg)
+
+        Returns:
+            Dict[str, Dict[str, float]]: output → {input → ∂output/∂input} for
+            PLR, W_shaft, W_electric, Q_to_air and h_out; inputs an output
+            does not depend on are omitted
+        """
+        from energy_models.curves.curves import derivative
+
+        r = self.compute(m_dot, h_in)
+        inside = self.m_dot_design > 0 and 0.0 <= m_dot <= self.m_dot_design
+        d_plr = 1.0 / self.m_dot_design if inside else 0.0
+        d_frac = derivative(self.power_curve, r["PLR"]) * d_plr
+        jac = self._chain(d_plr, d_frac)
+        jac["h_out"] = (
+            {
+                "m_dot": (jac["Q_to_air"]["m_dot"] * m_dot - r["Q_to_air"]) / m_dot**2,
+                "h_in": 1.0,
+            }
+            if m_dot > 0
+            else {"h_in": 1.0}
+        )
+        return jac
+
+    def jacobian_batch(
+        self, m_dot: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, Dict[str, np.ndarray]]":
+        """
+        Vectorized jacobian() over arrays of mass flow and inlet enthalpy.
+
+        Args:
+            m_dot (np.ndarray): Actual mass flow rate (kg/s)
+            h_in (np.ndarray): Inlet specific enthalpy (J/kg)
+
+        Returns:
+            "Dict[str, Dict[str, np.ndarray]]": Same keys as jacobian(), one
+            array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import (
+            as_arrays,
+            derivative_batch,
+            divide_or_zero,
+        )
+
+        m_dot, h_in = as_arrays(m_dot, h_in)
+        r = self.compute_batch(m_dot, h_in)
+        inside = (m_dot >= 0.0) & (m_dot <= self.m_dot_design)
+        d_plr = np.where(inside, divide_or_zero(1.0, self.m_dot_design), 0.0)
+        d_plr = d_plr.astype(m_dot.dtype, copy=False)
+        (slope,) = derivative_batch(self.power_curve, r["PLR"])
+        jac = self._chain(d_plr, slope * d_plr)
+        jac["h_out"] = {
+            "m_dot": divide_or_zero(
+                jac["Q_to_air"]["m_dot"] * m_dot - r["Q_to_air"], m_dot**2
+            ),
+            "h_in": np.ones_like(h_in),
+        }
+        return jac
+
+    def _chain(self, d_plr: Any, d_frac: Any) -> Dict[str, Dict[str, Any]]:
+        # Derivatives with respect to m_dot, given those of PLR and P_frac
+        d_shaft = self.delta_p / (self.rho * self.eta_fan) + 0 * d_plr
+        d_electric = d_frac * self.w_electric_design
+        return {
+            "PLR": {"m_dot": d_plr},
+            "W_shaft": {"m_dot": d_shaft},
+            "W_electric": {"m_dot": d_electric},
+            "Q_to_air": {"m_dot": self.f_motor_to_air * (d_electric - d_shaft)},
+        }
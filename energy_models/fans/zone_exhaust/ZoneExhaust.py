@@ -1,7 +1,13 @@
-from typing import Callable, Dict
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ZoneExhaustFan:
+    # Callables of t only (see batch.compute_by_day())
+    schedule_attributes = ("flow_fraction_schedule", "availability_schedule")
+
     def __init__(
         self,
         V_dot_max: float,
@@ -70,3 +76,40 @@ class ZoneExhaustFan:
             "Q_to_air": Q_to_air,
             "h_out": h_out,
         }
+
+    def compute_batch(
+        self, t: "np.ndarray", h_in: "np.ndarray"
+    ) -> "Dict[str, np.ndarray]":
+        """
+        Vectorized compute() over arrays of time and inlet enthalpy.
+
+        Args:
+            t (np.ndarray): Current time (e.g., in hours)
+            h_in (np.ndarray): Inlet enthalpy (J/kg)
+
+        Returns:
+            dict: Same keys as compute(), one array each
+        """
+        import numpy as np
+
+        from energy_models.batch.batch import as_arrays, divide_or_zero, evaluate
+
+        t, h_in = as_arrays(t, h_in, exact=(0,))
+        available = evaluate(self.availability_schedule, t).astype(bool)
+        f_frac = np.clip(evaluate(self.flow_fraction_schedule, t), 0.0, 1.0)
+        V_dot = np.where(available, f_frac, 0.0) * self.V_dot_max
+        m_dot = self.rho * V_dot
+
+        W_shaft = (m_dot * self.delta_p) / (self.rho * self.eta_fan)
+        W_electric = (m_dot * self.delta_p) / (self.rho * self.eta_total)
+        Q_to_air = W_electric - W_shaft
+        h_out = h_in + divide_or_zero(Q_to_air, m_dot)
+
+        return {
+            "V_dot": V_dot,
+            "m_dot": m_dot,
+            "W_shaft": W_shaft,
+            "W_electric": W_electric,
+            "Q_to_air": Q_to_air,
+            "h_out": h_out,
+        }
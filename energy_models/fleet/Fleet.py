@@ -0,0 +1,198 @@
+import inspect
+from numbers import Real
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from energy_models.batch.batch import precision
+from energy_models.coils.cooling_water.CoolingWaterCoil import CoolingWaterCoil
+from energy_models.coils.heating_electric.HeatingElectricCoil import (
+    ElectricHeatingCoil,
+)
+from energy_models.coils.heating_steam.HeatingSteamCoil import SteamHeatingCoil
+from energy_models.coils.heating_water.HeatingWaterCoil import HeatingWaterCoil
+from energy_models.fans.component_model.ComponentFan import ComponentFan
+from energy_models.fans.constant_volume.ConstantVolumeFan import ConstantVolumeFan
+from energy_models.fans.night_ventilation.NightVentilation import (
+    NightVentilationFan,
+)
+from energy_models.fans.on_off.OnOffFan import OnOffFan
+from energy_models.fans.variable_volume.VariableVolumeFan import VariableVolumeFan
+from energy_models.fans.zone_exhaust.ZoneExhaust import ZoneExhaustFan
+
+
+def _is_numeric(value: Any) -> bool:
+    if isinstance(value, (Real, np.ndarray)):
+        return True
+    if isinstance(value, list):
+        return all(isinstance(v, Real) for v in value)
+    return False
+
+
+class ComponentFleet:
+    def __init__(
+        self,
+        *,
+        dtype: Any = np.float64,
+        outputs: Optional[Sequence[str]] = None,
+        **params: Any,
+    ):
+        """
+        N units of one component type, with per-unit numeric parameters.
+
+        Combined with a component class (e.g. ZoneExhaustFanFleet), every
+        numeric constructor argument may be a scalar shared by all units or an
+        array with one value per unit. They are stored once as contiguous
+        (N,) arrays in `params` and handed to the component as (N, 1)
+        columns, so the component's own batch arithmetic broadcasts them over
+        (units × timesteps). Callables (curves, schedules, loss functions) are
+        shared by all units.
+
+        For memory-bound runs, dtype=np.float32 stores the parameters and
+        evaluates in single precision (see the Fleet README for the accuracy
+        per component), and outputs keeps only the listed result keys.
+
+        Args:
+            dtype: np.float64 (default) or np.float32
+            outputs (Sequence[str], optional): Result keys compute() returns
+                (default all)
+            **params: Constructor arguments of the component, by keyword
+
+        Raises:
+            ValueError: If per-unit arrays disagree in length.
+        """
+        numeric = {k: v for k, v in params.items() if _is_numeric(v)}
+        lengths = {np.size(v) for v in numeric.values() if np.ndim(v) > 0}
+        if len(lengths) > 1:
+            raise ValueError(f"Per-unit parameters differ in length: {lengths}")
+        self.n_units = lengths.pop() if lengths else 1
+        self.dtype = np.dtype(dtype)
+        self.outputs = list(outputs) if outputs is not None else None
+        self.params: Dict[str, np.ndarray] = {
+            name: np.ascontiguousarray(
+                np.broadcast_to(np.asarray(value, dtype=self.dtype), (self.n_units,))
+            )
+            for name, value in numeric.items()
+        }
+        columns = {name: value[:, None] for name, value in self.params.items()}
+        super().__init__(**{**params, **columns})
+
+    def __len__(self) -> int:
+        return self.n_units
+
+    def compute(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Evaluate every unit, for one timestep or a block of timesteps.
+
+        Takes the arguments of the component's compute(). Each input may be
+        a scalar (shared by all units), a 1-D array of T timesteps (shared
+        timeseries), an (N, 1) column (one value per unit) or an (N, T) block.
+
+        Returns:
+            Dict[str, np.ndarray]: Same keys as the component's compute() (or
+            the selected outputs); (N,) arrays when every input is scalar,
+            (N, T) otherwise
+        """
+        base = self._component()
+        bound = inspect.signature(base.compute_batch).bind(self, *args, **kwargs)
+        inputs = {k: v for k, v in bound.arguments.items() if k != "self"}
+
+        scalar = all(np.ndim(v) == 0 for v in inputs.values())
+        shape: Tuple[int, ...] = np.broadcast_shapes(
+            (self.n_units, 1), *(np.shape(v) for v in inputs.values())
+        )
+        with precision(self.dtype):
+            result = base.compute_batch(self, **inputs)
+        if self.outputs is not None:
+            result = {key: result[key] for key in self.outputs}
+        out = {}
+        for key, value in result.items():
+            value = np.asarray(value)
+            if value.shape != shape:
+                value = np.broadcast_to(value, shape)
+            out[key] = value.reshape(self.n_units) if scalar else value
+        return out
+
+    compute_batch = compute
+
+    def unit(self, i: int) -> Any:
+        """
+        Build the scalar component for unit i, e.g. to check one unit.
+
+        Args:
+            i (int): Unit index
+
+        Returns:
+            Component instance with that unit's parameters
+        """
+        base = self._component()
+        names = list(inspect.signature(base.__init__).parameters)[1:]
+        kwargs = {
+            name: (
+                float(self.params[name][i])
+                if name in self.params
+                else self._shared(name)
+            )
+            for name in names
+        }
+        return base(**kwargs)
+
+    def _shared(self, name: str) -> Any:
+        if name == "pressure_coeffs":
+            return tuple(getattr(self, f"C{k}") for k in range(1, 7))
+        return getattr(self, name)
+
+    @classmethod
+    def _component(cls) -> Type[Any]:
+        # The component class this fleet is combined with
+        return next(
+            base
+            for base in cls.__mro__
+            if not issubclass(base, ComponentFleet) and hasattr(base, "compute_batch")
+        )
+
+
+# ---- 🔹 Fans ----
+
+
+class ConstantVolumeFanFleet(ComponentFleet, ConstantVolumeFan):
+    """ConstantVolumeFan units with per-unit delta_p, rho, efficiencies."""
+
+
+class OnOffFanFleet(ComponentFleet, OnOffFan):
+    """OnOffFan units with per-unit m_dot_design, delta_p, rho, efficiencies."""
+
+
+class VariableVolumeFanFleet(ComponentFleet, VariableVolumeFan):
+    """VariableVolumeFan units with per-unit m_dot_design, delta_p, rho, efficiencies."""
+
+
+class ZoneExhaustFanFleet(ComponentFleet, ZoneExhaustFan):
+    """ZoneExhaustFan units with per-unit V_dot_max, delta_p, rho, efficiencies."""
+
+
+class NightVentilationFanFleet(ComponentFleet, NightVentilationFan):
+    """NightVentilationFan units with per-unit design flow, pressures, efficiencies."""
+
+
+class ComponentFanFleet(ComponentFleet, ComponentFan):
+    """ComponentFan units with per-unit rho, area_outlet, efficiencies."""
+
+
+# ---- 🔹 Coils ----
+
+
+class CoolingWaterCoilFleet(ComponentFleet, CoolingWaterCoil):
+    """CoolingWaterCoil units with per-unit Q_rated, SHR, rho_air."""
+
+
+class HeatingWaterCoilFleet(ComponentFleet, HeatingWaterCoil):
+    """HeatingWaterCoil units with per-unit Q_rated, rho_air."""
+
+
+class ElectricHeatingCoilFleet(ComponentFleet, ElectricHeatingCoil):
+    """ElectricHeatingCoil units with per-unit q_nominal, eta, rho_air."""
+
+
+class SteamHeatingCoilFleet(ComponentFleet, SteamHeatingCoil):
+    """SteamHeatingCoil units with per-unit h_fg, cp_cond, subcooling, m_dot_max."""
@@ -0,0 +1,607 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components, reverse_cuthill_mckee
+from scipy.sparse.linalg import splu
+
+from energy_models.profiling.Profiler import record_solver
+
+ArrayLike = Union[float, np.ndarray]
+
+# Branch kinds
+_QUADRATIC = 0  # ΔP = k·Q·|Q| (pipes, fixed-k coils, valves)
+_PUMP = 1  # ΔP = -n²·H(Q/n)
+_CURVE = 2  # ΔP = sign(Q)·f(|Q|)
+
+# Linear resistance of a stopped pump behind its check valve (kPa/(m³/h)),
+# linear like a closed link in EPANET so that Newton does not creep towards
+# its zero flow by halving
+K_PUMP_OFF = 1.0e8
+
+# Branch flow a cold Newton start begins from (m³/h)
+Q_COLD = 1.0
+
+# Private attributes that define the network; the others are built by
+# compile() and solve()
+_TOPOLOGY = (
+    "_nodes",
+    "_node_index",
+    "_references",
+    "_branches",
+    "_branch_index",
+    "_valves",
+)
+
+
+class HydronicNetwork:
+    def __init__(
+        self,
+        rho: float = 998.0,
+        leakage: float = 1.0e-4,
+        tol: float = 1.0e-8,
+        max_iter: int = 50,
+        flow_tol: float = 1.0e-9,
+    ):
+        """
+        Closed-loop hydronic network of pumps, pipes, coils and control valves.
+
+        Branch flows and node pressures are solved with the Global Gradient
+        (Todini-Pilati) Newton method: branch flow corrections are eliminated
+        so every iteration solves one sparse, symmetric nodal system. Its
+        sparsity pattern depends on the topology only, so the node ordering
+        and CSC structure are computed once in compile() and reused for every
+        iteration, timestep and batch.
+
+        Units follow the valve models: flow in m³/h, pressure in kPa.
+
+        Args:
+            rho (float): Water density (kg/m³), used for mass flow outputs
+            leakage (float): Kv of a shut valve as a fraction of its kvs
+            tol (float): Relative flow tolerance for Newton convergence
+            max_iter (int): Maximum Newton iterations
+            flow_tol (float): Absolute flow tolerance (m³/h), which decides
+                convergence when all flows are near zero (very low speeds)
+        """
+        self.rho = rho
+        self.leakage = leakage
+        self.tol = tol
+        self.max_iter = max_iter
+        self.flow_tol = flow_tol
+
+        self._nodes: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        self._references: Dict[str, float] = {}
+        self._branches: List[Dict[str, Any]] = []
+        self._branch_index: Dict[str, int] = {}
+        self._valves: Dict[str, float] = {}
+        self._compiled = False
+        self._warm_start: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __getstate__(self) -> dict:
+        # Settings and topology only: the compiled structure and the warm
+        # start are rebuilt on demand, so pickles (and result cache
+        # fingerprints) do not change with every solve()
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.startswith("_") or key in _TOPOLOGY
+        }
+        state.update(_compiled=False, _warm_start=None)
+        return state
+
+    # -------------------------------
+    # 🔹 Topology
+    # -------------------------------
+
+    def _node(self, name: str) -> int:
+        if name not in self._node_index:
+            self._node_index[name] = len(self._nodes)
+            self._nodes.append(name)
+        return self._node_index[name]
+
+    def _add_branch(self, name: str, from_node: str, to_node: str, **spec: Any) -> None:
+        if name in self._branch_index:
+            raise ValueError(f"Duplicate branch name: {name}")
+        if from_node == to_node:
+            raise ValueError(f"Branch {name} connects node {from_node} to itself")
+        self._branch_index[name] = len(self._branches)
+        self._branches.append(
+            {
+                "name": name,
+                "from": self._node(from_node),
+                "to": self._node(to_node),
+                **spec,
+            }
+        )
+        self._compiled = False
+
+    def set_reference(self, node: str, pressure: float) -> None:
+        """
+        Fix the pressure of a node (expansion tank / pressurization point).
+
+        Args:
+            node (str): Node name
+            pressure (float): Fixed pressure (kPa)
+        """
+        self._node(node)
+        self._references[node] = pressure
+        self._compiled = False
+
+    def add_pipe(self, name: str, from_node: str, to_node: str, k: float) -> None:
+        """
+        Add a fixed quadratic resistance: ΔP = k·Q·|Q|.
+
+        Args:
+            name (str): Branch name
+            from_node (str): Upstream node
+            to_node (str): Downstream node
+            k (float): Resistance coefficient (kPa/(m³/h)²)
+        """
+        self._add_branch(name, from_node, to_node, kind=_QUADRATIC, k=k)
+
+    def add_coil(
+        self,
+        name: str,
+        from_node: str,
+        to_node: str,
+        coil: Any = None,
+        k: Optional[float] = None,
+    ) -> None:
+        """
+        Add a coil water side.
+
+        Either a fixed resistance k or a coil whose pressure_drop_curve_water
+        (m³/s → Pa, as in CoolingWaterCoil) is converted to kPa vs m³/h.
+
+        Args:
+            name (str): Branch name
+            from_node (str): Upstream node
+            to_node (str): Downstream node
+            coil (optional): Coil with a pressure_drop_curve_water callable
+            k (float, optional): Resistance coefficient (kPa/(m³/h)²)
+        """
+        if k is not None:
+            self._add_branch(name, from_node, to_node, kind=_QUADRATIC, k=k)
+            return
+        curve = getattr(coil, "pressure_drop_curve_water", None)
+        if curve is None:
+            raise ValueError(f"Coil {name} needs k or a pressure_drop_curve_water")
+        self._add_branch(
+            name,
+            from_node,
+            to_node,
+            kind=_CURVE,
+            curve=lambda Q: curve(Q / 3600.0) / 1000.0,
+        )
+
+    def add_pump(
+        self,
+        name: str,
+        from_node: str,
+        to_node: str,
+        head_curve: Callable[[ArrayLike], ArrayLike],
+        speed: float = 1.0,
+    ) -> None:
+        """
+        Add a pump scaled with the affinity laws: ΔP_rise = n²·H(Q/n).
+
+        A pump at speed 0 is treated as stopped behind a check valve.
+
+        Args:
+            name (str): Branch name
+            from_node (str): Suction node
+            to_node (str): Discharge node
+            head_curve (Callable): Pressure rise (kPa) vs flow (m³/h) at rated
+                speed, e.g. curve_quadratic() from curves.py
+            speed (float): Default speed ratio N / N_rated
+        """
+        self._add_branch(
+            name, from_node, to_node, kind=_PUMP, curve=head_curve, speed=speed
+        )
+
+    def add_valve(
+        self, name: str, from_node: str, to_node: str, valve: Any, x: float = 1.0
+    ) -> None:
+        """
+        Add a TwoWayControlValve: ΔP = (Q / Kv(x))².
+
+        Args:
+            name (str): Branch name, also the key for its position in solve()
+            from_node (str): Upstream node
+            to_node (str): Downstream node
+            valve (TwoWayControlValve): Valve model
+            x (float): Default valve position (0-1)
+        """
+        self._add_branch(
+            name,
+            from_node,
+            to_node,
+            kind=_QUADRATIC,
+            valve=name,
+            kv=valve.kv,
+            kv_min=self.leakage * valve.kvs,
+        )
+        self._valves[name] = x
+
+    def add_three_way_valve(
+        self,
+        name: str,
+        port_a: str,
+        port_b: str,
+        port_ab: str,
+        valve: Any,
+        x: float = 1.0,
+    ) -> None:
+        """
+        Add a ThreeWayControlValve as two branches, "<name>.A" and "<name>.B".
+
+        Both ports flow towards the common AB port (mixing duty).
+
+        Args:
+            name (str): Valve name, the key for its position in solve()
+            port_a (str): Node on the A port (coil side)
+            port_b (str): Node on the B port (bypass side)
+            port_ab (str): Node on the common AB port
+            valve (ThreeWayControlValve): Valve model
+            x (float): Default valve signal (0-1)
+        """
+        self._add_branch(
+            f"{name}.A",
+            port_a,
+            port_ab,
+            kind=_QUADRATIC,
+            valve=name,
+            kv=valve.kv_a,
+            kv_min=self.leakage * valve.kvs_a,
+        )
+        self._add_branch(
+            f"{name}.B",
+            port_b,
+            port_ab,
+            kind=_QUADRATIC,
+            valve=name,
+            kv=valve.kv_b,
+            kv_min=max(self.leakage * valve.kvs_b * valve.bypass_ratio, 1e-12),
+        )
+        self._valves[name] = x
+
+    # -------------------------------
+    # 🔹 Symbolic Analysis
+    # -------------------------------
+
+    def compile(self) -> None:
+        """
+        Check the topology and build the reusable sparse structure.
+
+        Raises:
+            ValueError: If there is no reference node, or a part of the network
+                is not connected to one.
+        """
+        if not self._references:
+            raise ValueError("Hydronic network needs at least one reference node")
+
+        n_all = len(self._nodes)
+        m = len(self._branches)
+        frm = np.array([b["from"] for b in self._branches], dtype=np.intp)
+        to = np.array([b["to"] for b in self._branches], dtype=np.intp)
+
+        graph = csr_matrix((np.ones(m), (frm, to)), shape=(n_all, n_all))
+        fixed = np.array([self._node_index[n] for n in self._references])
+        _, labels = connected_components(graph, directed=False)
+        floating = set(labels) - set(labels[fixed])
+        if floating:
+            names = [self._nodes[i] for i in range(n_all) if labels[i] in floating]
+            raise ValueError(f"Nodes not connected to a reference node: {names}")
+
+        # Unknown nodes, renumbered with reverse Cuthill-McKee to limit fill-in
+        free = np.setdiff1d(np.arange(n_all), fixed)
+        local = np.full(n_all, -1, dtype=np.intp)
+        local[free] = np.arange(free.size)
+        both = (local[frm] >= 0) & (local[to] >= 0)
+        n = free.size
+        pattern = csr_matrix(
+            (
+                np.ones(2 * both.sum() + n),
+                (
+                    np.concatenate([local[frm][both], local[to][both], np.arange(n)]),
+                    np.concatenate([local[to][both], local[frm][both], np.arange(n)]),
+                ),
+            ),
+            shape=(n, n),
+        )
+        order = reverse_cuthill_mckee(pattern, symmetric_mode=True)
+        rank = np.empty(n, dtype=np.intp)
+        rank[order] = np.arange(n)
+        local[free] = rank[local[free]]
+        self._free_nodes = free[order]
+        self._fixed_nodes = fixed
+        self._p_fixed = np.array([self._references[self._nodes[i]] for i in fixed])
+
+        # Incidence of unknown nodes: +1 leaving, -1 entering
+        lf, lt = local[frm], local[to]
+        rows = np.concatenate([lf[lf >= 0], lt[lt >= 0]])
+        cols = np.concatenate([np.nonzero(lf >= 0)[0], np.nonzero(lt >= 0)[0]])
+        vals = np.concatenate([np.ones((lf >= 0).sum()), -np.ones((lt >= 0).sum())])
+        self._A = csr_matrix((vals, (rows, cols)), shape=(n, m))
+        self._AT = self._A.T.tocsr()
+
+        # Incidence of fixed nodes, for their known contribution to ΔP
+        fixed_local = np.full(n_all, -1, dtype=np.intp)
+        fixed_local[fixed] = np.arange(fixed.size)
+        ff, ft = fixed_local[frm], fixed_local[to]
+        rows = np.concatenate([np.nonzero(ff >= 0)[0], np.nonzero(ft >= 0)[0]])
+        cols = np.concatenate([ff[ff >= 0], ft[ft >= 0]])
+        vals = np.concatenate([np.ones((ff >= 0).sum()), -np.ones((ft >= 0).sum())])
+        self._dp_fixed = csr_matrix((vals, (rows, cols)), shape=(m, fixed.size)) @ (
+            self._p_fixed
+        )
+
+        # CSC structure of L = A·diag(c)·Aᵀ and the scatter map branch → entry
+        entries_r = np.concatenate([lf, lt, lf, lt])
+        entries_c = np.concatenate([lf, lt, lt, lf])
+        sign = np.concatenate([np.ones(m), np.ones(m), -np.ones(m), -np.ones(m)])
+        keep = (entries_r >= 0) & (entries_c >= 0)
+        src = np.tile(np.arange(m), 4)[keep]
+        key = entries_c[keep] * n + entries_r[keep]  # column-major
+        unique_keys, slot = np.unique(key, return_inverse=True)
+        self._L_indices = (unique_keys % n).astype(np.int32)
+        self._L_indptr = np.searchsorted(unique_keys // n, np.arange(n + 1)).astype(
+            np.int32
+        )
+        self._L_slot = slot
+        self._L_src = src
+        self._L_sign = sign[keep]
+        self._n, self._m = n, m
+        self._block_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+        self._quad = np.array(
+            [i for i, b in enumerate(self._branches) if b["kind"] == _QUADRATIC],
+            dtype=np.intp,
+        )
+        self._warm_start = None
+        self._compiled = True
+
+    def _block_structure(self, s: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Block-diagonal CSC structure for s independent scenarios
+        if s not in self._block_cache:
+            nnz = self._L_indices.size
+            indices = (
+                self._L_indices[None, :] + self._n * np.arange(s)[:, None]
+            ).ravel()
+            indptr = np.concatenate(
+                [
+                    (
+                        self._L_indptr[:-1][None, :] + nnz * np.arange(s)[:, None]
+                    ).ravel(),
+                    [nnz * s],
+                ]
+            )
+            self._block_cache[s] = (indices.astype(np.int32), indptr.astype(np.int32))
+        return self._block_cache[s]
+
+    # -------------------------------
+    # 🔹 Solve
+    # -------------------------------
+
+    def _resistances(self, positions: Dict[str, ArrayLike], s: int) -> np.ndarray:
+        # k for every quadratic branch, shape (s, n_quadratic)
+        k = np.empty((s, self._quad.size))
+        for j, i in enumerate(self._quad):
+            b = self._branches[i]
+            if "kv" not in b:
+                k[:, j] = b["k"]
+                continue
+            x = positions.get(b["valve"], self._valves[b["valve"]])
+            kv = b["kv"](np.asarray(x, dtype=float))
+            k[:, j] = 1.0 / np.maximum(kv, b["kv_min"]) ** 2
+        return k
+
+    def _losses(
+        self, Q: np.ndarray, k: np.ndarray, speeds: Dict[str, ArrayLike]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Branch pressure loss φ(Q) and its derivative, shape (s, m)
+        phi = np.empty_like(Q)
+        dphi = np.empty_like(Q)
+        # Linearize quadratic losses around a small flow instead of Q = 0
+        q_eps = 1e-6 * max(float(np.max(np.abs(Q))), 1.0)
+
+        Qq = Q[:, self._quad]
+        phi[:, self._quad] = k * Qq * np.abs(Qq)
+        dphi[:, self._quad] = 2.0 * k * np.maximum(np.abs(Qq), q_eps)
+
+        for i, b in enumerate(self._branches):
+            if b["kind"] == _QUADRATIC:
+                continue
+            q = Q[:, i]
+            h = 1e-6 * np.maximum(np.abs(q), 1.0)
+            if b["kind"] == _PUMP:
+                n = np.broadcast_to(
+                    np.asarray(speeds.get(b["name"], b["speed"]), dtype=float),
+                    q.shape,
+                )
+                on = n > 0
+                n_safe = np.where(on, n, 1.0)
+                curve = b["curve"]
+                rise = n_safe**2 * curve(q / n_safe)
+                # d/dQ n²·H(Q/n) = n·H'(Q/n)
+                slope = (
+                    n_safe**2
+                    * (curve((q + h) / n_safe) - curve((q - h) / n_safe))
+                    / (2 * h)
+                )
+                phi[:, i] = np.where(on, -rise, K_PUMP_OFF * q)
+                dphi[:, i] = np.where(on, -slope, K_PUMP_OFF)
+            else:
+                curve = b["curve"]
+                aq = np.abs(q)
+                phi[:, i] = np.sign(q) * curve(aq)
+                dphi[:, i] = (curve(aq + h) - curve(np.maximum(aq - h, 0.0))) / (
+                    aq + h - np.maximum(aq - h, 0.0)
+                )
+        return phi, np.maximum(dphi, 1e-9)
+
+    def solve(
+        self,
+        positions: Optional[Dict[str, ArrayLike]] = None,
+        speeds: Optional[Dict[str, ArrayLike]] = None,
+        chunk_size: int = 1024,
+    ) -> Dict[str, Any]:
+        """
+        Solve branch flows and node pressures.
+
+        Positions and speeds may be scalars or 1-D arrays (one entry per
+        scenario, e.g. per timestep); arrays are broadcast together and
+        solved as a block-diagonal batch, chunk_size scenarios at a time.
+        Scalar solves warm-start from the previous solution.
+
+        Args:
+            positions (dict, optional): Valve name → position (0-1)
+            speeds (dict, optional): Pump name → speed ratio
+            chunk_size (int): Scenarios per batched factorization
+
+        Returns:
+            dict: {
+                "V_dot": {branch: flow (m³/h)},
+                "m_dot": {branch: mass flow (kg/s)},
+                "delta_p": {branch: p_from - p_to (kPa)},
+                "p": {node: pressure (kPa)},
+                "iterations": Newton iterations used,
+            }
+
+        Raises:
+            RuntimeError: If the Newton iteration does not converge.
+        """
+        if not self._compiled:
+            self.compile()
+        positions = positions or {}
+        speeds = speeds or {}
+
+        inputs = list(positions.values()) + list(speeds.values())
+        scalar = all(np.ndim(v) == 0 for v in inputs)
+        s = 1 if scalar else np.broadcast_shapes(*(np.shape(v) for v in inputs))[0]
+
+        Q = np.empty((s, self._m))
+        p = np.empty((s, self._n))
+        iterations = 0
+        for start in range(0, s, chunk_size):
+            stop = min(start + chunk_size, s)
+            sl = slice(start, stop)
+            pos = {
+                key: v if np.ndim(v) == 0 else np.asarray(v, dtype=float)[sl]
+                for key, v in positions.items()
+            }
+            spd = {
+                key: v if np.ndim(v) == 0 else np.asarray(v, dtype=float)[sl]
+                for key, v in speeds.items()
+            }
+            Q[sl], p[sl], it = self._newton(pos, spd, stop - start, scalar)
+            iterations = max(iterations, it)
+
+        # Assemble all node pressures, including the fixed ones
+        p_all = np.empty((s, len(self._nodes)))
+        p_all[:, self._free_nodes] = p
+        p_all[:, self._fixed_nodes] = self._p_fixed
+        frm = [b["from"] for b in self._branches]
+        to = [b["to"] for b in self._branches]
+        delta_p = p_all[:, frm] - p_all[:, to]
+
+        def unpack(a: np.ndarray) -> ArrayLike:
+            return float(a[0]) if scalar else a
+
+        return {
+            "V_dot": {b["name"]: unpack(Q[:, i]) for i, b in enumerate(self._branches)},
+            "m_dot": {
+                b["name"]: unpack(self.rho * Q[:, i] / 3600)
+                for i, b in enumerate(self._branches)
+            },
+            "delta_p": {
+                b["name"]: unpack(delta_p[:, i]) for i, b in enumerate(self._branches)
+            },
+            "p": {name: unpack(p_all[:, i]) for i, name in enumerate(self._nodes)},
+            "iterations": iterations,
+        }
+
+    def _idle(self, speeds: Dict[str, ArrayLike], s: int) -> np.ndarray:
+        # Scenarios without any driving head: every pump stopped and all
+        # reference nodes at one pressure, so every flow is exactly zero
+        idle = np.full(s, np.ptp(self._p_fixed) == 0.0)
+        for b in self._branches:
+            if b["kind"] == _PUMP:
+                n = np.asarray(speeds.get(b["name"], b["speed"]), dtype=float)
+                idle &= np.broadcast_to(n <= 0, (s,))
+        return idle
+
+    def _newton(
+        self,
+        positions: Dict[str, ArrayLike],
+        speeds: Dict[str, ArrayLike],
+        s: int,
+        warm: bool,
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        idle = self._idle(speeds, s)
+        if idle.any():
+            # Newton would only halve the flows of a network at rest on every
+            # step; its solution is known, so only the others are iterated
+            Q = np.zeros((s, self._m))
+            p = np.full((s, self._n), self._p_fixed[0])
+            iterations = 0
+            busy = ~idle
+            if busy.any():
+
+                def pick(values: Dict[str, ArrayLike]) -> Dict[str, ArrayLike]:
+                    return {
+                        key: v if np.ndim(v) == 0 else np.asarray(v)[busy]
+                        for key, v in values.items()
+                    }
+
+                Q[busy], p[busy], iterations = self._newton(
+                    pick(positions), pick(speeds), int(busy.sum()), warm
+                )
+            return Q, p, iterations
+
+        k = self._resistances(positions, s)
+        Q = np.full((s, self._m), Q_COLD)
+        p = np.zeros((s, self._n))
+        if self._warm_start is not None:
+            # Quadratic losses linearized at (nearly) no flow overshoot by
+            # orders of magnitude, so branches that were stopped restart cold
+            Q_warm = self._warm_start[0]
+            Q[:] = np.where(np.abs(Q_warm) > 1e-3 * Q_COLD, Q_warm, Q_COLD)
+            p[:] = self._warm_start[1]
+        indices, indptr = self._block_structure(s)
+        nnz = self._L_indices.size
+        slots = (self._L_slot[None, :] + nnz * np.arange(s)[:, None]).ravel()
+
+        for iteration in range(1, self.max_iter + 1):
+            phi, dphi = self._losses(Q, k, speeds)
+            c = 1.0 / dphi
+            # Branch residual F1 = φ(Q) - ΔP(p), continuity residual F2 = A·Q
+            F1 = phi - (self._AT @ p.T).T - self._dp_fixed
+            F2 = (self._A @ Q.T).T
+            rhs = (self._A @ (c * F1).T).T - F2
+
+            weights = (c[:, self._L_src] * self._L_sign).ravel()
+            data = np.bincount(slots, weights=weights, minlength=nnz * s)
+            L = csc_matrix((data, indices, indptr), shape=(self._n * s, self._n * s))
+            lu = splu(
+                L,
+                permc_spec="NATURAL",
+                diag_pivot_thresh=0.0,
+                options={"SymmetricMode": True},
+            )
+            dp = lu.solve(rhs.ravel()).reshape(s, self._n)
+            dQ = c * ((self._AT @ dp.T).T - F1)
+
+            Q += dQ
+            p += dp
+            q_scale = np.max(np.abs(Q), axis=1)
+            limit = self.tol * q_scale + self.flow_tol
+            if np.all(np.max(np.abs(dQ), axis=1) <= limit):
+                if warm:
+                    self._warm_start = (Q.copy(), p.copy())
+                record_solver(self, "newton", iteration, s)
+                return Q, p, iteration
+
+        record_solver(self, "newton", self.max_iter, 0, s)
+        raise RuntimeError("Hydronic network solver did not converge.")
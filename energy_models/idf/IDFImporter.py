@@ -0,0 +1,827 @@
+import hashlib
+import inspect
+import json
+import math
+import os
+import shutil
+import string
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Bumped whenever the parsed layout changes, so stale caches are ignored
+_CACHE_VERSION = 3
+_BLOCK = 1 << 20
+_AUTO = ("AUTOSIZE", "AUTOCALCULATE")
+# Object name as written in the file and its byte span [start, end)
+_Span = Tuple[str, int, int]
+
+
+class IDFImporter:
+    def __init__(
+        self,
+        path: str,
+        cache_dir: Optional[str] = None,
+        rho_air: float = 1.2,
+        defaults: Optional[Dict[str, Any]] = None,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """
+        Build energy_models components from an EnergyPlus IDF file.
+
+        The file is streamed once in 1 MB blocks: the blocks are hashed and
+        split into objects in the same pass. Objects are indexed by class and
+        name (both case-insensitive, as in EnergyPlus) with their byte span
+        in the file, and their fields are read from the file when an object
+        is first used. The index is cached in cache_dir under the file's
+        content hash, one small file per IDF class. A file whose size and
+        modification time are unchanged is not even re-read: a reload reads
+        one pointer file, and then only the index files of the classes that
+        are looked up (curves, schedules, fans, coils), never those of the
+        geometry that makes up most of a large IDF.
+
+        Args:
+            path (str): IDF file; it must not change while the importer is
+                in use, since objects are read from it on demand
+            cache_dir (str, optional): Cache directory; default
+                ~/.cache/energy_models/idf, "" disables caching
+            rho_air (float): Air density (kg/m³) passed to the components
+            defaults (dict, optional): Constructor arguments the IDF does not
+                provide, e.g. {"cap_temp_curve": ...}; applied to every
+                component that accepts them
+            overrides (dict, optional): Object name → constructor arguments,
+                taking precedence over the IDF (e.g. for autosized fields)
+        """
+        self.path = path
+        self.cache_dir = (
+            os.path.join(os.path.expanduser("~"), ".cache", "energy_models", "idf")
+            if cache_dir is None
+            else cache_dir
+        )
+        self.rho_air = rho_air
+        self.defaults = dict(defaults or {})
+        self.overrides = {k.upper(): v for k, v in (overrides or {}).items()}
+        # Class → {NAME: (name, start, end)}, filled from the cache on demand
+        self._index: Dict[str, Dict[str, _Span]] = {}
+        self._complete = False
+        self._entry: Optional[str] = None
+        self.digest = self._load()
+        self._built: Dict[Tuple[str, str], Any] = {}
+
+    # ---- 🔹 Parsing and Caching ----
+
+    def _load(self) -> str:
+        if not self.cache_dir:
+            return self._parse()
+        # Pointer from path, size and mtime to the content hash: an unchanged
+        # file is neither hashed nor parsed again
+        stat = os.stat(self.path)
+        key = f"{os.path.abspath(self.path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        pointer = hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".ref"
+        # The cache directory may be shared, so its files are plain JSON (no
+        # pickle: loading a planted file must not run code) and a pointer
+        # must name a content hash, not an arbitrary path
+        try:
+            with open(os.path.join(self.cache_dir, pointer)) as f:
+                digest = f.read().strip()
+            if len(digest) == 32 and set(digest) <= set(string.hexdigits):
+                entry = os.path.join(self.cache_dir, f"{digest}.v{_CACHE_VERSION}")
+                if os.path.isdir(entry):
+                    self._entry = entry
+                    return digest
+        except OSError:
+            # Missing or unreadable pointer: parse the file again
+            pass
+
+        digest = self._parse()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._store(os.path.join(self.cache_dir, f"{digest}.v{_CACHE_VERSION}"))
+        self._write(pointer, digest.encode())
+        return digest
+
+    def _store(self, entry: str) -> None:
+        # One JSON file per class, written into a private directory that is
+        # renamed into place, so readers never see a partial index
+        if os.path.isdir(entry):
+            return
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        try:
+            for idf_class, objects in self._index.items():
+                with open(os.path.join(tmp, _class_file(idf_class)), "w") as f:
+                    json.dump([_CACHE_VERSION, objects], f, ensure_ascii=False)
+            os.rename(tmp, entry)
+        except OSError:
+            # Stored by another process meanwhile, or not writable
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _write(self, name: str, data: bytes) -> None:
+        # Atomic replace, so concurrent readers never see a partial file
+        target = os.path.join(self.cache_dir, name)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+
+    def _parse(self) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        index: Dict[str, Dict[str, _Span]] = {}
+        for text, start, end in _spans(self._blocks(digest)):
+            head = [f.decode("utf-8", errors="replace") for f in _head(text)]
+            idf_class = head[0].upper()
+            if idf_class:
+                name = head[1] if len(head) > 1 else ""
+                index.setdefault(idf_class, {})[name.upper()] = (name, start, end)
+        self._index = index
+        self._complete = True
+        return digest.hexdigest()
+
+    def _blocks(self, digest: Any) -> Iterator[Tuple[int, bytes]]:
+        # (offset in the file, whole lines) blocks
+        with open(self.path, "rb") as f:
+            offset = 0
+            tail = b""
+            while True:
+                block = f.read(_BLOCK)
+                if not block:
+                    break
+                digest.update(block)
+                # Split at the last newline so no line straddles two blocks
+                head, newline, rest = (tail + block).rpartition(b"\n")
+                tail = rest
+                if newline:
+                    yield offset, head
+                    offset += len(head) + 1
+            if tail:
+                yield offset, tail
+
+    def _objects_of(self, idf_class: str) -> Dict[str, _Span]:
+        # Index of one class, read from the cache on first use
+        if idf_class not in self._index and self._entry and not self._complete:
+            try:
+                with open(
+                    os.path.join(self._entry, _class_file(idf_class)), encoding="utf-8"
+                ) as f:
+                    version, objects = json.load(f)
+                if version != _CACHE_VERSION or not isinstance(objects, dict):
+                    raise ValueError(f"Outdated IDF index for {idf_class}")
+                self._index[idf_class] = {
+                    name: (span[0], int(span[1]), int(span[2]))
+                    for name, span in objects.items()
+                }
+            except FileNotFoundError:
+                # No object of this class in the file
+                self._index[idf_class] = {}
+            except (OSError, ValueError, TypeError, IndexError):
+                # Damaged cache: index the whole file again
+                self._parse()
+        return self._index.get(idf_class, {})
+
+    def _find(self, idf_class: str, name: str) -> Optional[List[str]]:
+        # Fields of one object, starting with its name, read from the file
+        span = self._objects_of(idf_class).get(name.upper())
+        if span is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(span[1])
+            text = f.read(span[2] - span[1]).decode("utf-8", errors="replace")
+        return next(_objects(iter([text])))[1:]
+
+    # ---- 🔹 Lookup ----
+
+    def fields(self, idf_class: str, name: str) -> List[str]:
+        """
+        Fields of one object, starting with its name.
+
+        Raises:
+            KeyError: If no such object exists.
+        """
+        fields = self._find(idf_class.upper(), name)
+        if fields is None:
+            raise KeyError(f"No {idf_class} named {name!r} in {self.path}")
+        return fields
+
+    def names(self, idf_class: str) -> List[str]:
+        """Names of all objects of an IDF class, as written in the file."""
+        return [span[0] for span in self._objects_of(idf_class.upper()).values()]
+
+    def curve(self, name: str) -> Callable[..., float]:
+        """
+        Curve object by name, as a curve from energy_models.curves.
+
+        Raises:
+            KeyError: If no supported curve has that name.
+        """
+        for idf_class, build in _CURVES.items():
+            fields = self._find(idf_class, name)
+            if fields is not None:
+                curve: Callable[..., float] = self._cached(
+                    idf_class, name, partial(build, fields)
+                )
+                return curve
+        raise KeyError(f"No supported curve named {name!r} in {self.path}")
+
+    def schedule(self, name: str) -> Callable[[float], float]:
+        """
+        Schedule by name as a value function of time (h); blank is always 1.
+
+        Supports Schedule:Constant, Schedule:Day:Hourly and Schedule:Compact
+        with one Through: period.
+
+        Raises:
+            KeyError: If no supported schedule has that name.
+        """
+        if not name:
+            return lambda t: 1.0
+        for idf_class, build in _SCHEDULES.items():
+            fields = self._find(idf_class, name)
+            if fields is not None:
+                schedule: Callable[[float], float] = self._cached(
+                    idf_class, name, partial(build, fields)
+                )
+                return schedule
+        raise KeyError(f"No supported schedule named {name!r} in {self.path}")
+
+    def availability(self, name: str) -> Callable[[float], bool]:
+        """Availability schedule by name: value > 0; blank is always available."""
+        if not name:
+            return lambda t: True
+        from energy_models.scheduler.Scheduler import make_availability_schedule
+
+        schedule = self.schedule(name)
+        scheduler = getattr(schedule, "scheduler", None)
+        if scheduler is not None:
+            return make_availability_schedule(scheduler, threshold=0.0)
+        return lambda t: schedule(t) > 0.0
+
+    # ---- 🔹 Components ----
+
+    def component(self, name: str, idf_class: Optional[str] = None) -> Any:
+        """
+        Build the supported component with this name.
+
+        Args:
+            name (str): Object name
+            idf_class (str, optional): IDF class, e.g. "Fan:VariableVolume",
+                if names are not unique across classes
+
+        Raises:
+            KeyError: If no supported component has that name.
+            ValueError: If a required value is autosized or missing and not
+                given in defaults or overrides.
+        """
+        classes = [idf_class.upper()] if idf_class else list(_COMPONENTS)
+        for c in classes:
+            fields = self._find(c, name) if c in _COMPONENTS else None
+            if fields is not None:
+                return self._cached(c, name, partial(self._build, c, fields))
+        raise KeyError(f"No supported component named {name!r} in {self.path}")
+
+    def components(self, idf_class: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build every supported component, or those of one IDF class.
+
+        Returns:
+            dict: Object name → component
+        """
+        classes = [idf_class.upper()] if idf_class else list(_COMPONENTS)
+        return {
+            name: self.component(name, c) for c in classes for name in self.names(c)
+        }
+
+    def _cached(self, idf_class: str, name: str, build: Callable[[], Any]) -> Any:
+        key = (idf_class, name.upper())
+        if key not in self._built:
+            self._built[key] = build()
+        return self._built[key]
+
+    def _build(self, idf_class: str, fields: List[str]) -> Any:
+        cls, mapping = _COMPONENTS[idf_class]
+        component = _import(cls)
+        name = fields[0]
+        kwargs = mapping(self, _Fields(fields, idf_class))
+        accepted = inspect.signature(component).parameters
+        for key, value in self.defaults.items():
+            if key in accepted and kwargs.get(key) is None:
+                kwargs[key] = value
+        kwargs.update(self.overrides.get(name.upper(), {}))
+        missing = [
+            key
+            for key, p in accepted.items()
+            if p.default is inspect.Parameter.empty and kwargs.get(key) is None
+        ]
+        if missing:
+            raise ValueError(
+                f"{idf_class} {name!r} needs {missing}; pass them in defaults "
+                "or overrides"
+            )
+        return component(**{k: v for k, v in kwargs.items() if v is not None})
+
+
+# -------------------------------
+# 🔹 Tokenizer
+# -------------------------------
+
+
+def _spans(blocks: Iterator[Tuple[int, bytes]]) -> Iterator[Tuple[bytes, int, int]]:
+    # Text of every object with its byte span in the file, found by its
+    # terminating ";" alone: only the few lines holding a ";" are looked at,
+    # to skip those inside a comment. _objects() tokenizes the span when the
+    # object is used; leading comments and blank lines in it are harmless
+    pending = b""
+    start = 0
+    for offset, block in blocks:
+        begin = 0
+        end = block.find(b";")
+        while end >= 0:
+            line = block.rfind(b"\n", 0, end) + 1
+            if block.find(b"!", line, end) < 0:
+                yield pending + block[begin:end], start, offset + end + 1
+                pending = b""
+                begin = end + 1
+                start = offset + begin
+            end = block.find(b";", end + 1)
+        # Blocks end at a newline, which _blocks() leaves out
+        pending += block[begin:] + b"\n"
+
+
+def _head(text: bytes) -> List[bytes]:
+    # Class and name of an object: its code up to the second ","
+    code = b""
+    pos = 0
+    while code.count(b",") < 2 and pos <= len(text):
+        newline = text.find(b"\n", pos)
+        newline = len(text) if newline < 0 else newline
+        code += text[pos:newline].partition(b"!")[0]
+        pos = newline + 1
+    return [field.strip() for field in code.split(b",", 2)[:2]]
+
+
+def _class_file(idf_class: str) -> str:
+    # Class names hold ":" and may hold other characters unfit for file names
+    return hashlib.blake2b(idf_class.encode(), digest_size=8).hexdigest() + ".json"
+
+
+def _objects(blocks: Iterator[str]) -> Iterator[List[str]]:
+    # Objects end with ";" and fields are separated by ","; "!" starts a
+    # comment that runs to the end of the line
+    pending: List[str] = []
+    for block in blocks:
+        for line in block.splitlines():
+            code = line.partition("!")[0]
+            if not code or code.isspace():
+                continue
+            if ";" not in code:
+                pending.append(code)
+                continue
+            *complete, rest = code.split(";")
+            for piece in complete:
+                pending.append(piece)
+                yield [f.strip() for f in "".join(pending).split(",")]
+                pending = []
+            if rest and not rest.isspace():
+                pending.append(rest)
+
+
+class _Fields:
+    # Field access by EnergyPlus field index (0 = Name) with blank defaults
+    def __init__(self, fields: List[str], idf_class: str):
+        self.fields = fields
+        self.idf_class = idf_class
+
+    def text(self, i: int) -> str:
+        return self.fields[i] if i < len(self.fields) else ""
+
+    def number(self, i: int, default: Optional[float] = None) -> Optional[float]:
+        value = self.text(i)
+        if not value:
+            return default
+        if value.upper() in _AUTO:
+            # Left to defaults/overrides; _build reports it if still missing
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(
+                f"{self.idf_class} {self.fields[0]!r}: field {i} is not a number: "
+                f"{value!r}"
+            ) from None
+
+    def factor(self, i: int) -> float:
+        # Sizing factors: blank is 1
+        return self.number(i) or 1.0
+
+    def numbers(self, *indices: int) -> Optional[Tuple[float, ...]]:
+        # All of the fields, or None if any is blank or autosized
+        values = [self.number(i) for i in indices]
+        return None if None in values else tuple(v or 0.0 for v in values)
+
+
+def _import(path: str) -> Any:
+    import importlib
+
+    module, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(module), name)
+
+
+def _coefficients(fields: List[str], n: int) -> Tuple[float, ...]:
+    # Blank coefficients are 0
+    values = _Fields(fields, "Curve")
+    return tuple(values.number(1 + i) or 0.0 for i in range(n))
+
+
+# -------------------------------
+# 🔹 Curves
+# -------------------------------
+
+
+def _curve_bicubic(fields: List[str]) -> Callable:
+    # EnergyPlus orders the ten terms 1, x, x², y, y², xy, x³, y³, x²y, xy²
+    from energy_models.curves.curves import curve_bicubic
+
+    c = _coefficients(fields, 10)
+    return curve_bicubic(
+        (c[0], c[1], c[2], c[6], c[3], c[4], c[7], c[5], c[8], c[9], 0.0, 0.0, 0.0)
+    )
+
+
+def _curve_cubic_linear(fields: List[str]) -> Callable:
+    # (C1 + C2·x + C3·x² + C4·x³) + (C5 + C6·x)·y
+    from energy_models.curves.curves import curve_cubic_linear
+
+    c = _coefficients(fields, 6)
+    return curve_cubic_linear((c[0], c[1], c[2], c[3], c[4], c[5], 0.0, 0.0))
+
+
+def _curve_fan_pressure_rise(fields: List[str]) -> Callable:
+    return _fan_pressure_curve(_fan_pressure_coeffs(fields, "Curve:FanPressureRise"))
+
+
+def _fan_pressure_coeffs(
+    fields: List[str], name: str
+) -> Tuple[float, float, float, float, float, float]:
+    # EnergyPlus: ΔP = C1·Q² + C2·Q + C3·Q·√(Psm - Po) + C4·(Psm - Po), mapped
+    # onto ComponentFan's C1 + C2·Q + C3·Q² + C4·dP + C5·dP² + C6·Q·dP
+    c = _coefficients(fields, 4)
+    if c[2] != 0.0:
+        raise ValueError(
+            f"{name} {fields[0]!r}: the Q·√(Psm - Po) term (C3) has no equivalent "
+            "in the ComponentFan pressure model"
+        )
+    return (0.0, c[1], c[0], c[3], 0.0, 0.0)
+
+
+def _fan_pressure_curve(
+    coeffs: Tuple[float, float, float, float, float, float],
+) -> Callable:
+    from energy_models.curves.curves import curve_fan_pressure_rise
+
+    return curve_fan_pressure_rise(coeffs)
+
+
+def _factory(name: str, n: int, packed: bool = False) -> Callable[[List[str]], Any]:
+    def build(fields: List[str]) -> Any:
+        factory = _import(f"energy_models.curves.curves.{name}")
+        c = _coefficients(fields, n)
+        return factory(c) if packed else factory(*c)
+
+    return build
+
+
+_CURVES: Dict[str, Callable[[List[str]], Callable]] = {
+    "CURVE:LINEAR": _factory("curve_linear", 2),
+    "CURVE:QUADRATIC": _factory("curve_quadratic", 3),
+    "CURVE:CUBIC": _factory("curve_cubic", 4),
+    "CURVE:QUARTIC": _factory("curve_quartic", 5),
+    "CURVE:EXPONENT": _factory("curve_exponent", 3),
+    "CURVE:QUADRATICLINEAR": _factory("curve_quadratic_linear", 6, packed=True),
+    "CURVE:BIQUADRATIC": _factory("curve_biquadratic", 6, packed=True),
+    "CURVE:RECTANGULARHYPERBOLA2": _factory("curve_rectangular_hyperbola_2", 3),
+    "CURVE:CUBICLINEAR": _curve_cubic_linear,
+    "CURVE:BICUBIC": _curve_bicubic,
+    "CURVE:FANPRESSURERISE": _curve_fan_pressure_rise,
+}
+
+
+# -------------------------------
+# 🔹 Schedules
+# -------------------------------
+
+
+def _schedule_constant(fields: List[str]) -> Callable[[float], float]:
+    value = _Fields(fields, "Schedule:Constant").number(2) or 0.0
+    return lambda t: value
+
+
+def _schedule_day_hourly(fields: List[str]) -> Callable[[float], float]:
+    values = _Fields(fields, "Schedule:Day:Hourly")
+    return _scheduled([values.number(2 + h) or 0.0 for h in range(24)])
+
+
+def _schedule_compact(fields: List[str]) -> Callable[[float], float]:
+    # One "Through:" period; day types map onto the Scheduler's weekday,
+    # weekend and holiday profiles; hour h takes the value of the first
+    # "Until:" after h:00
+    name = fields[0]
+    days: Dict[str, List[float]] = {}
+    interpolate = False
+    periods = 0
+    current: List[str] = []
+    until: List[Tuple[float, float]] = []
+
+    def close() -> None:
+        if current:
+            profile = [
+                next((v for end, v in until if end > h), until[-1][1] if until else 0.0)
+                for h in range(24)
+            ]
+            for day in current:
+                days.setdefault(day, profile)
+
+    tokens = iter(fields[2:])
+    for token in tokens:
+        key, _, value = token.partition(":")
+        key, value = key.strip().upper(), value.strip()
+        if key == "THROUGH":
+            periods += 1
+            if periods > 1:
+                raise ValueError(
+                    f"Schedule:Compact {name!r}: only one Through: period is supported"
+                )
+        elif key == "FOR":
+            close()
+            current, until = _day_types(value.upper().split()), []
+        elif key == "INTERPOLATE":
+            interpolate = value.upper() in ("YES", "LINEAR", "AVERAGE")
+        elif key == "UNTIL":
+            hours, _, minutes = value.partition(":")
+            until.append((int(hours) + int(minutes or 0) / 60.0, float(next(tokens))))
+    close()
+
+    weekday = days.get("WEEKDAYS", days.get("ALLOTHERDAYS", [0.0] * 24))
+    return _scheduled(
+        weekday,
+        days.get("WEEKENDS", days.get("ALLOTHERDAYS", weekday)),
+        days.get("HOLIDAY", days.get("ALLOTHERDAYS", weekday)),
+        interpolate,
+    )
+
+
+def _day_types(keys: List[str]) -> List[str]:
+    # Day types that set a Scheduler profile; design and custom days are
+    # not simulated and are ignored
+    types = []
+    for key in keys:
+        if key in ("ALLDAYS",):
+            types += ["WEEKDAYS", "WEEKENDS", "HOLIDAY"]
+        elif key in (
+            "WEEKDAYS",
+            "MONDAY",
+            "TUESDAY",
+            "WEDNESDAY",
+            "THURSDAY",
+            "FRIDAY",
+        ):
+            types.append("WEEKDAYS")
+        elif key in ("WEEKENDS", "SATURDAY", "SUNDAY"):
+            types.append("WEEKENDS")
+        elif key in ("HOLIDAY", "HOLIDAYS"):
+            types.append("HOLIDAY")
+        elif key == "ALLOTHERDAYS":
+            types.append("ALLOTHERDAYS")
+    return types
+
+
+def _scheduled(
+    default: List[float],
+    weekend: Optional[List[float]] = None,
+    holiday: Optional[List[float]] = None,
+    interpolate: bool = False,
+) -> Callable[[float], float]:
+    from energy_models.scheduler.Scheduler import (
+        Scheduler,
+        make_flow_fraction_schedule,
+    )
+
+    return make_flow_fraction_schedule(
+        Scheduler(default, weekend, holiday, interpolate)
+    )
+
+
+_SCHEDULES: Dict[str, Callable[[List[str]], Callable]] = {
+    "SCHEDULE:CONSTANT": _schedule_constant,
+    "SCHEDULE:DAY:HOURLY": _schedule_day_hourly,
+    "SCHEDULE:COMPACT": _schedule_compact,
+}
+
+
+# -------------------------------
+# 🔹 Component Mappings
+# -------------------------------
+#
+# Each mapping returns constructor arguments from the IDF fields; None marks
+# a value the IDF does not provide (taken from defaults or overrides). Fan
+# "total efficiency" in EnergyPlus includes the motor, so the fan-only
+# efficiency of the fan classes is total / motor.
+
+
+def _fan_constant_volume(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    return {
+        "delta_p": f.number(3),
+        "rho": idf.rho_air,
+        "eta_fan": _ratio(f.number(2, 0.7), f.number(5, 0.9)),
+        "eta_motor": f.number(5, 0.9),
+        "f_motor_to_air": f.number(6, 1.0),
+    }
+
+
+def _fan_on_off(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    return {
+        "m_dot_design": _scaled(f.number(4), idf.rho_air),
+        "delta_p": f.number(3),
+        "rho": idf.rho_air,
+        "eta_fan": _ratio(f.number(2, 0.6), f.number(5, 0.8)),
+        "eta_motor": f.number(5, 0.8),
+        "f_motor_to_air": f.number(6, 1.0),
+    }
+
+
+def _fan_variable_volume(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    from energy_models.curves.curves import curve_quartic
+
+    return {
+        "m_dot_design": _scaled(f.number(4), idf.rho_air),
+        "delta_p": f.number(3),
+        "rho": idf.rho_air,
+        "eta_fan": _ratio(f.number(2, 0.7), f.number(8, 0.9)),
+        "eta_motor": f.number(8, 0.9),
+        "f_motor_to_air": f.number(9, 1.0),
+        "power_curve": curve_quartic(*(f.number(10 + i) or 0.0 for i in range(5))),
+    }
+
+
+def _fan_component_model(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    pressure = f.text(23)
+    reset = f.text(24)
+    return {
+        "rho": idf.rho_air,
+        "area_outlet": f.number(8),
+        "eta_fan": f.number(9),
+        # Motor losses come from motor_loss_func, or are zero without a
+        # maximum motor efficiency curve, as in EnergyPlus
+        "eta_motor": 1.0,
+        "f_motor_to_air": f.number(19, 1.0),
+        "pressure_coeffs": (
+            _fan_pressure_coeffs(
+                idf.fields("Curve:FanPressureRise", pressure), "Curve:FanPressureRise"
+            )
+            if pressure
+            else None
+        ),
+        "static_reset_func": idf.curve(reset) if reset else None,
+        "belt_loss_func": _belt_loss(idf, f),
+        "motor_loss_func": _motor_loss(idf, f),
+        "vfd_loss_func": _vfd_loss(idf, f),
+    }
+
+
+def _belt_loss(idf: IDFImporter, f: _Fields) -> Any:
+    # Rated belt output: maximum torque × maximum fan speed, the motor's
+    # maximum speed (rpm) times the motor/fan pulley ratio
+    curve = f.text(29)
+    torque, ratio, rpm = f.number(13), f.number(12, 1.0), f.number(16, 1800.0)
+    if not curve or torque is None or ratio is None or rpm is None:
+        return None
+    from energy_models.drivetrain.BeltLoss import BeltLoss
+
+    regions = [f.text(30 + i) for i in range(3)]
+    rated = torque * f.factor(14) * ratio * rpm * 2.0 * math.pi / 60.0
+    return BeltLoss(
+        rated,
+        eta_max=idf.curve(curve),
+        part_load=[_curve_or_one(idf, name) for name in regions],
+        transition=f.number(15) or 0.0,
+    )
+
+
+def _motor_loss(idf: IDFImporter, f: _Fields) -> Any:
+    curve = f.text(33)
+    power = f.number(17)
+    if not curve or power is None:
+        return None
+    from energy_models.drivetrain.MotorLoss import MotorLoss
+
+    return MotorLoss(
+        power * f.factor(18),
+        eta_max=idf.curve(curve),
+        part_load=_curve_or_one(idf, f.text(34)),
+    )
+
+
+def _vfd_loss(idf: IDFImporter, f: _Fields) -> Any:
+    # Only the power-based VFD curve type has an equivalent in VFDLoss
+    curve = f.text(35)
+    power = f.number(21)
+    if not curve or power is None or f.text(20).upper() == "SPEED":
+        return None
+    from energy_models.drivetrain.VFDLoss import VFDLoss
+
+    return VFDLoss(power * f.factor(22), efficiency=idf.curve(curve))
+
+
+def _curve_or_one(idf: IDFImporter, name: str) -> Callable[[float], float]:
+    return idf.curve(name) if name else (lambda x: 1.0)
+
+
+def _fan_zone_exhaust(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    return {
+        "V_dot_max": f.number(4),
+        "delta_p": f.number(3),
+        "rho": idf.rho_air,
+        "eta_fan": f.number(2, 0.6),
+        "eta_total": f.number(2, 0.6),
+        "flow_fraction_schedule": idf.schedule(f.text(8)),
+        "availability_schedule": idf.availability(f.text(1)),
+    }
+
+
+def _coil_heating_electric(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    return {
+        "q_nominal": f.number(3),
+        "eta": f.number(2, 1.0),
+        "rho_air": idf.rho_air,
+        "availability_schedule": idf.availability(f.text(1)),
+    }
+
+
+def _coil_heating_water(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    return {
+        "Q_rated": f.number(9),
+        "rho_air": idf.rho_air,
+        "availability_schedule": idf.availability(f.text(1)),
+    }
+
+
+def _coil_cooling_water(idf: IDFImporter, f: _Fields) -> Dict[str, Any]:
+    # Rated capacity and SHR from the design air conditions
+    design = f.numbers(3, 5, 6, 7, 8)
+    Q_rated: Optional[float] = None
+    SHR: Optional[float] = None
+    if design is not None:
+        V_air, T_in, T_out, W_in, W_out = design
+        m_air = idf.rho_air * V_air
+        total = m_air * (_enthalpy(T_in, W_in) - _enthalpy(T_out, W_out))
+        sensible = m_air * (1006.0 + 1860.0 * W_in) * (T_in - T_out)
+        Q_rated = total
+        SHR = min(sensible / total, 1.0) if total > 0 else 1.0
+    return {
+        "Q_rated": Q_rated,
+        "SHR": SHR,
+        "rho_air": idf.rho_air,
+        "availability_schedule": idf.availability(f.text(1)),
+    }
+
+
+def _enthalpy(T: float, W: float) -> float:
+    # Moist air enthalpy (J/kg dry air), ASHRAE Fundamentals
+    return 1006.0 * T + W * (2.501e6 + 1860.0 * T)
+
+
+def _ratio(total: Optional[float], motor: Optional[float]) -> Optional[float]:
+    return None if total is None or not motor else total / motor
+
+
+def _scaled(value: Optional[float], factor: float) -> Optional[float]:
+    return None if value is None else value * factor
+
+
+_COMPONENTS: Dict[str, Tuple[str, Callable[[IDFImporter, _Fields], Dict[str, Any]]]] = {
+    "FAN:COMPONENTMODEL": (
+        "energy_models.fans.component_model.ComponentFan.ComponentFan",
+        _fan_component_model,
+    ),
+    "FAN:CONSTANTVOLUME": (
+        "energy_models.fans.constant_volume.ConstantVolumeFan.ConstantVolumeFan",
+        _fan_constant_volume,
+    ),
+    "FAN:ONOFF": ("energy_models.fans.on_off.OnOffFan.OnOffFan", _fan_on_off),
+    "FAN:VARIABLEVOLUME": (
+        "energy_models.fans.variable_volume.VariableVolumeFan.VariableVolumeFan",
+        _fan_variable_volume,
+    ),
+    "FAN:ZONEEXHAUST": (
+        "energy_models.fans.zone_exhaust.ZoneExhaust.ZoneExhaustFan",
+        _fan_zone_exhaust,
+    ),
+    "COIL:HEATING:ELECTRIC": (
+        "energy_models.coils.heating_electric.HeatingElectricCoil.ElectricHeatingCoil",
+        _coil_heating_electric,
+    ),
+    "COIL:HEATING:WATER": (
+        "energy_models.coils.heating_water.HeatingWaterCoil.HeatingWaterCoil",
+        _coil_heating_water,
+    ),
+    "COIL:COOLING:WATER": (
+        "energy_models.coils.cooling_water.CoolingWaterCoil.CoolingWaterCoil",
+        _coil_cooling_water,
+    ),
+}
@@ -0,0 +1,371 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Hour of year at which each month starts (non-leap year)
+_MONTH_START = np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30]) * 24.0
+_YEAR = 8760.0
+_PERIODS = {"hour": 1.0, "day": 24.0, "year": _YEAR}
+
+# Slack when testing whether a timestep ends on an interval boundary (in
+# intervals), so float round-off never spills energy into the next interval
+_EDGE = 1e-9
+
+
+class Meter:
+    def __init__(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        timestep: float = 1.0,
+        interval: float = 1.0,
+        bins: Optional[Sequence[float]] = None,
+        threshold: float = 0.0,
+        children: Iterable["Meter"] = (),
+    ):
+        """
+        Streaming accumulator for one output, like EnergyPlus Output:Meter.
+
+        Instead of keeping every per-timestep result, a meter keeps running
+        totals: energy per demand interval, total energy, runtime, the
+        instantaneous maximum with its timestamp and a histogram. Memory
+        depends on the number of intervals (8760 for a year of hourly
+        intervals), not on the number of timesteps or calls. It is not O(1):
+        the energy per interval is what makes hourly and monthly totals and
+        the coincident peak of merged or rolled-up meters possible (see the
+        Meters README).
+
+        Energy is value × timestep, e.g. W × h = Wh. Timestamps t are hours
+        since the start of the year, as produced by read_epw(). A timestep
+        covering several demand intervals (e.g. hourly results with 15-minute
+        demand) spreads its energy over them in proportion to the overlap.
+
+        Args:
+            name (str): Meter name, e.g. "Fans:Electricity"
+            key (str, optional): Result key read by feed(), e.g. "W_electric"
+            timestep (float): Default timestep length (h)
+            interval (float): Demand interval (h) for interval energy and
+                peak demand, e.g. 0.25 for 15-minute demand
+            bins (Sequence[float], optional): Histogram bin edges
+            threshold (float): Values above it count as runtime
+            children (Iterable[Meter]): Meters rolled up into this one
+        """
+        self.name = name
+        self.key = key
+        self.timestep = timestep
+        self.interval = interval
+        self.bins = None if bins is None else np.asarray(bins, dtype=float)
+        self.threshold = threshold
+        self.children: List[Meter] = list(children)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all accumulated values (children are left untouched)."""
+        self.count = 0
+        self.total = 0.0
+        self.runtime = 0.0
+        self.max = -np.inf
+        self.max_t = np.nan
+        self._energy = np.zeros(0)
+        self._size = 0  # intervals fed so far
+        self._histogram = None if self.bins is None else np.zeros(len(self.bins) - 1)
+
+    # ---- 🔹 Feeding ----
+
+    def add(
+        self,
+        value: Union[float, np.ndarray],
+        t: Union[float, np.ndarray],
+        timestep: Optional[float] = None,
+    ) -> None:
+        """
+        Accumulate one value or a batch of values.
+
+        Args:
+            value (float | np.ndarray): Rate at each timestep, e.g. W. Blocks
+                with more dimensions than t, such as (N, T) fleet results,
+                are summed over units first.
+            t (float | np.ndarray): Start of each timestep (h)
+            timestep (float, optional): Timestep length (h), default
+                self.timestep
+        """
+        dt = self.timestep if timestep is None else timestep
+        if np.ndim(value) == 0 and np.ndim(t) == 0:
+            self._add_scalar(float(value), float(t), dt)
+            return
+        t = np.asarray(t, dtype=float)
+        value = np.asarray(value, dtype=float)
+        if value.ndim > t.ndim:
+            value = value.reshape(-1, *value.shape[value.ndim - t.ndim :]).sum(axis=0)
+        value, t = np.broadcast_arrays(value, t)
+        value, t = value.ravel(), t.ravel()
+        if value.size == 0:
+            return
+        if t.min() < 0:
+            raise ValueError("Meter timestamps must be non-negative")
+
+        energy = value * dt
+        self.count += value.size
+        self.total += float(energy.sum(dtype=np.float64))
+        self.runtime += dt * int(np.count_nonzero(value > self.threshold))
+        i = int(np.argmax(value))
+        if value[i] > self.max:
+            self.max, self.max_t = float(value[i]), float(t[i])
+        self._spread(value, t, dt, energy)
+        if self._histogram is not None and self.bins is not None:
+            self._histogram += np.histogram(value, self.bins)[0]
+
+    def feed(
+        self, result: Dict[str, Any], t: Any, timestep: Optional[float] = None
+    ) -> None:
+        """
+        Accumulate self.key from a compute()/compute_batch() result.
+
+        Args:
+            result (dict): Component result
+            t (float | np.ndarray): Timestamp(s) of the result (h)
+            timestep (float, optional): Timestep length (h)
+        """
+        if self.key is None:
+            raise ValueError(f"Meter {self.name!r} has no key to feed from")
+        self.add(result[self.key], t, timestep)
+
+    def write(self, chunk: Dict[str, Any]) -> None:
+        """
+        Writer interface for run_stream(): feed a chunk with a "t" column.
+
+        Run with passthrough=("t",) so every result chunk carries its
+        timestamps.
+
+        Args:
+            chunk (dict): Result chunk including "t"
+        """
+        self.feed(chunk, chunk["t"])
+
+    def _add_scalar(self, value: float, t: float, dt: float) -> None:
+        # Per-call path of scalar compute() loops, without array overhead
+        if t < 0:
+            raise ValueError("Meter timestamps must be non-negative")
+        self.count += 1
+        self.total += value * dt
+        if value > self.threshold:
+            self.runtime += dt
+        if value > self.max:
+            self.max, self.max_t = value, t
+        first, last = self._span(t, dt)
+        if last >= self._size:
+            self._grow(last + 1)
+        if first == last:
+            self._energy[first] += value * dt
+        else:
+            self._energy[first] += value * ((first + 1) * self.interval - t)
+            self._energy[first + 1 : last] += value * self.interval
+            self._energy[last] += value * (t + dt - last * self.interval)
+        if self._histogram is not None and self.bins is not None:
+            k = np.searchsorted(self.bins, value, side="right") - 1
+            if 0 <= k < self._histogram.size:
+                self._histogram[k] += 1
+            elif value == self.bins[-1]:
+                self._histogram[-1] += 1
+
+    def _span(self, t: Any, dt: float) -> Tuple[Any, Any]:
+        # First and last demand interval overlapped by [t, t + dt)
+        if np.ndim(t) == 0:
+            first = int(t // self.interval)
+            return first, max(math.ceil((t + dt) / self.interval - _EDGE) - 1, first)
+        first = (t // self.interval).astype(np.intp)
+        last = np.ceil((t + dt) / self.interval - _EDGE).astype(np.intp) - 1
+        return first, np.maximum(last, first)
+
+    def _spread(
+        self, value: np.ndarray, t: np.ndarray, dt: float, energy: np.ndarray
+    ) -> None:
+        # Add each timestep's energy to the demand intervals it overlaps
+        first, last = self._span(t, dt)
+        self._grow(int(last.max()) + 1)
+        size = self._energy.size
+        if np.array_equal(first, last):
+            # Every timestep within one interval, e.g. dt <= interval aligned
+            self._energy += np.bincount(first, energy, minlength=size)[:size]
+            return
+        split = last > first
+        head = np.where(split, value * ((first + 1) * self.interval - t), energy)
+        tail = np.where(split, value * (t + dt - last * self.interval), 0.0)
+        # Whole intervals in between get rate × interval: a difference array
+        # over first + 1 .. last - 1, summed up with cumsum
+        inner = np.where(last > first + 1, value * self.interval, 0.0)
+        steps = np.bincount(first + 1, inner, minlength=size + 1)[: size + 1]
+        steps -= np.bincount(last, inner, minlength=size + 1)[: size + 1]
+        self._energy += (
+            np.bincount(first, head, minlength=size)[:size]
+            + np.bincount(last, tail, minlength=size)[:size]
+            + np.cumsum(steps)[:size]
+        )
+
+    def _grow(self, size: int) -> None:
+        if size > self._energy.size:
+            # Grow geometrically so a scalar loop over a year reallocates rarely
+            grown = np.zeros(max(size, 2 * self._energy.size))
+            grown[: self._energy.size] = self._energy
+            self._energy = grown
+        self._size = max(self._size, size)
+
+    # ---- 🔹 Merging and Roll-Up ----
+
+    def merge(self, other: "Meter") -> "Meter":
+        """
+        Add another meter's accumulated values into this one.
+
+        Use it to combine the same meter from worker processes (meters are
+        picklable), whether the workers split the timesteps or the units.
+        Totals, interval energy, runtime and histogram counts add; the
+        instantaneous maximum is the larger of the two, which for workers
+        splitting units is not coincident — use peak_demand() for that.
+
+        Args:
+            other (Meter): Meter with the same interval and bins
+
+        Returns:
+            Meter: self
+        """
+        if (self.bins is None) != (other.bins is None):
+            raise ValueError("Cannot merge meters with different bins")
+        return self._accumulate(other)
+
+    def _accumulate(self, other: "Meter") -> "Meter":
+        # Histograms are merged only if this meter has bins
+        if other.interval != self.interval:
+            raise ValueError("Cannot merge meters with different intervals")
+        if self.bins is not None and not (
+            other.bins is not None and np.array_equal(self.bins, other.bins)
+        ):
+            raise ValueError("Cannot merge meters with different bins")
+        self.count += other.count
+        self.total += other.total
+        self.runtime += other.runtime
+        if other.max > self.max:
+            self.max, self.max_t = other.max, other.max_t
+        self._grow(other._size)
+        self._energy[: other._size] += other._energy[: other._size]
+        if self._histogram is not None and other._histogram is not None:
+            self._histogram += other._histogram
+        return self
+
+    def rollup(self) -> "Meter":
+        """
+        This meter combined with all of its children, recursively.
+
+        A meter with children, such as AHU → fans or building → AHUs, holds
+        only what was fed to it directly; rollup() returns a new meter with
+        everything below it merged in. Children need the same interval;
+        histograms roll up only into a parent with the same bins.
+
+        Returns:
+            Meter: Combined meter without children
+        """
+        combined = Meter(
+            self.name,
+            self.key,
+            self.timestep,
+            self.interval,
+            None if self.bins is None else list(self.bins),
+            self.threshold,
+        )
+        combined._accumulate(self)
+        for child in self.children:
+            combined._accumulate(child.rollup())
+        return combined
+
+    # ---- 🔹 Reporting ----
+
+    def interval_energy(self) -> np.ndarray:
+        """Energy per demand interval, from t = 0 to the last fed interval."""
+        return self._energy[: self._size].copy()
+
+    def totals(self, by: Union[str, float] = "month") -> np.ndarray:
+        """
+        Energy per reporting period.
+
+        Args:
+            by (str | float): "hour", "day", "month", "year" or a period
+                length in hours; periods shorter than the interval are not
+                resolved
+
+        Returns:
+            np.ndarray: Energy per period, from the first period of the year
+        """
+        energy = self.interval_energy()
+        index = self._period(np.arange(energy.size) * self.interval, by)
+        return np.bincount(index, energy, minlength=int(index.max(initial=-1)) + 1)
+
+    def peak_demand(self, by: Union[str, float] = "year") -> Dict[str, np.ndarray]:
+        """
+        Highest interval-average demand per reporting period.
+
+        Unlike max, interval energy is summed across merged meters, so this
+        is the coincident peak of a rolled-up meter.
+
+        Args:
+            by (str | float): Reporting period (see totals())
+
+        Returns:
+            dict: "demand" (energy / interval, e.g. W) and "t" (start of the
+            peak interval, h), one entry per period
+        """
+        energy = self.interval_energy()
+        start = np.arange(energy.size) * self.interval
+        index = self._period(start, by)
+        rate = energy / self.interval
+        n = int(index.max(initial=-1)) + 1
+        demand = np.full(n, np.nan)
+        peak_t = np.full(n, np.nan)
+        if n:
+            highest = np.full(n, -np.inf)
+            np.maximum.at(highest, index, rate)
+            # First interval reaching each period's maximum
+            hits = np.flatnonzero(rate == highest[index])
+            periods, first = np.unique(index[hits], return_index=True)
+            demand[periods] = highest[periods]
+            peak_t[periods] = start[hits[first]]
+        return {"demand": demand, "t": peak_t}
+
+    def histogram(self) -> Dict[str, np.ndarray]:
+        """Counts of fed values per bin (values outside the edges are dropped)."""
+        if self._histogram is None or self.bins is None:
+            raise ValueError(f"Meter {self.name!r} has no bins")
+        return {"edges": self.bins.copy(), "counts": self._histogram.copy()}
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summary of the meter with its children rolled up.
+
+        Returns:
+            dict: "name", "count", "total", "runtime" (h), "max", "max_t",
+            "peak_demand", "peak_t" and "monthly" energy
+        """
+        meter = self.rollup()
+        peak = meter.peak_demand("year")
+        k = int(np.nanargmax(peak["demand"])) if peak["demand"].size else None
+        return {
+            "name": self.name,
+            "count": meter.count,
+            "total": meter.total,
+            "runtime": meter.runtime,
+            "max": meter.max,
+            "max_t": meter.max_t,
+            "peak_demand": float(peak["demand"][k]) if k is not None else np.nan,
+            "peak_t": float(peak["t"][k]) if k is not None else np.nan,
+            "monthly": meter.totals("month"),
+        }
+
+    @staticmethod
+    def _period(start: np.ndarray, by: Union[str, float]) -> np.ndarray:
+        if by == "month":
+            year, hour = np.divmod(start, _YEAR)
+            month = np.searchsorted(_MONTH_START, hour, side="right") - 1
+            return (year * 12 + month).astype(np.intp)
+        if isinstance(by, str) and by not in _PERIODS:
+            raise ValueError(f"Unknown period {by!r}")
+        length = _PERIODS[by] if isinstance(by, str) else float(by)
+        return (start // length).astype(np.intp)
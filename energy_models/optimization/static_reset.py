@@ -0,0 +1,165 @@
+import copy
+from typing import Any, Callable, Dict, Optional, Union
+
+import numpy as np
+
+# -------------------------------
+# 🔹 Duct Static Pressure Reset Optimization
+# -------------------------------
+#
+# The reset curve is piecewise linear in flow. Timesteps are binned by flow
+# and every bin gets the single setpoint that minimizes its summed
+# W_electric. Candidate setpoints are evaluated as a (candidates × timesteps)
+# array: a copy of the fan whose static_reset_func returns the candidates is
+# run through compute_batch(), so the whole search is a handful of
+# vectorized calls regardless of the length of the flow timeseries.
+
+Bound = Union[float, Callable[[Any], Any]]
+
+# Elements per candidate block (rows × timesteps)
+_BLOCK = 1 << 20
+
+
+def optimize_static_reset(
+    fan: Any,
+    Q: Any,
+    P_o: Any = 0.0,
+    h_in: Any = 0.0,
+    p_min: Bound = 0.0,
+    p_max: Optional[float] = None,
+    n_knots: int = 10,
+    n_grid: int = 41,
+    timestep: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Reset curve P_sm(Q) minimizing the fan's electric energy over a flow timeseries.
+
+    Args:
+        fan (ComponentFan): Fan to optimize; left unchanged
+        Q (np.ndarray): Flow timeseries (m³/s), e.g. a year of hourly flows
+        P_o (float | np.ndarray): Ambient/zone static pressure (Pa)
+        h_in (float | np.ndarray): Inlet air enthalpy (J/kg)
+        p_min (float | Callable): Minimum static setpoint (Pa), or an
+            array-aware function of flow, e.g. the pressure the critical zone
+            needs at that flow
+        p_max (float, optional): Maximum static setpoint (Pa); default the
+            highest setpoint of the current static_reset_func
+        n_knots (int): Flow bins, i.e. knots of the reset curve
+        n_grid (int): Candidate setpoints per bin and refinement stage
+        timestep (float): Timestep length (h) for the energy totals
+
+    Returns:
+        dict: "reset" (callable for static_reset_func), "flows" and
+        "setpoints" (knots of the curve), "W_electric" (optimized series),
+        "energy_baseline" and "energy_optimized" (Wh with W and h),
+        "savings" and "savings_fraction"
+
+    Raises:
+        ValueError: If Q is empty.
+    """
+    from energy_models.batch.batch import evaluate
+
+    Q = np.asarray(Q, dtype=float)
+    if Q.size == 0:
+        raise ValueError("Flow timeseries Q is empty")
+    P_o, h_in = np.broadcast_to(P_o, Q.shape), np.broadcast_to(h_in, Q.shape)
+    baseline = fan.compute_batch(Q, P_o, h_in)
+    lower = evaluate(_bound(p_min), Q)
+    if p_max is None:
+        p_max = float(np.max(baseline["P_static_setpoint"], initial=0.0))
+    p_max = max(p_max, float(lower.max(initial=0.0)))
+
+    # Bin timesteps over the flow range that occurs; every bin must satisfy
+    # its highest minimum
+    edges = np.linspace(Q.min(), Q.max(), n_knots + 1)
+    bins = np.clip(np.searchsorted(edges, Q, side="right") - 1, 0, n_knots - 1)
+    floor = np.full(n_knots, -np.inf)
+    np.maximum.at(floor, bins, lower)
+    floor = np.where(np.isfinite(floor), np.minimum(floor, p_max), p_max)
+
+    # Coarse grid over [floor, p_max], then a finer grid around the best point
+    lo, hi = np.zeros(n_knots), np.ones(n_knots)
+    for _ in range(2):
+        u = lo + np.linspace(0.0, 1.0, n_grid)[:, None] * (hi - lo)
+        energy = _bin_energy(fan, Q, P_o, h_in, bins, floor, p_max, u)
+        best = u[np.argmin(energy, axis=0), np.arange(n_knots)]
+        step = (hi - lo) / (n_grid - 1)
+        lo, hi = np.maximum(best - step, 0.0), np.minimum(best + step, 1.0)
+
+    occupied = np.bincount(bins, minlength=n_knots) > 0
+    flows = (
+        np.bincount(bins, Q, minlength=n_knots)[occupied]
+        / np.bincount(bins, minlength=n_knots)[occupied]
+    )
+    setpoints = (floor + best * (p_max - floor))[occupied]
+    reset = _reset_curve(flows, setpoints, p_min, p_max)
+
+    optimized = copy.copy(fan)
+    optimized.static_reset_func = reset
+    W = optimized.compute_batch(Q, P_o, h_in)["W_electric"]
+    energy_baseline = float(baseline["W_electric"].sum()) * timestep
+    energy_optimized = float(W.sum()) * timestep
+    savings = energy_baseline - energy_optimized
+    return {
+        "reset": reset,
+        "flows": flows,
+        "setpoints": setpoints,
+        "W_electric": W,
+        "energy_baseline": energy_baseline,
+        "energy_optimized": energy_optimized,
+        "savings": savings,
+        "savings_fraction": savings / energy_baseline if energy_baseline else 0.0,
+    }
+
+
+# ---- 🔹 Helpers ----
+
+
+def _bound(value: Bound) -> Callable[[Any], Any]:
+    return value if callable(value) else (lambda Q: value)
+
+
+def _bin_energy(
+    fan: Any,
+    Q: np.ndarray,
+    P_o: np.ndarray,
+    h_in: np.ndarray,
+    bins: np.ndarray,
+    floor: np.ndarray,
+    p_max: float,
+    u: np.ndarray,
+) -> np.ndarray:
+    # Summed W_electric per (candidate, bin); candidate g of bin k is the
+    # setpoint floor[k] + u[g, k] · (p_max - floor[k]). Candidates are
+    # evaluated a block of rows at a time to bound memory on long series.
+    n_grid, n_knots = u.shape
+    energy = np.empty((n_grid, n_knots))
+    rows = max(1, _BLOCK // max(Q.size, 1))
+    probe = copy.copy(fan)
+    for start in range(0, n_grid, rows):
+        block = u[start : start + rows]
+        candidates = floor[bins] + block[:, bins] * (p_max - floor[bins])
+        shape = candidates.shape
+        probe.static_reset_func = lambda _: candidates
+        W = probe.compute_batch(
+            np.broadcast_to(Q, shape), np.broadcast_to(P_o, shape), h_in
+        )["W_electric"]
+        offsets = (np.arange(len(block)) * n_knots)[:, None] + bins
+        energy[start : start + rows] = np.bincount(
+            offsets.ravel(), W.ravel(), minlength=len(block) * n_knots
+        ).reshape(len(block), n_knots)
+    return energy
+
+
+def _reset_curve(
+    flows: np.ndarray, setpoints: np.ndarray, p_min: Bound, p_max: float
+) -> Callable[[Any], Any]:
+    # Piecewise linear through the knots, held flat outside them, and never
+    # below the minimum setpoint
+    lower = _bound(p_min)
+
+    def reset(Q: Any) -> Any:
+        value = np.minimum(np.maximum(np.interp(Q, flows, setpoints), lower(Q)), p_max)
+        return float(value) if np.ndim(value) == 0 else value
+
+    return reset
@@ -0,0 +1,188 @@
+import contextvars
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# -------------------------------
+# 🔹 Chunked Executor
+# -------------------------------
+#
+# The batch paths spend their time in NumPy kernels that release the GIL, so
+# blocks of timesteps can run on threads of a single process: no pickling,
+# no copies of the inputs, no worker start-up. Each block runs on its own
+# shallow copy of the component, so attributes a call rebinds (warm starts,
+# lazily built tables) stay private to the block.
+
+
+class ChunkedExecutor:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        block_bytes: int = 2**18,
+    ):
+        """
+        Thread-parallel evaluation of a batch compute path in blocks of
+        timesteps.
+
+        The last axis of the inputs is split: (T,) timeseries, and (N, T)
+        fleet inputs in blocks of all units × some timesteps, since a
+        fleet's per-unit parameters live in the fleet itself.
+
+        Args:
+            max_workers (int, optional): Threads (default CPU count); 1 runs
+                the blocks one after the other in the calling thread
+            chunk_size (int, optional): Timesteps per block; by default sized
+                so that the inputs of a block take about block_bytes, which
+                keeps a block's outputs and temporaries in a core's L2 cache
+            block_bytes (int): Input bytes per block for the default size
+        """
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.block_bytes = block_bytes
+
+    def run(
+        self,
+        method: Callable[..., Dict[str, Any]],
+        inputs: Dict[str, Any],
+        warmup: int = 0,
+        prepare: Optional[Callable[[Any, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate method on every block of inputs and join the results.
+
+        Arrays whose last axis has the common length T are cut into blocks;
+        scalars and other arrays (e.g. (N, 1) fleet inputs) are passed to
+        every block as they are. Nested dicts (e.g. the positions of
+        HydronicNetwork.solve()) are cut the same way.
+
+        Per-block state: a bound method runs on a shallow copy of its
+        component per block. prepare(copy, start) can set the state a block
+        starts from, and with warmup > 0 the copy is first called on the
+        `warmup` timesteps before the block, with that result discarded, so
+        a component that carries state from call to call (e.g. a warm start)
+        reaches the block boundary as it would in one serial pass.
+
+        Args:
+            method (Callable): compute_batch() of a component or fleet, or any
+                callable taking arrays by keyword
+            inputs (dict): Keyword arguments of method
+            warmup (int): Timesteps evaluated before each block and discarded
+            prepare (Callable, optional): Called with each block's component
+                copy and the block's first timestep before any evaluation
+
+        Returns:
+            Dict[str, Any]: Same keys as method's result; outputs over the
+            timesteps are joined, any other value becomes the list of the
+            values of every block (e.g. solver iteration counts)
+
+        Raises:
+            ValueError: If the inputs disagree on the number of timesteps.
+        """
+        n = _length(inputs)
+        size = self.chunk_size or self._default_size(inputs, n)
+        starts = range(0, n, size)
+
+        def block(start: int) -> Dict[str, Any]:
+            func = method
+            owner = getattr(method, "__self__", None)
+            if owner is not None:
+                # Private copy of the component for this block
+                func = getattr(copy.copy(owner), method.__name__)
+                if prepare is not None:
+                    prepare(func.__self__, start)
+            if warmup and start > 0:
+                func(**_slice(inputs, max(start - warmup, 0), start, n))
+            return func(**_slice(inputs, start, min(start + size, n), n))
+
+        workers = self.max_workers or os.cpu_count() or 1
+        joined: Dict[str, Any]
+        if len(starts) == 1:
+            joined = _wrap(block(0), n)
+        elif workers == 1:
+            joined = _join(map(block, starts), starts, n)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # Threads do not inherit context variables such as the working
+                # precision of a precision() block; each block gets the caller's
+                context = contextvars.copy_context()
+                futures = [pool.submit(context.copy().run, block, s) for s in starts]
+                joined = _join((f.result() for f in futures), starts, n)
+        return joined
+
+    def _default_size(self, inputs: Dict[str, Any], n: int) -> int:
+        # Timesteps whose inputs take block_bytes together
+        per_step = sum(
+            a.nbytes // n for a in _arrays(inputs) if a.ndim and a.shape[-1] == n
+        )
+        return max(1, self.block_bytes // max(per_step, 1))
+
+
+# ---- 🔹 Helpers ----
+
+
+def _arrays(value: Any) -> List[np.ndarray]:
+    # Every array in a possibly nested dict of inputs
+    if isinstance(value, dict):
+        return [a for v in value.values() for a in _arrays(v)]
+    return [value] if isinstance(value, np.ndarray) else []
+
+
+def _length(inputs: Dict[str, Any]) -> int:
+    lengths = {a.shape[-1] for a in _arrays(inputs) if a.ndim}
+    if len(lengths) > 1:
+        lengths.discard(1)
+    if len(lengths) > 1:
+        raise ValueError(f"Inputs disagree on the number of timesteps: {lengths}")
+    return lengths.pop() if lengths else 1
+
+
+def _slice(value: Any, start: int, stop: int, n: int) -> Any:
+    if isinstance(value, dict):
+        return {k: _slice(v, start, stop, n) for k, v in value.items()}
+    if isinstance(value, np.ndarray) and value.ndim and value.shape[-1] == n:
+        return value[..., start:stop]
+    return value
+
+
+def _join(results: Any, starts: range, n: int) -> Any:
+    # Copies each block into the joined outputs as soon as it is done, so
+    # only the blocks in flight exist twice
+    joined: Any = None
+    for start, result in zip(starts, results):
+        stop = min(start + starts.step, n)
+        if joined is None:
+            joined = _allocate(result, stop - start, n)
+        _fill(joined, result, start, stop)
+    return joined
+
+
+def _wrap(result: Any, n: int) -> Any:
+    # A single block's result in the joined layout, without copying
+    if isinstance(result, dict):
+        return {k: _wrap(v, n) for k, v in result.items()}
+    if isinstance(result, np.ndarray) and result.ndim and result.shape[-1] == n:
+        return result
+    return [result]
+
+
+def _allocate(result: Any, steps: int, n: int) -> Any:
+    if isinstance(result, dict):
+        return {k: _allocate(v, steps, n) for k, v in result.items()}
+    value = np.asarray(result)
+    if value.ndim and value.shape[-1] == steps:
+        return np.empty((*value.shape[:-1], n), dtype=value.dtype)
+    return []
+
+
+def _fill(target: Any, value: Any, start: int, stop: int) -> None:
+    if isinstance(target, dict):
+        for key in target:
+            _fill(target[key], value[key], start, stop)
+    elif isinstance(target, list):
+        target.append(value)
+    else:
+        target[..., start:stop] = value
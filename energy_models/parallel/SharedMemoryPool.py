@@ -0,0 +1,297 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# -------------------------------
+# 🔹 Shared Memory Pool
+# -------------------------------
+#
+# Arrays live in multiprocessing.shared_memory segments. Tasks carry only
+# _Shared references (segment name, shape, dtype), the fleet class, its
+# non-array parameters and an index range; workers map the segments, build
+# the fleet for their units and write their slice of every output in place.
+
+
+class _Shared(NamedTuple):
+    # Picklable reference to an array in a shared memory segment
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+class _Mapping:
+    # Base object of every array into a segment. NumPy views keep it alive,
+    # so the mapping is closed only once the last of them is gone: arrays
+    # returned by run() stay valid after close(), which only unlinks names
+    def __init__(self, shm: shared_memory.SharedMemory, shape: Tuple, dtype: Any):
+        if shm.buf is None:
+            raise ValueError(f"Shared memory segment {shm.name} is closed")
+        self.shm = shm
+        address = np.frombuffer(shm.buf, dtype=np.uint8).ctypes.data
+        self.__array_interface__ = {
+            "shape": tuple(shape),
+            "typestr": np.dtype(dtype).str,
+            "data": (address, False),
+            "version": 3,
+        }
+
+    def __del__(self) -> None:
+        self.shm.close()
+
+
+class SharedMemoryPool:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        units_per_task: Optional[int] = None,
+        steps_per_task: Optional[int] = None,
+    ):
+        """
+        Process pool for fleet evaluations with zero-copy inputs and outputs.
+
+        Inputs, per-unit parameters and preallocated output buffers are
+        placed in shared memory once; workers receive only segment names, the
+        fleet class with its scalar parameters and a (units, timesteps) index
+        range, and write their block of every output in place. No array is
+        pickled in either direction.
+
+        Args:
+            max_workers (int, optional): Worker processes (default CPU count);
+                0 evaluates every block in the calling process
+            units_per_task (int, optional): Units per task (default: about
+                four tasks per worker)
+            steps_per_task (int, optional): Timesteps per task (default all)
+        """
+        self.max_workers = max_workers
+        self.units_per_task = units_per_task
+        self.steps_per_task = steps_per_task
+        self._segments: Dict[int, np.ndarray] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "SharedMemoryPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---- 🔹 Shared Arrays ----
+
+    def empty(self, shape: Any, dtype: Any = np.float64) -> np.ndarray:
+        """
+        Uninitialized array in shared memory, owned by the pool.
+
+        Inputs created here (or with share()) are passed to workers by
+        reference in every later run() without being copied again.
+        """
+        shape = tuple(np.atleast_1d(shape).astype(int).tolist())
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        array = np.asarray(_Mapping(shm, shape, dtype))
+        # Held until close(), which also keeps id(array) unique
+        self._segments[id(array)] = array
+        return array
+
+    def share(self, array: Any) -> np.ndarray:
+        """
+        Copy of an array in shared memory, e.g. a portfolio's weather data.
+        """
+        array = np.asarray(array)
+        shared = self.empty(array.shape, array.dtype)
+        shared[...] = array
+        return shared
+
+    def _ref(self, array: np.ndarray) -> _Shared:
+        return _Shared(_segment(array).name, array.shape, array.dtype.str)
+
+    def _release(self, array: np.ndarray) -> None:
+        _segment(self._segments.pop(id(array))).unlink()
+
+    # ---- 🔹 Evaluation ----
+
+    def run(
+        self,
+        fleet: type,
+        params: Dict[str, Any],
+        inputs: Dict[str, Any],
+        outputs: Optional[Sequence[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluate a fleet over (units × timesteps) with the work spread over
+        processes.
+
+        Args:
+            fleet (type): Fleet class (e.g. ComponentFanFleet), or a picklable
+                module-level factory taking the fleet's keyword arguments
+            params (dict): Fleet constructor arguments; numeric (N,) arrays
+                go to shared memory, everything else is pickled with each
+                task and must be picklable
+            inputs (dict): compute() arguments as scalars, (T,), (N, 1) or
+                (N, T) arrays
+            outputs (Sequence[str], optional): Result keys to keep (default
+                all)
+
+        Returns:
+            Dict[str, np.ndarray]: (N, T) arrays in shared memory; they remain
+            valid after close()
+        """
+        n_units, n_steps = _dimensions(params, inputs)
+        owned: List[np.ndarray] = []
+
+        def reference(value: Any, per_unit: bool) -> Any:
+            if not isinstance(value, (np.ndarray, list)) or np.ndim(value) == 0:
+                return value
+            value = np.asarray(value)
+            if per_unit and (value.ndim != 1 or value.dtype.kind not in "biuf"):
+                return value
+            if id(value) not in self._segments:
+                value = self.share(value)
+                owned.append(value)
+            return self._ref(value)
+
+        try:
+            param_refs = {k: reference(v, True) for k, v in params.items()}
+            input_refs = {k: reference(v, False) for k, v in inputs.items()}
+
+            # One unit and one timestep in-process give the output keys and
+            # dtypes, so buffers are allocated before any worker starts
+            dtypes = _probe(fleet, param_refs, input_refs)
+            keys = list(outputs) if outputs is not None else list(dtypes)
+            results = {key: self.empty((n_units, n_steps), dtypes[key]) for key in keys}
+            output_refs = {key: self._ref(value) for key, value in results.items()}
+
+            tasks = [
+                (fleet, param_refs, input_refs, output_refs, rows, cols)
+                for rows in _ranges(n_units, self._units_per_task(n_units))
+                for cols in _ranges(n_steps, self.steps_per_task or n_steps)
+            ]
+            if self.max_workers == 0:
+                for task in tasks:
+                    _run_block(*task)
+            else:
+                executor = self._pool()
+                for future in [executor.submit(_run_block, *task) for task in tasks]:
+                    future.result()
+            return results
+        finally:
+            for value in owned:
+                self._release(value)
+
+    def _units_per_task(self, n_units: int) -> int:
+        if self.units_per_task:
+            return self.units_per_task
+        workers = self.max_workers or os.cpu_count() or 1
+        return max(1, -(-n_units // (4 * workers)))
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers or os.cpu_count() or 1
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Stop the workers and unlink every shared array of the pool.
+
+        The memory of an array is released once it is no longer referenced.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for array in self._segments.values():
+            _segment(array).unlink()
+        self._segments.clear()
+
+
+# ---- 🔹 Helpers ----
+
+
+def _segment(array: np.ndarray) -> shared_memory.SharedMemory:
+    # Segment behind an array created by SharedMemoryPool.empty()
+    mapping: Any = array.base
+    if not isinstance(mapping, _Mapping):
+        raise ValueError("Array is not in a shared memory segment of the pool")
+    return mapping.shm
+
+
+def _dimensions(params: Dict[str, Any], inputs: Dict[str, Any]) -> Tuple[int, int]:
+    # N from per-unit parameters or (N, T) inputs, T from (T,) or (N, T) inputs
+    units = {np.size(v) for v in params.values() if _per_unit(v)}
+    units |= {np.shape(v)[0] for v in inputs.values() if np.ndim(v) == 2}
+    steps = {np.shape(v)[-1] for v in inputs.values() if np.ndim(v) >= 1}
+    steps.discard(1)
+    if len(units) > 1 or len(steps) > 1:
+        raise ValueError(f"Inconsistent sizes: units {units}, timesteps {steps}")
+    return (units.pop() if units else 1), (steps.pop() if steps else 1)
+
+
+def _per_unit(value: Any) -> bool:
+    return isinstance(value, (np.ndarray, list)) and np.ndim(value) == 1
+
+
+def _ranges(n: int, step: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+def _run_block(
+    fleet: type,
+    params: Dict[str, Any],
+    inputs: Dict[str, Any],
+    outputs: Dict[str, _Shared],
+    rows: Tuple[int, int],
+    cols: Tuple[int, int],
+) -> None:
+    # Runs in a worker: map the segments, write this block of every output
+    mappings: Dict[str, np.ndarray] = {}
+    result = _evaluate(fleet, params, inputs, rows, cols, mappings)
+    for key, ref in outputs.items():
+        value = np.asarray(result[key])
+        # (units,) when every input of the block is a scalar
+        value = value[:, None] if value.ndim == 1 else value
+        _attach(ref, mappings)[rows[0] : rows[1], cols[0] : cols[1]] = value
+
+
+def _probe(
+    fleet: type, params: Dict[str, Any], inputs: Dict[str, Any]
+) -> Dict[str, np.dtype]:
+    # Output keys and dtypes from the first unit at the first timestep
+    result = _evaluate(fleet, params, inputs, (0, 1), (0, 1), {})
+    return {key: np.asarray(value).dtype for key, value in result.items()}
+
+
+def _evaluate(
+    fleet: type,
+    params: Dict[str, Any],
+    inputs: Dict[str, Any],
+    rows: Tuple[int, int],
+    cols: Tuple[int, int],
+    mappings: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    # Fleet of units rows[0]:rows[1], evaluated on timesteps cols[0]:cols[1]
+    unit, step = slice(*rows), slice(*cols)
+    kwargs = {
+        k: _attach(v, mappings)[unit] if isinstance(v, _Shared) else v
+        for k, v in params.items()
+    }
+    args = {}
+    for k, v in inputs.items():
+        if isinstance(v, _Shared):
+            v = _attach(v, mappings)
+            v = v[..., step] if v.shape[-1] > 1 else v
+            v = v[unit] if v.ndim == 2 else v
+        args[k] = v
+    result: Dict[str, np.ndarray] = fleet(**kwargs).compute(**args)
+    return result
+
+
+def _attach(ref: _Shared, mappings: Dict[str, np.ndarray]) -> np.ndarray:
+    # Each segment is mapped once per task; closed with its last view
+    array = mappings.get(ref.name)
+    if array is None:
+        shm = shared_memory.SharedMemory(name=ref.name)
+        array = mappings[ref.name] = np.asarray(_Mapping(shm, ref.shape, ref.dtype))
+    return array
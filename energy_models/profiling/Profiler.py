@@ -0,0 +1,280 @@
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Profiler receiving solver reports, or None when profiling is off
+_active: Optional["Profiler"] = None
+
+# Entry points wrapped on attached components, when present
+_METHODS = ("compute", "compute_batch", "solve", "solve_stroke", "get_value")
+
+
+def record_solver(
+    owner: Any, solver: str, iterations: int, converged: int, failed: int = 0
+) -> None:
+    """
+    Report a root-find or Newton solve to the active profiler, if any.
+
+    Called by the solvers inside the components; a no-op while no Profiler
+    is active, so the cost when profiling is off is a single global lookup.
+
+    Args:
+        owner: Component that ran the solve
+        solver (str): Solver name, e.g. "brentq"
+        iterations (int): Iterations used
+        converged (int): Number of converged solves (elements for batches)
+        failed (int): Number of solves that did not converge
+    """
+    if _active is not None:
+        _active._record_solver(owner, solver, iterations, converged, failed)
+
+
+class Profiler:
+    def __init__(self, trace: bool = False, max_events: int = 1_000_000):
+        """
+        Opt-in call and solver statistics per component and injected callable.
+
+        Nothing is instrumented until components are attached: attach()
+        replaces every injected callable (curves, schedules, loss functions)
+        of one instance and the entry points of its class (compute,
+        compute_batch, ...) with timing wrappers, and detach() puts the
+        originals back. Without attached components the models run their
+        unmodified code; solvers only pay a check for an active profiler.
+
+        Args:
+            trace (bool): Also record one event per call for export_trace()
+            max_events (int): Cap on recorded trace events
+        """
+        self.trace = trace
+        self.max_events = max_events
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.solvers: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self.events: List[Tuple[str, float, float]] = []
+        self._labels: Dict[int, str] = {}
+        self._patched: List[Tuple[Any, str, Any]] = []
+        self._methods: Dict[Tuple[type, str], bool] = {}
+        self._attached: List[Any] = []
+        # Per thread: time spent in the children of every call in progress
+        self._local = threading.local()
+        self._t0 = time.perf_counter()
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        if _active is not None and _active is not self:
+            raise RuntimeError("Another Profiler is already active.")
+        _active = self
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        global _active
+        _active = None
+        self.detach()
+
+    def attach(self, component: Any, name: Optional[str] = None) -> str:
+        """
+        Instrument one component instance.
+
+        Args:
+            component: Fan, coil, valve, network or scheduler instance
+            name (str, optional): Label in the report; defaults to the class
+                name with a running number, e.g. "ComponentFan#1"
+
+        Returns:
+            str: Label used for this instance
+        """
+        if id(component) in self._labels:
+            return self._labels[id(component)]
+        if name is None:
+            kind = type(component).__name__
+            count = sum(1 for lbl in self._labels.values() if lbl.startswith(kind))
+            name = f"{kind}#{count + 1}"
+        self._labels[id(component)] = name
+
+        self._attached.append(component)
+
+        for attr, value in list(vars(component).items()):
+            # Injected callables: curves, schedules, loss and reset functions
+            if attr.startswith("_") or not callable(value) or isinstance(value, type):
+                continue
+            setattr(component, attr, self._wrap(value, f"{name}.{attr}"))
+            self._patched.append((component, attr, value))
+
+        # Entry points are wrapped on the class, not the instance: adding new
+        # keys to an instance __dict__ would slow its attribute lookups even
+        # after detach(). Instances that are not attached pass straight through.
+        cls = type(component)
+        for attr in _METHODS:
+            method = getattr(cls, attr, None)
+            if callable(method) and (cls, attr) not in self._methods:
+                self._methods[(cls, attr)] = attr in vars(cls)
+                setattr(cls, attr, self._wrap_method(method, attr))
+                self._patched.append((cls, attr, method))
+        return name
+
+    def detach(self) -> None:
+        """Restore every patched attribute of every attached component."""
+        for owner, attr, original in reversed(self._patched):
+            if isinstance(owner, type) and not self._methods[(owner, attr)]:
+                delattr(owner, attr)  # inherited: uncover the base class method
+            else:
+                setattr(owner, attr, original)
+        self._patched.clear()
+        self._methods.clear()
+        self._labels.clear()
+        self._attached.clear()
+
+    def _wrap(self, func: Callable, label: str) -> Callable:
+        stats = self._stats(label)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self._timed(label, stats, func, args, kwargs)
+
+        return wrapper
+
+    def _wrap_method(self, func: Callable, attr: str) -> Callable:
+        labels = self._labels
+
+        @functools.wraps(func)
+        def wrapper(obj: Any, *args: Any, **kwargs: Any) -> Any:
+            name = labels.get(id(obj))
+            if name is None:
+                return func(obj, *args, **kwargs)
+            label = f"{name}.{attr}"
+            return self._timed(label, self._stats(label), func, (obj,) + args, kwargs)
+
+        return wrapper
+
+    def _stats(self, label: str) -> Dict[str, float]:
+        return self.stats.setdefault(label, {"calls": 0, "total_s": 0.0, "self_s": 0.0})
+
+    def _timed(
+        self,
+        label: str,
+        stats: Dict[str, float],
+        func: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        children = self._stack()
+        children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            inner = children.pop()
+            if children:
+                children[-1] += elapsed
+            stats["calls"] += 1
+            stats["total_s"] += elapsed
+            stats["self_s"] += elapsed - inner
+            if self.trace and len(self.events) < self.max_events:
+                self.events.append((label, start, elapsed))
+
+    def _stack(self) -> List[float]:
+        stack: Optional[List[float]] = getattr(self._local, "children", None)
+        if stack is None:
+            stack = self._local.children = []
+        return stack
+
+    def _record_solver(
+        self, owner: Any, solver: str, iterations: int, converged: int, failed: int
+    ) -> None:
+        label = self._labels.get(id(owner), type(owner).__name__)
+        entry = self.solvers.setdefault(
+            (label, solver),
+            {"solves": 0, "iterations": 0, "max_iterations": 0, "failures": 0},
+        )
+        entry["solves"] += converged + failed
+        entry["iterations"] += iterations
+        entry["max_iterations"] = max(entry["max_iterations"], iterations)
+        entry["failures"] += failed
+        if self.trace and len(self.events) < self.max_events:
+            self.events.append((f"{label}.{solver}", time.perf_counter(), 0.0))
+
+    def reset(self) -> None:
+        """Clear collected statistics and events, keeping attachments."""
+        for stats in self.stats.values():
+            stats.update(calls=0, total_s=0.0, self_s=0.0)
+        self.solvers.clear()
+        self.events.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Collected statistics as plain data.
+
+        Returns:
+            dict: {"calls": {label: stats}, "solvers": {"label.solver": stats}}
+        """
+        return {
+            "calls": {k: dict(v) for k, v in self.stats.items() if v["calls"]},
+            "solvers": {f"{k[0]}.{k[1]}": dict(v) for k, v in self.solvers.items()},
+        }
+
+    def summary(self, sort: str = "total_s") -> str:
+        """
+        Table of call counts and times, then solver statistics.
+
+        Args:
+            sort (str): Column to sort calls by: "calls", "total_s" or "self_s"
+
+        Returns:
+            str: Formatted report
+        """
+        rows = sorted(
+            ((k, v) for k, v in self.stats.items() if v["calls"]),
+            key=lambda kv: kv[1][sort],
+            reverse=True,
+        )
+        solver_labels = [f"{label}.{solver}" for label, solver in self.solvers]
+        width = max([len(k) for k, _ in rows] + [len(k) for k in solver_labels] + [8])
+        lines = [
+            f"{'Callable':<{width}}  {'calls':>10}  {'total ms':>10}  "
+            f"{'self ms':>10}  {'µs/call':>9}"
+        ]
+        for label, s in rows:
+            lines.append(
+                f"{label:<{width}}  {s['calls']:>10}  {1e3 * s['total_s']:>10.2f}  "
+                f"{1e3 * s['self_s']:>10.2f}  {1e6 * s['total_s'] / s['calls']:>9.2f}"
+            )
+        if self.solvers:
+            lines.append("")
+            lines.append(
+                f"{'Solver':<{width}}  {'solves':>10}  {'iters':>10}  "
+                f"{'max iters':>10}  {'failures':>9}"
+            )
+            for (label, solver), entry in sorted(self.solvers.items()):
+                lines.append(
+                    f"{label + '.' + solver:<{width}}  {entry['solves']:>10}  "
+                    f"{entry['iterations']:>10}  {entry['max_iterations']:>10}  "
+                    f"{entry['failures']:>9}"
+                )
+        return "\n".join(lines)
+
+    def export_trace(self, path: str) -> None:
+        """
+        Write recorded events in Chrome trace-event JSON.
+
+        Open the file in chrome://tracing or https://ui.perfetto.dev. Calls are
+        complete events ("X"), solver reports are instant events ("i").
+        Requires Profiler(trace=True).
+
+        Args:
+            path (str): Output file
+        """
+        events = [
+            {
+                "name": label,
+                "ph": "X" if elapsed else "i",
+                "ts": 1e6 * (start - self._t0),
+                "dur": 1e6 * elapsed,
+                "pid": 0,
+                "tid": 0,
+            }
+            for label, start, elapsed in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
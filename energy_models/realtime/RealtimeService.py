@@ -0,0 +1,247 @@
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_STOP = object()
+
+# Seconds a result may wait for room on a full results queue while stopping
+# before the consumer is taken to be gone
+_STOP_GRACE = 1.0
+
+
+class RealtimeService:
+    def __init__(
+        self,
+        model: Callable[..., Dict[str, Any]],
+        window: float = 0.05,
+        max_batch: int = 4096,
+        maxsize: int = 10_000,
+        constants: Optional[Dict[str, Any]] = None,
+        outputs: Optional[Sequence[str]] = None,
+    ):
+        """
+        Asyncio runtime that evaluates live point updates in micro-batches.
+
+        Producers submit point updates per device (e.g. an AHU or zone); the
+        service keeps the latest value of every point per device. Updates
+        arriving within one window are merged and every device that changed
+        is evaluated in a single vectorized call of model. Results are put on
+        the bounded `results` queue, one dict per device.
+
+        Both queues are bounded: when evaluation or the consumer of results
+        falls behind, submit() waits (backpressure) instead of letting memory
+        grow.
+
+        Args:
+            model (Callable): Batch compute path, e.g. fan.compute_batch, a
+                fleet's compute() or `lambda **kw: plan.run(kw)` with the
+                parameters named explicitly
+            window (float): Seconds to collect updates after the first one
+            max_batch (int): Maximum devices per evaluation
+            maxsize (int): Capacity of the update and result queues
+            constants (dict, optional): Inputs shared by every device
+            outputs (Sequence[str], optional): Result keys to emit (default all)
+        """
+        self.model = model
+        self.window = window
+        self.max_batch = max_batch
+        self.maxsize = maxsize
+        self.constants = dict(constants or {})
+        self.outputs = list(outputs) if outputs is not None else None
+        self.inputs: List[str] = [
+            name
+            for name in inspect.signature(model).parameters
+            if name not in self.constants
+        ]
+        self.state: Dict[Any, Dict[str, Any]] = {}
+        self.stats = {
+            "updates": 0,
+            "batches": 0,
+            "evaluated": 0,
+            "errors": 0,
+            "dropped": 0,
+        }
+        self._dirty: Dict[Any, None] = {}
+        self._stopping = False
+        self._queue: Optional[asyncio.Queue] = None
+        self.results: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "RealtimeService":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start the evaluation task on the running event loop."""
+        self._queue = asyncio.Queue(self.maxsize)
+        self.results = asyncio.Queue(self.maxsize)
+        self._stopping = False
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Evaluate everything already submitted, then stop.
+
+        Never waits on a consumer that has gone away: once stopping, a result
+        that finds the results queue full for a second is dropped (counted
+        in stats["dropped"]), and so is every later one. Keep reading
+        results until stop() returns to receive all of them.
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        # Wakes the task if it waits for updates; a full queue means it is
+        # busy and sees the flag once the queue is drained
+        queue = self._updates()
+        if not queue.full():
+            queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+
+    async def submit(self, key: Any, points: Dict[str, Any]) -> None:
+        """
+        Queue a point update for one device, waiting while the queue is full.
+
+        Args:
+            key: Device identifier, echoed in its results
+            points (dict): Input name → latest value; points not included keep
+                their previous value
+        """
+        await self._updates().put((key, points))
+
+    def try_submit(self, key: Any, points: Dict[str, Any]) -> bool:
+        """
+        Queue a point update without waiting.
+
+        Returns:
+            bool: False if the queue is full and the update was dropped
+        """
+        try:
+            self._updates().put_nowait((key, points))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield results as they are produced, until the service stops."""
+        results = self._results()
+        while True:
+            if (self._task is None or self._task.done()) and results.empty():
+                return
+            result = await results.get()
+            if result is _STOP:
+                return
+            yield result
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._updates()
+        stopping = False
+        while not stopping:
+            if self._stopping and queue.empty():
+                break
+            item = await queue.get()
+            stopping = item is _STOP
+            if not stopping:
+                self._merge(item)
+                deadline = loop.time() + self.window
+                while len(self._dirty) < self.max_batch:
+                    if queue.empty():
+                        timeout = deadline - loop.time()
+                        if timeout <= 0 or self._stopping:
+                            break
+                        try:
+                            item = await asyncio.wait_for(queue.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    else:
+                        item = queue.get_nowait()
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    self._merge(item)
+            while self._dirty:
+                await self._evaluate()
+        await self._put(_STOP)
+
+    async def _put(self, result: Any) -> None:
+        # Backpressure: wait while the results queue is full. Once stopping,
+        # no room for _STOP_GRACE means nobody is reading: drop instead of
+        # waiting forever
+        results = self._results()
+        if not results.full():
+            results.put_nowait(result)
+            return
+        while not self._stopping or not self.stats["dropped"]:
+            try:
+                await asyncio.wait_for(results.put(result), _STOP_GRACE)
+                return
+            except asyncio.TimeoutError:
+                if self._stopping:
+                    break
+        if result is not _STOP:
+            self.stats["dropped"] += 1
+
+    def _updates(self) -> asyncio.Queue:
+        if self._queue is None:
+            raise RuntimeError("RealtimeService is not started; call start()")
+        return self._queue
+
+    def _results(self) -> asyncio.Queue:
+        if self.results is None:
+            raise RuntimeError("RealtimeService is not started; call start()")
+        return self.results
+
+    def _merge(self, item: Any) -> None:
+        key, points = item
+        self.state.setdefault(key, {}).update(points)
+        self._dirty[key] = None
+        self.stats["updates"] += 1
+
+    async def _evaluate(self) -> None:
+        keys: List[Any] = []
+        for key in list(self._dirty):
+            if len(keys) == self.max_batch:
+                break
+            del self._dirty[key]
+            # Devices are evaluated once every input has been reported
+            if all(name in self.state[key] for name in self.inputs):
+                keys.append(key)
+        # A point that is not a number (e.g. None from the BMS) fails its own
+        # device only; the evaluation task must survive it
+        rows = []
+        for key in list(keys):
+            try:
+                rows.append([float(self.state[key][name]) for name in self.inputs])
+            except (TypeError, ValueError) as exc:
+                keys.remove(key)
+                self.stats["errors"] += 1
+                await self._put({"key": key, "error": repr(exc)})
+        if not keys:
+            return
+
+        # One contiguous array per input
+        values = np.array(rows, dtype=float).reshape(len(keys), len(self.inputs))
+        values = np.ascontiguousarray(values.T)
+        kwargs = {name: values[j] for j, name in enumerate(self.inputs)}
+        self.stats["batches"] += 1
+        try:
+            result = self.model(**kwargs, **self.constants)
+        except Exception as exc:
+            self.stats["errors"] += 1
+            for key in keys:
+                await self._put({"key": key, "error": repr(exc)})
+            return
+
+        names = self.outputs if self.outputs is not None else list(result)
+        columns = {
+            name: np.broadcast_to(result[name], (len(keys),)).tolist() for name in names
+        }
+        self.stats["evaluated"] += len(keys)
+        for i, key in enumerate(keys):
+            await self._put({"key": key, **{name: columns[name][i] for name in names}})
@@ -1,15 +1,19 @@
 import datetime
-from typing import Callable, List
+from typing import TYPE_CHECKING, Callable, List, Optional, Union, overload
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class Scheduler:
     def __init__(
         self,
         default: List[float],
-        weekend: List[float] = None,
-        holiday: List[float] = None,
+        weekend: Optional[List[float]] = None,
+        holiday: Optional[List[float]] = None,
         interpolate: bool = False,
-        holiday_dates: List[datetime.date] = None,
+        holiday_dates: Optional[List[datetime.date]] = None,
+        start_date: Optional[datetime.date] = None,
     ):
         """
         Generalized hourly schedule engine.
@@ -20,35 +24,115 @@ class Scheduler:
             holiday (List[float], optional): 24-hour values for holidays.
             interpolate (bool): Whether to interpolate between hours.
             holiday_dates (List[datetime.date], optional): List of holiday dates.
+            start_date (datetime.date, optional): Date of t = 0. If given, t
+                counts hours from its midnight across days (t = 30 is 6:00 on
+                the next day); otherwise every t falls on today.
         """
         self.default = default
         self.weekend = weekend if weekend else default
         self.holiday = holiday if holiday else default
         self.interpolate = interpolate
         self.holiday_dates = set(holiday_dates or [])
+        self.start_date = start_date
 
     def _select_schedule(self, dt: datetime.datetime) -> List[float]:
-        if dt.date() in self.holiday_dates:
-            return self.holiday
-        elif dt.weekday() >= 5:
-            return self.weekend
-        else:
-            return self.default
-
-    def get_value(self, t: float) -> float:
+        return (self.default, self.weekend, self.holiday)[self.day_type(dt.date())]
+
+    def _date(self, t: float) -> datetime.date:
+        if self.start_date is None:
+            return datetime.date.today()
+        return self.start_date + datetime.timedelta(days=int(t // 24))
+
+    def day_type(self, date: datetime.date) -> int:
+        """
+        Profile used on a date: 0 weekday, 1 weekend, 2 holiday.
+        """
+        if date in self.holiday_dates:
+            return 2
+        return 1 if date.weekday() >= 5 else 0
+
+    def day_types(self, t: "np.ndarray") -> "np.ndarray":
+        """
+        Profile index (see day_type()) at every time of an array.
+
+        Args:
+            t (np.ndarray): Time in hours (see start_date)
+
+        Returns:
+            np.ndarray: int8 array of 0 (weekday), 1 (weekend), 2 (holiday)
+        """
+        import numpy as np
+
+        t = np.asarray(t, dtype=float)
+        if self.start_date is None:
+            today = self.day_type(datetime.date.today())
+            return np.full(t.shape, today, dtype=np.int8)
+        # One calendar lookup per day of the covered range, not per timestep
+        days = np.floor_divide(t, 24).astype(np.int64)
+        first, last = (int(days.min()), int(days.max())) if days.size else (0, -1)
+        types = np.array(
+            [self.day_type(self._date(24.0 * d)) for d in range(first, last + 1)],
+            dtype=np.int8,
+        )
+        day_type: "np.ndarray" = types[days - first]
+        return day_type
+
+    def breakpoints(self, t_start: float, t_end: float) -> List[float]:
+        """
+        Whole hours in (t_start, t_end) where the schedule stops being a
+        single constant (or, with interpolate, linear) piece.
+
+        Values only change at hour boundaries, so a simulation can take one
+        step between consecutive breakpoints (see AdaptiveSimulation).
+
+        Args:
+            t_start (float): Start time in hours (see start_date)
+            t_end (float): End time in hours
+
+        Returns:
+            List[float]: Sorted breakpoint times (h)
+        """
+        import math
+
+        import numpy as np
+
+        hours = np.arange(math.floor(t_start), math.ceil(t_end) + 1, dtype=float)
+        if hours.size < 2:
+            return []
+        # Value in the first and the last minute of every hour; the minute
+        # samples of hour k continue those of hour k-1 when both the slope
+        # and the level carry over
+        first = self._get_values(hours)
+        last = self._get_values(hours + 59 / 60)
+        slope = (last - first) / 59
+        same = np.isclose(slope[1:], slope[:-1], rtol=1e-12, atol=1e-12)
+        same &= np.isclose(first[1:], last[:-1] + slope[:-1], rtol=1e-12, atol=1e-12)
+        changes = hours[1:][~same]
+        return [float(h) for h in changes if t_start < h < t_end]
+
+    @overload
+    def get_value(self, t: float) -> float: ...
+
+    @overload
+    def get_value(self, t: "np.ndarray") -> "np.ndarray": ...
+
+    def get_value(self, t: Union[float, "np.ndarray"]) -> Union[float, "np.ndarray"]:
         """
         Evaluate schedule value at time t.
 
         Args:
-            t (float): Time in hours since midnight (e.g., 13.5 = 1:30 PM)
+            t (float | np.ndarray): Time in hours since midnight (e.g., 13.5 = 1:30 PM)
 
         Returns:
-            float: Schedule value at time t.
+            float | np.ndarray: Schedule value at time t, an array if t is one.
         """
+        if not isinstance(t, (int, float)):
+            return self._get_values(t)
+
         hours = int(t) % 24
         minutes = (t % 1.0) * 60
         dt = datetime.datetime.combine(
-            datetime.date.today(), datetime.time(hour=hours, minute=int(minutes))
+            self._date(t), datetime.time(hour=hours, minute=int(minutes))
         )
         schedule = self._select_schedule(dt)
 
@@ -60,15 +144,46 @@ class Scheduler:
         fraction = dt.minute / 60.0
         return (1 - fraction) * schedule[h] + fraction * schedule[h_next]
 
+    def _get_values(self, t: "np.ndarray") -> "np.ndarray":
+        # Array form of get_value(); NumPy is imported here so that importing
+        # the scheduler stays free of heavy dependencies.
+        import numpy as np
+
+        t = np.asarray(t, dtype=float)
+        profiles = np.asarray([self.default, self.weekend, self.holiday], dtype=float)
+        day = self.day_types(t)
+
+        h = np.trunc(t).astype(int) % 24
+        values: "np.ndarray" = profiles[day, h]
+        if not self.interpolate:
+            return values
+
+        fraction = np.floor(np.mod(t, 1.0) * 60) / 60.0
+        following = profiles[day, (h + 1) % 24]
+        interpolated: "np.ndarray" = (1 - fraction) * values + fraction * following
+        return interpolated
+
 
 # Factory functions to plug into the ZoneExhaustFan class
 
 
+# The returned functions keep their Scheduler as a `scheduler` attribute, which
+# batch.compute_by_day() uses to find the day types of a component's inputs.
+
+
 def make_flow_fraction_schedule(schedule: Scheduler) -> Callable[[float], float]:
-    return lambda t: schedule.get_value(t)
+    def flow_fraction(t: float) -> float:
+        return schedule.get_value(t)
+
+    setattr(flow_fraction, "scheduler", schedule)
+    return flow_fraction
 
 
 def make_availability_schedule(
     schedule: Scheduler, threshold: float = 0.1
 ) -> Callable[[float], bool]:
-    return lambda t: schedule.get_value(t) > threshold
\ No newline at end of file
+    def available(t: float) -> bool:
+        return schedule.get_value(t) > threshold
+
+    setattr(available, "scheduler", schedule)
+    return available
@@ -0,0 +1,222 @@
+import inspect
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from energy_models.scheduler.Scheduler import Scheduler
+
+# -------------------------------
+# 🔹 Adaptive Simulation
+# -------------------------------
+#
+# Time runs on the grid of a fixed-step simulation, t_k = t_start + k · dt_min.
+# A step [k0, k1) is accepted from three samples, its first (k0), middle and
+# last (k1 - 1) timestep: the output must vary linearly across it within
+# tolerance, and watched outputs must change less than their limit. Otherwise
+# it is halved. Accepted steps add the sum of the linear interpolant over
+# their timesteps, which is the fixed-step sum whenever the outputs are
+# piecewise linear in t between schedule breakpoints.
+
+
+class AdaptiveSimulation:
+    def __init__(
+        self,
+        component: Any,
+        inputs: Dict[str, Any],
+        integrate: Sequence[str] = ("W_electric",),
+        watch: Optional[Dict[str, float]] = None,
+        rtol: float = 1e-3,
+        atol: float = 0.0,
+        dt_min: float = 1 / 60,
+        dt_max: float = 1.0,
+        schedules: Sequence[Scheduler] = (),
+    ):
+        """
+        Variable-timestep driver for one component over a time range.
+
+        Takes large steps while schedules and inputs are flat and refines
+        them at schedule changes and wherever the outputs vary faster than
+        the tolerances. Every step is a whole number of dt_min timesteps and
+        every evaluation falls on the fixed dt_min grid, so integrals are
+        directly comparable with a fixed-step run.
+
+        Schedule changes are found from Scheduler.breakpoints() of:
+            - inputs built with make_flow_fraction_schedule(),
+              make_availability_schedule() or a Scheduler's get_value
+            - the component's `schedule_attributes` built the same way
+            - the Scheduler objects in `schedules`, for custom callables
+
+        Args:
+            component: Any model with compute(); an argument named `t` that is
+                missing from inputs receives the time (h)
+            inputs (dict): compute() arguments, each a constant or a callable
+                of t (h), e.g. a schedule or an interpolated trend
+            integrate (Sequence[str]): Result keys integrated over time
+            watch (dict, optional): Largest change of an output over one
+                step, e.g. {"Q": 0.05} for CurveSpeedControlledFan's flow
+            rtol (float): Relative tolerance on the integrated outputs
+            atol (float): Absolute tolerance on the integrated outputs
+            dt_min (float): Finest step (h), the fixed step being replaced
+            dt_max (float): Longest step (h)
+            schedules (Sequence[Scheduler]): Further schedules to break at
+
+        Raises:
+            ValueError: If dt_max is shorter than dt_min.
+        """
+        if dt_max < dt_min:
+            raise ValueError(f"dt_max ({dt_max}) must not be below dt_min ({dt_min})")
+        self.component = component
+        self.inputs = dict(inputs)
+        self.integrate = list(integrate)
+        self.watch = dict(watch or {})
+        self.rtol = rtol
+        self.atol = atol
+        self.dt_min = dt_min
+        self.dt_max = dt_max
+        self.schedules = _schedulers(component, self.inputs, schedules)
+        self._pass_t = (
+            "t" in inspect.signature(component.compute).parameters
+            and "t" not in self.inputs
+        )
+        self._samples: Dict[int, Dict[str, float]] = {}
+
+    def run(self, t_start: float, t_end: float) -> Dict[str, Any]:
+        """
+        Simulate from t_start to t_end.
+
+        Args:
+            t_start (float): Start time (h)
+            t_end (float): End time (h); t_end - t_start must be a whole
+                number of dt_min timesteps
+
+        Returns:
+            Dict[str, Any]: Dictionary containing:
+                - "integrals" (dict): ∫ output dt per integrated key, in
+                  output units × h (e.g. Wh for W_electric)
+                - "error" (dict): Heuristic error indicator of each integral
+                  against the fixed-step sum, from the midpoint deviations of
+                  the accepted steps; not a bound, since changes between the
+                  samples of a step (e.g. a threshold crossed inside a ramp)
+                  are invisible to it
+                - "t" (np.ndarray): Start of every step (h)
+                - "dt" (np.ndarray): Length of every step (h)
+                - "mean" (dict): Mean of each integrated output per step
+                - "evaluations" (int): compute() calls made
+
+        Raises:
+            ValueError: If the range is empty or not a whole number of steps.
+        """
+        n = round((t_end - t_start) / self.dt_min)
+        if n <= 0 or not math.isclose(n * self.dt_min, t_end - t_start):
+            raise ValueError(
+                f"t_end - t_start must be a positive multiple of dt_min, "
+                f"got {t_end - t_start} h for dt_min {self.dt_min} h"
+            )
+        self._t_start = t_start
+        self._samples = {}
+        k_max = max(1, int(self.dt_max / self.dt_min + 1e-9))
+
+        # Steps never straddle a schedule change
+        edges = {0, n}
+        for schedule in self.schedules:
+            for t in schedule.breakpoints(t_start, t_end):
+                edges.add(math.ceil((t - t_start) / self.dt_min - 1e-9))
+        cuts = sorted(k for k in edges if 0 <= k <= n)
+
+        steps: List[Tuple[int, int, Dict[str, float], Dict[str, float]]] = []
+        for k0, k1 in zip(cuts, cuts[1:]):
+            # Cut into steps of at most dt_max, each split until accepted
+            stack = [(k, min(k + k_max, k1)) for k in range(k0, k1, k_max)][::-1]
+            while stack:
+                a, b = stack.pop()
+                accepted = self._step(a, b)
+                if accepted is None:
+                    middle = (a + b) // 2
+                    stack += [(middle, b), (a, middle)]
+                else:
+                    steps.append((a, b, *accepted))
+
+        integrals = {key: 0.0 for key in self.integrate}
+        error = {key: 0.0 for key in self.integrate}
+        for a, b, sums, deviations in steps:
+            for key in self.integrate:
+                integrals[key] += sums[key] * self.dt_min
+                error[key] += deviations[key] * (b - a) * self.dt_min / 2
+        bounds = np.array([(a, b) for a, b, *_ in steps], dtype=float).reshape(-1, 2)
+        dt = (bounds[:, 1] - bounds[:, 0]) * self.dt_min
+        return {
+            "integrals": integrals,
+            "error": error,
+            "t": t_start + bounds[:, 0] * self.dt_min,
+            "dt": dt,
+            "mean": {
+                key: np.array([s[key] for *_, s, _ in steps]) * self.dt_min / dt
+                for key in self.integrate
+            },
+            "evaluations": len(self._samples),
+        }
+
+    def _step(
+        self, a: int, b: int
+    ) -> Optional[Tuple[Dict[str, float], Dict[str, float]]]:
+        # Sums of the linear interpolant over timesteps a..b-1 and midpoint
+        # deviations (the error indicator), or None if the step must be split
+        last = b - 1
+        first, end = self._sample(a), self._sample(last)
+        if last - a < 2:
+            sums = {key: first[key] + end[key] * (last - a) for key in self.integrate}
+            return sums, {key: 0.0 for key in self.integrate}
+        for key, limit in self.watch.items():
+            if abs(end[key] - first[key]) > limit:
+                return None
+        m = (a + last) // 2
+        middle = self._sample(m)
+        sums, deviations = {}, {}
+        for key in self.integrate:
+            f0, fm, f1 = first[key], middle[key], end[key]
+            linear = f0 + (f1 - f0) * (m - a) / (last - a)
+            deviation = abs(fm - linear)
+            if deviation > self.atol + self.rtol * max(abs(f0), abs(fm), abs(f1)):
+                return None
+            # Two linear pieces through the samples, sharing the middle one
+            sums[key] = (m - a + 1) * (f0 + fm) / 2 + (last - m + 1) * (fm + f1) / 2
+            sums[key] -= fm
+            deviations[key] = deviation
+        return sums, deviations
+
+    def _sample(self, k: int) -> Dict[str, float]:
+        # Outputs at timestep k of the fixed grid, evaluated once per run
+        sample = self._samples.get(k)
+        if sample is None:
+            t = self._t_start + k * self.dt_min
+            args = {
+                name: value(t) if callable(value) else value
+                for name, value in self.inputs.items()
+            }
+            if self._pass_t:
+                args["t"] = t
+            result = self.component.compute(**args)
+            sample = {key: float(result[key]) for key in (*self.integrate, *self.watch)}
+            self._samples[k] = sample
+        return sample
+
+
+# ---- 🔹 Helpers ----
+
+
+def _schedulers(
+    component: Any, inputs: Dict[str, Any], schedules: Sequence[Scheduler]
+) -> List[Scheduler]:
+    # Distinct Schedulers behind the inputs and the component's schedules
+    funcs = list(inputs.values())
+    funcs += [
+        getattr(component, name)
+        for name in getattr(component, "schedule_attributes", ())
+    ]
+    found = {id(s): s for s in schedules}
+    for func in funcs:
+        scheduler = getattr(func, "scheduler", getattr(func, "__self__", None))
+        if isinstance(scheduler, Scheduler):
+            found[id(scheduler)] = scheduler
+    return list(found.values())
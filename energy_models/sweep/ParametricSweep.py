@@ -0,0 +1,260 @@
+import hashlib
+import itertools
+import os
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+_REDUCTIONS = ("sum", "mean", "max", "min")
+
+# Inputs shared by every task, installed once per worker process
+_worker_inputs: Dict[str, Any] = {}
+
+
+def _init_worker(inputs: Dict[str, Any]) -> None:
+    global _worker_inputs
+    _worker_inputs = inputs
+
+
+def _evaluate(
+    build: Callable[..., Any],
+    base: Dict[str, Any],
+    variant: Dict[str, Any],
+    inputs: Dict[str, Any],
+    outputs: Optional[Sequence[str]],
+    reduce: Union[str, Callable[[Any], Any], None],
+) -> Dict[str, Any]:
+    import numpy as np
+
+    component = build(**base, **variant)
+    method = getattr(component, "compute_batch", None) or component.compute
+    result: Dict[str, Any] = method(**inputs)
+    if outputs is not None:
+        result = {key: result[key] for key in outputs}
+    if reduce is None:
+        return result
+    if callable(reduce):
+        return {key: reduce(value) for key, value in result.items()}
+    return {key: float(getattr(np, reduce)(value)) for key, value in result.items()}
+
+
+def _run_chunk(
+    build: Callable[..., Any],
+    base: Dict[str, Any],
+    variants: List[Dict[str, Any]],
+    outputs: Optional[Sequence[str]],
+    reduce: Union[str, Callable[[Any], Any], None],
+) -> List[Dict[str, Any]]:
+    return [
+        _evaluate(build, base, variant, _worker_inputs, outputs, reduce)
+        for variant in variants
+    ]
+
+
+def _name(value: Any) -> Any:
+    # Classes and functions by their import path; strings and None as is
+    if callable(value):
+        return (
+            getattr(value, "__module__", None),
+            getattr(value, "__qualname__", type(value).__qualname__),
+        )
+    return value
+
+
+class ParametricSweep:
+    def __init__(
+        self,
+        component: Callable[..., Any],
+        variants: Union[Mapping[str, Sequence[Any]], Sequence[Dict[str, Any]]],
+        inputs: Dict[str, Any],
+        base: Optional[Dict[str, Any]] = None,
+        outputs: Optional[Sequence[str]] = None,
+        reduce: Union[str, Callable[[Any], Any], None] = None,
+        chunk_size: int = 64,
+        max_workers: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None,
+    ):
+        """
+        Parametric design sweep of one component class over shared inputs.
+
+        Every variant builds component(**base, **variant) and evaluates
+        compute_batch(**inputs) (compute() for the valves) on the same input
+        timeseries. Variants are sent to a process pool in chunks; the input
+        arrays travel to each worker once through the pool initializer, not
+        with every task.
+
+        Args:
+            component (Callable): Component class, or a picklable module-level
+                factory taking the same keyword arguments
+            variants (dict | list): Either a grid, {name: [values, ...]}, whose
+                Cartesian product is swept, or an explicit list of parameter
+                dicts (e.g. a random or Latin hypercube sample)
+            inputs (dict): Keyword arguments of compute_batch(), shared by all
+                variants
+            base (dict, optional): Parameters common to every variant
+            outputs (Sequence[str], optional): Result keys to keep (default all)
+            reduce (str | Callable, optional): "sum", "mean", "max", "min" or a
+                picklable callable applied to every kept array, so only
+                summaries travel back
+            chunk_size (int): Variants per task
+            max_workers (int, optional): Worker processes; 0 runs in-process
+            checkpoint_dir (str, optional): Directory where finished chunks are
+                stored; a rerun with the same definition skips them
+
+        Note:
+            Everything sent to workers must be picklable: classes and
+            module-level functions are, lambdas (including the curves.py
+            factories' return values) are not. Build such callables inside a
+            module-level factory passed as component.
+        """
+        if isinstance(variants, Mapping):
+            names = list(variants)
+            variants = [
+                dict(zip(names, values))
+                for values in itertools.product(*(variants[n] for n in names))
+            ]
+        if isinstance(reduce, str) and reduce not in _REDUCTIONS:
+            raise ValueError(f"reduce must be one of {_REDUCTIONS} or a callable")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.component = component
+        self.variants: List[Dict[str, Any]] = list(variants)
+        self.inputs = inputs
+        self.base = dict(base or {})
+        self.outputs = list(outputs) if outputs is not None else None
+        self.reduce = reduce
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.checkpoint_dir = checkpoint_dir
+
+    def __len__(self) -> int:
+        return len(self.variants)
+
+    def _chunks(self) -> List[Tuple[int, List[Dict[str, Any]]]]:
+        return [
+            (start, self.variants[start : start + self.chunk_size])
+            for start in range(0, len(self.variants), self.chunk_size)
+        ]
+
+    def _fingerprint(self) -> str:
+        # Identifies the sweep definition, input data included, so
+        # checkpoints are never mixed up. Callables are named by module and
+        # qualified name: their repr() holds a memory address.
+        digest = hashlib.sha256(
+            pickle.dumps(
+                (
+                    _name(self.component),
+                    self.variants,
+                    self.base,
+                    self.outputs,
+                    _name(self.reduce),
+                    self.chunk_size,
+                )
+            )
+        )
+        for key in sorted(self.inputs):
+            value = self.inputs[key]
+            if hasattr(value, "dtype") and hasattr(value, "tobytes"):
+                digest.update(pickle.dumps((key, value.dtype.str, value.shape)))
+                digest.update(value.tobytes())
+            else:
+                digest.update(pickle.dumps((key, value)))
+        return digest.hexdigest()[:16]
+
+    def _checkpoint_path(self, key: str, start: int) -> Optional[str]:
+        if self.checkpoint_dir is None:
+            return None
+        return os.path.join(self.checkpoint_dir, f"{key}_{start:09d}.pkl")
+
+    def _load(self, key: str, start: int) -> Optional[List[Dict[str, Any]]]:
+        path = self._checkpoint_path(key, start)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            results: List[Dict[str, Any]] = pickle.load(f)
+        return results
+
+    def _store(self, key: str, start: int, results: List[Dict[str, Any]]) -> None:
+        path = self._checkpoint_path(key, start)
+        if path is None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic rename: a crash never leaves a half-written chunk behind
+        os.replace(tmp, path)
+
+    def run(self) -> Iterator[Tuple[int, Dict[str, Any], Dict[str, Any]]]:
+        """
+        Evaluate all variants, streaming results back in variant order.
+
+        Yields:
+            Tuple: (variant index, variant parameters, result dict)
+        """
+        chunks = self._chunks()
+        args = (self.component, self.base)
+        tail = (self.outputs, self.reduce)
+        # Hashing the inputs once per run, not once per chunk
+        key = self._fingerprint() if self.checkpoint_dir is not None else ""
+
+        if self.max_workers == 0:
+            _init_worker(self.inputs)
+            for start, variants in chunks:
+                results = self._load(key, start)
+                if results is None:
+                    results = _run_chunk(*args, variants, *tail)
+                    self._store(key, start, results)
+                yield from self._emit(start, variants, results)
+            return
+
+        workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.inputs,)
+        ) as pool:
+            # (start, variants, result, loaded from a checkpoint)
+            pending: List[Tuple[int, List[Dict[str, Any]], Future, bool]] = []
+            queue = iter(chunks)
+            # Bounded look-ahead keeps every worker busy while results that
+            # arrive out of order wait for their predecessors
+            window = 2 * workers
+
+            def submit() -> None:
+                for start, variants in queue:
+                    stored = self._load(key, start)
+                    if stored is None:
+                        future = pool.submit(_run_chunk, *args, variants, *tail)
+                    else:
+                        future = Future()
+                        future.set_result(stored)
+                    pending.append((start, variants, future, stored is not None))
+                    return
+
+            for _ in range(window):
+                submit()
+            while pending:
+                start, variants, future, loaded = pending.pop(0)
+                results = future.result()
+                if not loaded:
+                    self._store(key, start, results)
+                submit()
+                yield from self._emit(start, variants, results)
+
+    @staticmethod
+    def _emit(
+        start: int, variants: List[Dict[str, Any]], results: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[int, Dict[str, Any], Dict[str, Any]]]:
+        for offset, (variant, result) in enumerate(zip(variants, results)):
+            yield start + offset, variant, result
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class ArrowWriter:
+    def __init__(self, path: str, dtype: Any = "float64"):
+        """
+        Append result chunks as record batches of an Arrow IPC file.
+
+        Every write() becomes one record batch, so memory use stays at one
+        chunk. The file can be memory-mapped by pyarrow, polars or pandas
+        (see load_results()). Requires the optional pyarrow dependency
+        (`pip install energy_models[arrow]`).
+
+        Args:
+            path (str): Output .arrow file
+            dtype: Arrow/NumPy type name every output is stored as
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError(
+                "ArrowWriter requires pyarrow; install energy_models[arrow] "
+                "or use NpyWriter."
+            ) from exc
+        self._pa = pa
+        self.path = path
+        self.dtype = pa.from_numpy_dtype(np.dtype(dtype))
+        self.rows = 0
+        self._sink = pa.OSFile(path, "wb")
+        self._writer: Optional[Any] = None
+        self._keys: Optional[List[str]] = None
+
+    def __enter__(self) -> "ArrowWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def write(self, chunk: Dict[str, Any]) -> None:
+        """
+        Append one chunk of outputs as a record batch.
+
+        Args:
+            chunk (dict): Output name → array (scalars are broadcast to the
+                chunk length); every chunk must have the same names
+        """
+        pa = self._pa
+        if self._keys is None:
+            self._keys = list(chunk)
+        elif set(chunk) != set(self._keys):
+            raise ValueError(
+                f"Chunk outputs {sorted(chunk)} differ from the first chunk's "
+                f"{sorted(self._keys)}"
+            )
+        n = max((np.size(v) for v in chunk.values()), default=0)
+        arrays = [
+            pa.array(np.broadcast_to(np.asarray(v), (n,)), type=self.dtype)
+            for v in (chunk[key] for key in self._keys)
+        ]
+        batch = pa.record_batch(arrays, names=self._keys)
+        if self._writer is None:
+            self._writer = pa.ipc.new_file(self._sink, batch.schema)
+        self._writer.write_batch(batch)
+        self.rows += n
+
+    def close(self) -> None:
+        """Write the file footer and close the file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if not self._sink.closed:
+            self._sink.close()
@@ -0,0 +1,121 @@
+import os
+import shutil
+import struct
+import zipfile
+from typing import Any, BinaryIO, Dict, List, Optional
+
+import numpy as np
+
+_MAGIC = b"\x93NUMPY\x01\x00"
+
+# Fixed header size, so the final row count can be written over the
+# placeholder without moving the data (must be a multiple of 64)
+_HEADER_BYTES = 128
+
+
+def _header(dtype: np.dtype, rows: int) -> bytes:
+    text = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (rows,),
+        }
+    )
+    pad = _HEADER_BYTES - len(_MAGIC) - 2 - len(text) - 1
+    return (
+        _MAGIC
+        + struct.pack("<H", len(text) + pad + 1)
+        + text.encode()
+        + (b" " * pad + b"\n")
+    )
+
+
+class NpyWriter:
+    def __init__(self, path: str, dtype: Any = np.float64):
+        """
+        Append result chunks to one .npy file per output, on disk.
+
+        Each write() appends the raw bytes of every output array; nothing but
+        the current chunk is held in memory. close() writes the final row
+        counts into the .npy headers, so the files open with
+        np.load(..., mmap_mode="r") (see load_results()). A path ending in
+        ".npz" collects the parts in a "<path>.parts" directory and bundles
+        them, uncompressed, into one archive on close.
+
+        Args:
+            path (str): Output directory, or an .npz file
+            dtype: dtype every output is stored as
+        """
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.npz = path.endswith(".npz")
+        self.directory = f"{path}.parts" if self.npz else path
+        self.rows = 0
+        self._files: Dict[str, BinaryIO] = {}
+        self._keys: Optional[List[str]] = None
+        self._closed = False
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self) -> "NpyWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def write(self, chunk: Dict[str, Any]) -> None:
+        """
+        Append one chunk of outputs.
+
+        Args:
+            chunk (dict): Output name → 1-D array (scalars are broadcast to
+                the chunk length); every chunk must have the same names
+
+        Raises:
+            ValueError: If the names differ from the first chunk's, or an
+                output has more than one dimension (e.g. a fleet result;
+                write one chunk per unit instead)
+        """
+        for key, value in chunk.items():
+            if np.ndim(value) > 1:
+                raise ValueError(
+                    f"Output {key!r} has shape {np.shape(value)}; NpyWriter "
+                    "appends 1-D chunks only"
+                )
+        if self._keys is None:
+            self._keys = list(chunk)
+            for key in self._keys:
+                f = open(os.path.join(self.directory, f"{key}.npy"), "wb")
+                f.write(_header(self.dtype, 0))
+                self._files[key] = f
+        elif set(chunk) != set(self._keys):
+            raise ValueError(
+                f"Chunk outputs {sorted(chunk)} differ from the first chunk's "
+                f"{sorted(self._keys)}"
+            )
+
+        n = max((np.size(v) for v in chunk.values()), default=0)
+        for key in self._keys:
+            value = np.asarray(chunk[key], dtype=self.dtype)
+            if value.size != n:
+                value = np.broadcast_to(value, (n,))
+            self._files[key].write(np.ascontiguousarray(value).tobytes())
+        self.rows += n
+
+    def close(self) -> None:
+        """Finalize the headers and, for .npz output, build the archive."""
+        if self._closed:
+            return
+        self._closed = True
+        for f in self._files.values():
+            f.seek(0)
+            f.write(_header(self.dtype, self.rows))
+            f.close()
+        if self.npz:
+            # Written even without any chunks, so the archive always exists
+            with zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED) as archive:
+                for key in self._keys or []:
+                    archive.write(
+                        os.path.join(self.directory, f"{key}.npy"), f"{key}.npy"
+                    )
+            shutil.rmtree(self.directory)
+        self._files.clear()
@@ -0,0 +1,204 @@
+import csv
+import itertools
+import os
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+# -------------------------------
+# 🔹 Streaming Timeseries Readers
+# -------------------------------
+#
+# EPW weather files and BMS trend CSVs are read a fixed number of rows at a
+# time and returned as dicts of NumPy arrays, ready to be passed to the
+# compute_batch() methods. Only one chunk is held in memory at once.
+
+EPW_HEADER_LINES = 8
+
+# EPW data fields in file order (EnergyPlus Auxiliary Programs, Weather Format)
+EPW_FIELDS = (
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "data_source",
+    "dry_bulb_temperature",
+    "dew_point_temperature",
+    "relative_humidity",
+    "atmospheric_pressure",
+    "extraterrestrial_horizontal_radiation",
+    "extraterrestrial_direct_normal_radiation",
+    "horizontal_infrared_radiation",
+    "global_horizontal_radiation",
+    "direct_normal_radiation",
+    "diffuse_horizontal_radiation",
+    "global_horizontal_illuminance",
+    "direct_normal_illuminance",
+    "diffuse_horizontal_illuminance",
+    "zenith_luminance",
+    "wind_direction",
+    "wind_speed",
+    "total_sky_cover",
+    "opaque_sky_cover",
+    "visibility",
+    "ceiling_height",
+    "present_weather_observation",
+    "present_weather_codes",
+    "precipitable_water",
+    "aerosol_optical_depth",
+    "snow_depth",
+    "days_since_last_snowfall",
+    "albedo",
+    "liquid_precipitation_depth",
+    "liquid_precipitation_quantity",
+)
+
+# Text fields that are never converted to numbers
+_EPW_TEXT_FIELDS = {"data_source", "present_weather_codes"}
+
+# Cumulative day count at the start of each month (non-leap year, as in EPW)
+_MONTH_START_DAY = np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+
+def _to_float(values: Sequence[str]) -> np.ndarray:
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        # Blank cells in trend logs become NaN
+        return np.array([float(v) if v.strip() else np.nan for v in values])
+
+
+def _columns(rows: List[List[str]], indices: Sequence[int]) -> List[np.ndarray]:
+    return [_to_float([row[i] for row in rows]) for i in indices]
+
+
+def read_epw(
+    path: str, chunk_size: int = 8760, columns: Optional[Sequence[str]] = None
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Stream an EPW weather file in chunks of rows.
+
+    Besides the EPW fields, every chunk has "t": hours since the start of the
+    year at the beginning of each record's interval (EPW hour 1 → t = 0),
+    which the schedules and coils accept directly.
+
+    Args:
+        path (str): EPW file
+        chunk_size (int): Rows per chunk
+        columns (Sequence[str], optional): Fields to return (see EPW_FIELDS);
+            defaults to every numeric field
+
+    Yields:
+        Dict[str, np.ndarray]: Field name → float array of up to chunk_size rows
+    """
+    names = (
+        list(columns)
+        if columns is not None
+        else [name for name in EPW_FIELDS if name not in _EPW_TEXT_FIELDS]
+    )
+    for name in names:
+        if name not in EPW_FIELDS or name in _EPW_TEXT_FIELDS:
+            raise ValueError(f"Unknown or non-numeric EPW field: {name}")
+    # Month, day and hour are always read to build "t"
+    wanted = list(dict.fromkeys(names + ["month", "day", "hour"]))
+    indices = [EPW_FIELDS.index(name) for name in wanted]
+
+    with open(path, newline="") as f:
+        for _ in range(EPW_HEADER_LINES):
+            next(f, None)
+        reader = csv.reader(f)
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                return
+            data = dict(zip(wanted, _columns(rows, indices)))
+            month = data["month"].astype(int)
+            data["t"] = 24.0 * (_MONTH_START_DAY[month - 1] + data["day"] - 1) + (
+                data["hour"] - 1
+            )
+            yield {name: data[name] for name in names + ["t"]}
+
+
+def read_csv(
+    path: str,
+    chunk_size: int = 100_000,
+    columns: Optional[Sequence[str]] = None,
+    time_column: Optional[str] = None,
+    origin: Optional[str] = None,
+    delimiter: str = ",",
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Stream a trend-log CSV with a header row in chunks of rows.
+
+    Args:
+        path (str): CSV file
+        chunk_size (int): Rows per chunk
+        columns (Sequence[str], optional): Numeric columns to return; defaults
+            to every column except time_column
+        time_column (str, optional): Timestamp column (ISO 8601, e.g.
+            "2024-01-01 00:15:00"), returned as float hours since origin
+        origin (str, optional): Timestamp for t = 0; defaults to the first
+            timestamp in the file
+        delimiter (str): Field separator
+
+    Yields:
+        Dict[str, np.ndarray]: Column name → float array of up to chunk_size rows
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = [name.strip() for name in next(reader)]
+        names = (
+            list(columns)
+            if columns is not None
+            else [name for name in header if name != time_column]
+        )
+        missing = [n for n in names + [time_column or header[0]] if n not in header]
+        if missing:
+            raise ValueError(f"Columns not found in {path}: {missing}")
+        indices = [header.index(name) for name in names]
+        t0 = np.datetime64(origin, "s") if origin is not None else None
+
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                return
+            data = dict(zip(names, _columns(rows, indices)))
+            if time_column is not None:
+                i = header.index(time_column)
+                stamps = np.array(
+                    [row[i].strip() for row in rows], dtype="datetime64[s]"
+                )
+                if t0 is None:
+                    t0 = stamps[0]
+                data[time_column] = (stamps - t0).astype(float) / 3600.0
+            yield data
+
+
+def load_results(path: str) -> Mapping[str, np.ndarray]:
+    """
+    Open results written by NpyWriter or ArrowWriter without reading them.
+
+    Args:
+        path (str): NpyWriter directory, .npz file or Arrow IPC (.arrow) file
+
+    Returns:
+        Mapping: Output name → array; memory-mapped for directories, read
+        member by member on access for .npz, and concatenated from the
+        memory-mapped record batches for Arrow files
+    """
+    if os.path.isdir(path):
+        return {
+            name[: -len(".npy")]: np.load(os.path.join(path, name), mmap_mode="r")
+            for name in sorted(os.listdir(path))
+            if name.endswith(".npy")
+        }
+    if path.endswith(".npz"):
+        archive: Mapping[str, np.ndarray] = np.load(path)
+        return archive
+    if path.endswith(".arrow"):
+        import pyarrow as pa
+
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+    raise ValueError(f"Unrecognized results path: {path}")
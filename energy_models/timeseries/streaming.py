@@ -0,0 +1,98 @@
+import inspect
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from energy_models.batch.batch import precision
+
+# -------------------------------
+# 🔹 Chunked Batch Evaluation
+# -------------------------------
+#
+# Glue between the readers (chunks of input columns), a batch compute path
+# and a writer (chunks of outputs), so a multi-year, minute-resolution run
+# holds one chunk at a time.
+
+
+def map_chunks(
+    method: Callable[..., Dict[str, Any]],
+    chunks: Iterable[Dict[str, Any]],
+    inputs: Optional[Dict[str, str]] = None,
+    constants: Optional[Dict[str, Any]] = None,
+    outputs: Optional[Sequence[str]] = None,
+    passthrough: Sequence[str] = (),
+    dtype: Any = np.float64,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Evaluate a batch compute path chunk by chunk.
+
+    Each parameter of method is bound, in order of precedence, from
+    constants, from the chunk column named in inputs, or from a chunk column
+    with the parameter's own name.
+
+    Args:
+        method (Callable): compute_batch() of a component (compute() for the
+            valves), or any callable taking arrays by keyword
+        chunks (Iterable[dict]): Input chunks, e.g. from read_epw()/read_csv()
+        inputs (dict, optional): Parameter → chunk column, e.g.
+            {"T_air_in": "dry_bulb_temperature"}
+        constants (dict, optional): Parameter → value shared by every chunk
+        outputs (Sequence[str], optional): Result keys to keep (default all)
+        passthrough (Sequence[str]): Chunk columns copied into every result,
+            e.g. "t"
+        dtype: Working precision of method, np.float64 or np.float32
+
+    Yields:
+        dict: Result of method for each chunk
+
+    Raises:
+        ValueError: If a parameter cannot be bound.
+    """
+    inputs = inputs or {}
+    constants = constants or {}
+    params = list(inspect.signature(method).parameters)
+
+    for chunk in chunks:
+        kwargs = {}
+        for param in params:
+            if param in constants:
+                kwargs[param] = constants[param]
+            elif param in inputs:
+                kwargs[param] = chunk[inputs[param]]
+            elif param in chunk:
+                kwargs[param] = chunk[param]
+            else:
+                raise ValueError(f"No input bound to parameter {param!r}")
+        with precision(dtype):
+            result = method(**kwargs)
+        if outputs is not None:
+            result = {key: result[key] for key in outputs}
+        for column in passthrough:
+            result[column] = chunk[column]
+        yield result
+
+
+def run_stream(
+    method: Callable[..., Dict[str, Any]],
+    chunks: Iterable[Dict[str, Any]],
+    writer: Any,
+    **kwargs: Any,
+) -> int:
+    """
+    Evaluate every chunk and append the results to a writer.
+
+    Args:
+        method (Callable): Batch compute path (see map_chunks())
+        chunks (Iterable[dict]): Input chunks
+        writer: NpyWriter, ArrowWriter or any object with write(dict)
+        **kwargs: inputs, constants, outputs, passthrough, dtype (see
+            map_chunks())
+
+    Returns:
+        int: Number of rows written
+    """
+    rows = 0
+    for result in map_chunks(method, chunks, **kwargs):
+        writer.write(result)
+        rows += max((np.size(v) for v in result.values()), default=0)
+    return rows
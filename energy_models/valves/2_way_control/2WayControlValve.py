@@ -1,5 +1,19 @@
 from typing import Dict, Literal
 
+from energy_models.valves.characteristics import (
+    ArrayLike,
+    as_batch,
+    characterized_kv,
+    characterized_kv_slope,
+    characterized_stroke,
+    clip_positive,
+    required_kv,
+    resolve_characteristic,
+    resolve_inverse,
+    resolve_slope,
+    sqrt_slope,
+)
+
 
 class TwoWayControlValve:
     def __init__(
@@ -19,6 +33,9 @@ class TwoWayControlValve:
             characteristic (str): Flow type: "equal_percentage", "linear", "quick_opening"
             exponent (float): Exponent for equal-percentage curve
             rho (float): Water density (kg/m³)
+
+        Raises:
+            ValueError: If the characteristic is not supported.
         """
         self.kvs = kvs
         self.x0 = x0
@@ -26,41 +43,45 @@ class TwoWayControlValve:
         self.exponent = exponent
         self.rho = rho
 
-    def kv(self, x: float) -> float:
+    @property
+    def characteristic(self) -> str:
+        return self._characteristic
+
+    @characteristic.setter
+    def characteristic(self, value: str) -> None:
+        # Resolve the characteristic once instead of on every kv() call
+        self._shape = resolve_characteristic(value)
+        self._inverse = resolve_inverse(value)
+        self._slope = resolve_slope(value)
+        self._characteristic = value
+
+    def kv(self, x: ArrayLike) -> ArrayLike:
         """
         Compute Kv at valve position x, based on selected characteristic.
 
         Args:
-            x (float): Valve position (0-1)
+            x (float | np.ndarray): Valve position (0-1), scalar or array
 
         Returns:
-            float: Partial Kv
+            float | np.ndarray: Partial Kv, zero where x <= x0
         """
-        if x <= self.x0:
-            return 0.0
-
-        scaled_x = (x - self.x0) / (1 - self.x0)
+        return characterized_kv(x, self.kvs, self.x0, self._shape, self.exponent)
 
-        if self.characteristic == "equal_percentage":
-            return self.kvs * (scaled_x ** self.exponent)
-        elif self.characteristic == "linear":
-            return self.kvs * scaled_x
-        elif self.characteristic == "quick_opening":
-            return self.kvs * (scaled_x ** 0.5)
-        else:
-            raise ValueError(f"Unknown valve characteristic: {self.characteristic}")
-
-    def compute(self, x: float, delta_p: float) -> Dict[str, float]:
+    def compute(self, x: ArrayLike, delta_p: ArrayLike) -> Dict[str, ArrayLike]:
         """
         Compute flow through valve.
 
+        Scalars return floats; if either input is an array, both are
+        broadcast together and every output is an array.
+
         Args:
-            x (float): Valve position (0-1)
-            delta_p (float): Pressure drop across valve (kPa)
+            x (float | np.ndarray): Valve position (0-1)
+            delta_p (float | np.ndarray): Pressure drop across valve (kPa)
 
         Returns:
             dict: Kv, volumetric flow (m³/h), and mass flow (kg/s)
         """
+        x, delta_p = as_batch(x, delta_p)
         kv_val = self.kv(x)
         V_dot = kv_val * (delta_p ** 0.5)  # m³/h
         m_dot = self.rho * V_dot / 3600    # kg/s
@@ -69,4 +90,84 @@ class TwoWayControlValve:
             "kv": kv_val,
             "V_dot": V_dot,
             "m_dot": m_dot,
-        }
\ No newline at end of file
+        }
+
+    def jacobian(
+        self, x: ArrayLike, delta_p: ArrayLike
+    ) -> Dict[str, Dict[str, ArrayLike]]:
+        """
+        Analytic partial derivatives of the flow w.r.t. stroke and pressure drop.
+
+        Scalars return floats; if either input is an array, every entry is
+        an array. Derivatives with respect to x are zero at or below x0; the
+        one with respect to delta_p is infinite at zero pressure drop on an
+        open valve.
+
+        Args:
+            x (float | np.ndarray): Valve position (0-1)
+            delta_p (float | np.ndarray): Pressure drop across valve (kPa)
+
+        Returns:
+            dict: output → {input → ∂output/∂input} for kv, V_dot (m³/h) and
+            m_dot (kg/s)
+        """
+        x, delta_p = as_batch(x, delta_p)
+        kv_val = self.kv(x)
+        d_kv = characterized_kv_slope(
+            x, self.kvs, self.x0, self._slope, self.exponent
+        )
+        d_V_dot = {
+            "x": d_kv * (delta_p ** 0.5),
+            "delta_p": sqrt_slope(delta_p, kv_val),
+        }
+
+        return {
+            "kv": {"x": d_kv},
+            "V_dot": d_V_dot,
+            "m_dot": {k: self.rho * d / 3600 for k, d in d_V_dot.items()},
+        }
+
+    def stroke_for_kv(self, kv: ArrayLike) -> Dict[str, ArrayLike]:
+        """
+        Closed-form inverse of kv(): stroke giving a target Kv.
+
+        Args:
+            kv (float | np.ndarray): Target flow coefficient (m³/h·√kPa)
+
+        Returns:
+            dict: Stroke x and saturation flags. "saturated_low" marks
+            targets at or below zero (x pinned at x0), "saturated_high"
+            targets above kvs (x pinned at 1). Never raises.
+        """
+        x, low, high = characterized_stroke(
+            kv, self.kvs, self.x0, self._inverse, self.exponent
+        )
+        return {"x": x, "saturated_low": low, "saturated_high": high}
+
+    def solve_stroke(
+        self, V_dot: ArrayLike, delta_p: ArrayLike
+    ) -> Dict[str, ArrayLike]:
+        """
+        Stroke that delivers a target flow at a known pressure drop.
+
+        Args:
+            V_dot (float | np.ndarray): Target volumetric flow (m³/h)
+            delta_p (float | np.ndarray): Pressure drop across valve (kPa)
+
+        Returns:
+            dict: Stroke x, the flow actually achieved at that stroke
+            (kv, V_dot, m_dot; differs from the target only when saturated)
+            and the "saturated_low" / "saturated_high" flags.
+        """
+        V_dot, delta_p = as_batch(V_dot, delta_p)
+        result = self.stroke_for_kv(required_kv(V_dot, delta_p))
+        # Report achieved flow against a non-negative ΔP so saturated points stay real
+        achieved = self.compute(result["x"], clip_positive(delta_p))
+        return {
+            "x": result["x"],
+            "kv": achieved["kv"],
+            "V_dot": achieved["V_dot"],
+            "m_dot": achieved["m_dot"],
+            "saturated_low": result["saturated_low"],
+            "saturated_high": result["saturated_high"],
+        }
@@ -1,5 +1,18 @@
-from typing import Dict, Literal
-import math
+from typing import Callable, Dict, Literal
+
+import numpy as np
+
+from energy_models.valves.characteristics import (
+    ArrayLike,
+    as_batch,
+    characterized_kv,
+    characterized_stroke,
+    clip_positive,
+    required_kv,
+    resolve_characteristic,
+    resolve_inverse,
+    sqrt,
+)
 
 
 class ThreeWayControlValve:
@@ -52,6 +65,9 @@ class ThreeWayControlValve:
             characteristic_a (str): A-AB port flow type ("equal_percentage", "linear", "quick_opening")
             characteristic_b (str): B-AB port flow type
             bypass_ratio (float): Bypass scaling factor (default 0.7)
+
+        Raises:
+            ValueError: If either characteristic is not supported.
         """
         self.kvs_a = kvs_a
         self.kvs_b = kvs_b
@@ -63,55 +79,81 @@ class ThreeWayControlValve:
         self.characteristic_b = characteristic_b
         self.bypass_ratio = bypass_ratio
 
-    def _kv(self, x: float, kvs: float, characteristic: str, exponent: float = 3.5) -> float:
-        """Compute Kv based on characteristic curve.
+    @property
+    def characteristic_a(self) -> str:
+        return self._characteristic_a
+
+    @characteristic_a.setter
+    def characteristic_a(self, value: str) -> None:
+        # Resolve the characteristic once instead of on every kv_a() call
+        self._shape_a = resolve_characteristic(value)
+        self._inverse_a = resolve_inverse(value)
+        self._characteristic_a = value
+
+    @property
+    def characteristic_b(self) -> str:
+        return self._characteristic_b
+
+    @characteristic_b.setter
+    def characteristic_b(self, value: str) -> None:
+        self._shape_b = resolve_characteristic(value)
+        self._inverse_b = resolve_inverse(value)
+        self._characteristic_b = value
+
+    def _kv(
+        self,
+        x: ArrayLike,
+        kvs: float,
+        shape: Callable[[ArrayLike, float], ArrayLike],
+        exponent: float = 3.5,
+    ) -> ArrayLike:
+        """Compute Kv based on a resolved characteristic curve.
 
         Args:
-            x (float): Valve position (0-1)
+            x (float | np.ndarray): Valve position (0-1)
             kvs (float): Full-stroke Kv
-            characteristic (str): Flow type
+            shape (Callable): Resolved characteristic shape
             exponent (float): Only used for equal-percentage
 
         Returns:
-            float: Effective flow coefficient
+            float | np.ndarray: Effective flow coefficient, zero where x <= x0
         """
-        if x <= self.x0:
-            return 0.0
-        normalized = (x - self.x0) / (1 - self.x0)
-        if characteristic == "equal_percentage":
-            return kvs * normalized ** exponent
-        elif characteristic == "linear":
-            return kvs * normalized
-        elif characteristic == "quick_opening":
-            return kvs * math.sqrt(normalized)
-        raise ValueError(f"Unsupported characteristic: {characteristic}")
-
-    def kv_a(self, x: float) -> float:
-        """Return Kv of A-AB port at signal x."""
-        return self._kv(x, self.kvs_a, self.characteristic_a, self.exponent_a)
-
-    def kv_b(self, x: float) -> float:
+        return characterized_kv(x, kvs, self.x0, shape, exponent)
+
+    def kv_a(self, x: ArrayLike) -> ArrayLike:
+        """Return Kv of A-AB port at signal x (scalar or array)."""
+        return self._kv(x, self.kvs_a, self._shape_a, self.exponent_a)
+
+    def kv_b(self, x: ArrayLike) -> ArrayLike:
         """Return Kv of B-AB port at signal x (inverted and scaled)."""
-        raw_kv = self._kv(1 - x, self.kvs_b, self.characteristic_b, self.exponent_b)
+        if np.ndim(x) != 0:
+            x = np.asarray(x, dtype=float)
+        raw_kv = self._kv(1 - x, self.kvs_b, self._shape_b, self.exponent_b)
         return raw_kv * self.bypass_ratio
 
-    def compute(self, x: float, delta_p_a: float, delta_p_b: float) -> Dict[str, float]:
+    def compute(
+        self, x: ArrayLike, delta_p_a: ArrayLike, delta_p_b: ArrayLike
+    ) -> Dict[str, ArrayLike]:
         """
         Compute volumetric and mass flow rates for both A-AB and B-AB.
 
+        Scalars return floats; if any input is an array, all inputs are
+        broadcast together and every output is an array.
+
         Args:
-            x (float): Valve signal (0-1)
-            delta_p_a (float): Pressure drop across A-AB (kPa)
-            delta_p_b (float): Pressure drop across B-AB (kPa)
+            x (float | np.ndarray): Valve signal (0-1)
+            delta_p_a (float | np.ndarray): Pressure drop across A-AB (kPa)
+            delta_p_b (float | np.ndarray): Pressure drop across B-AB (kPa)
 
         Returns:
             dict: Includes Kv, V_dot, and m_dot for both ports
         """
+        x, delta_p_a, delta_p_b = as_batch(x, delta_p_a, delta_p_b)
         kv_a_val = self.kv_a(x)
         kv_b_val = self.kv_b(x)
 
-        V_dot_a = kv_a_val * math.sqrt(delta_p_a)  # m³/h
-        V_dot_b = kv_b_val * math.sqrt(delta_p_b)  # m³/h
+        V_dot_a = kv_a_val * sqrt(delta_p_a)  # m³/h
+        V_dot_b = kv_b_val * sqrt(delta_p_b)  # m³/h
 
         m_dot_a = self.rho * V_dot_a / 3600  # kg/s
         m_dot_b = self.rho * V_dot_b / 3600  # kg/s
@@ -124,3 +166,100 @@ class ThreeWayControlValve:
             "V_dot_b": V_dot_b,
             "m_dot_b": m_dot_b,
         }
+
+    def stroke_for_kv_a(self, kv: ArrayLike) -> Dict[str, ArrayLike]:
+        """
+        Closed-form inverse of kv_a(): signal giving a target A-AB Kv.
+
+        Args:
+            kv (float | np.ndarray): Target A-AB flow coefficient (m³/h·√kPa)
+
+        Returns:
+            dict: Signal x and saturation flags. "saturated_low" marks
+            targets at or below zero (x pinned at x0), "saturated_high"
+            targets above kvs_a (x pinned at 1). Never raises.
+        """
+        x, low, high = characterized_stroke(
+            kv, self.kvs_a, self.x0, self._inverse_a, self.exponent_a
+        )
+        return {"x": x, "saturated_low": low, "saturated_high": high}
+
+    def stroke_for_kv_b(self, kv: ArrayLike) -> Dict[str, ArrayLike]:
+        """
+        Closed-form inverse of kv_b(): signal giving a target B-AB Kv.
+
+        The bypass ratio is divided out and the B-AB stroke is inverted,
+        so the returned signal is x = 1 - stroke_B. Saturation flags refer to
+        the B-AB port opening: "saturated_low" pins the bypass shut
+        (x = 1 - x0), "saturated_high" pins it fully open (x = 0).
+
+        Args:
+            kv (float | np.ndarray): Target B-AB flow coefficient (m³/h·√kPa)
+
+        Returns:
+            dict: Signal x and saturation flags. Never raises.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw_kv = np.divide(kv, self.bypass_ratio)
+        stroke_b, low, high = characterized_stroke(
+            raw_kv if np.ndim(kv) else float(raw_kv),
+            self.kvs_b,
+            self.x0,
+            self._inverse_b,
+            self.exponent_b,
+        )
+        return {"x": 1 - stroke_b, "saturated_low": low, "saturated_high": high}
+
+    def solve_stroke_a(
+        self, V_dot_a: ArrayLike, delta_p_a: ArrayLike
+    ) -> Dict[str, ArrayLike]:
+        """
+        Signal that delivers a target A-AB flow at a known pressure drop.
+
+        Args:
+            V_dot_a (float | np.ndarray): Target A-AB volumetric flow (m³/h)
+            delta_p_a (float | np.ndarray): Pressure drop across A-AB (kPa)
+
+        Returns:
+            dict: Signal x, the A-AB flow achieved at that signal
+            (kv_a, V_dot_a, m_dot_a) and the saturation flags.
+        """
+        V_dot_a, delta_p_a = as_batch(V_dot_a, delta_p_a)
+        result = self.stroke_for_kv_a(required_kv(V_dot_a, delta_p_a))
+        kv_a_val = self.kv_a(result["x"])
+        V_dot = kv_a_val * sqrt(clip_positive(delta_p_a))
+        return {
+            "x": result["x"],
+            "kv_a": kv_a_val,
+            "V_dot_a": V_dot,
+            "m_dot_a": self.rho * V_dot / 3600,
+            "saturated_low": result["saturated_low"],
+            "saturated_high": result["saturated_high"],
+        }
+
+    def solve_stroke_b(
+        self, V_dot_b: ArrayLike, delta_p_b: ArrayLike
+    ) -> Dict[str, ArrayLike]:
+        """
+        Signal that delivers a target B-AB (bypass) flow at a known pressure drop.
+
+        Args:
+            V_dot_b (float | np.ndarray): Target B-AB volumetric flow (m³/h)
+            delta_p_b (float | np.ndarray): Pressure drop across B-AB (kPa)
+
+        Returns:
+            dict: Signal x, the B-AB flow achieved at that signal
+            (kv_b, V_dot_b, m_dot_b) and the saturation flags.
+        """
+        V_dot_b, delta_p_b = as_batch(V_dot_b, delta_p_b)
+        result = self.stroke_for_kv_b(required_kv(V_dot_b, delta_p_b))
+        kv_b_val = self.kv_b(result["x"])
+        V_dot = kv_b_val * sqrt(clip_positive(delta_p_b))
+        return {
+            "x": result["x"],
+            "kv_b": kv_b_val,
+            "V_dot_b": V_dot,
+            "m_dot_b": self.rho * V_dot / 3600,
+            "saturated_low": result["saturated_low"],
+            "saturated_high": result["saturated_high"],
+        }
@@ -0,0 +1,314 @@
+import math
+from typing import Callable, Dict, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+# -------------------------------
+# 🔹 Inherent Flow Characteristics
+# -------------------------------
+#
+# Each shape maps the normalized stroke s = (x - x0) / (1 - x0) to the
+# relative flow coefficient Kv / Kvs. The same expression is valid for Python
+# floats and NumPy arrays, so valves resolve their shape once at construction
+# and reuse it for scalar and batch evaluation.
+
+
+def shape_equal_percentage(s: ArrayLike, exponent: float) -> ArrayLike:
+    """Kv / Kvs = s^n"""
+    return s**exponent
+
+
+def shape_linear(s: ArrayLike, exponent: float) -> ArrayLike:
+    """Kv / Kvs = s"""
+    return s
+
+
+def shape_quick_opening(s: ArrayLike, exponent: float) -> ArrayLike:
+    """Kv / Kvs = √s"""
+    return s**0.5
+
+
+# Closed-form inverses: Kv / Kvs -> normalized stroke s
+
+
+def inverse_equal_percentage(r: ArrayLike, exponent: float) -> ArrayLike:
+    """s = (Kv / Kvs)^(1/n)"""
+    return r ** (1.0 / exponent)
+
+
+def inverse_linear(r: ArrayLike, exponent: float) -> ArrayLike:
+    """s = Kv / Kvs"""
+    return r
+
+
+def inverse_quick_opening(r: ArrayLike, exponent: float) -> ArrayLike:
+    """s = (Kv / Kvs)^2"""
+    return r**2
+
+
+# Slopes: d(Kv / Kvs) / ds, for gradients with respect to the stroke
+
+
+def slope_equal_percentage(s: ArrayLike, exponent: float) -> ArrayLike:
+    """d(s^n)/ds = n·s^(n-1)"""
+    return exponent * s ** (exponent - 1)
+
+
+def slope_linear(s: ArrayLike, exponent: float) -> ArrayLike:
+    """d(s)/ds = 1"""
+    return 0 * s + 1.0
+
+
+def slope_quick_opening(s: ArrayLike, exponent: float) -> ArrayLike:
+    """d(√s)/ds = 1 / (2√s)"""
+    return 0.5 * s**-0.5
+
+
+CHARACTERISTICS: Dict[str, Callable[[ArrayLike, float], ArrayLike]] = {
+    "equal_percentage": shape_equal_percentage,
+    "linear": shape_linear,
+    "quick_opening": shape_quick_opening,
+}
+
+INVERSE_CHARACTERISTICS: Dict[str, Callable[[ArrayLike, float], ArrayLike]] = {
+    "equal_percentage": inverse_equal_percentage,
+    "linear": inverse_linear,
+    "quick_opening": inverse_quick_opening,
+}
+
+SLOPES: Dict[str, Callable[[ArrayLike, float], ArrayLike]] = {
+    "equal_percentage": slope_equal_percentage,
+    "linear": slope_linear,
+    "quick_opening": slope_quick_opening,
+}
+
+
+def resolve_characteristic(
+    characteristic: str,
+) -> Callable[[ArrayLike, float], ArrayLike]:
+    """
+    Look up the shape function for a characteristic name.
+
+    Args:
+        characteristic (str): "equal_percentage", "linear" or "quick_opening"
+
+    Returns:
+        Callable: shape(s, exponent) -> Kv / Kvs
+
+    Raises:
+        ValueError: If the characteristic is not supported.
+    """
+    try:
+        return CHARACTERISTICS[characteristic]
+    except KeyError:
+        raise ValueError(f"Unknown valve characteristic: {characteristic}") from None
+
+
+def resolve_inverse(characteristic: str) -> Callable[[ArrayLike, float], ArrayLike]:
+    """
+    Look up the closed-form inverse for a characteristic name.
+
+    Args:
+        characteristic (str): "equal_percentage", "linear" or "quick_opening"
+
+    Returns:
+        Callable: inverse(Kv / Kvs, exponent) -> s
+
+    Raises:
+        ValueError: If the characteristic is not supported.
+    """
+    try:
+        return INVERSE_CHARACTERISTICS[characteristic]
+    except KeyError:
+        raise ValueError(f"Unknown valve characteristic: {characteristic}") from None
+
+
+def resolve_slope(characteristic: str) -> Callable[[ArrayLike, float], ArrayLike]:
+    """
+    Look up the slope of the shape function for a characteristic name.
+
+    Args:
+        characteristic (str): "equal_percentage", "linear" or "quick_opening"
+
+    Returns:
+        Callable: slope(s, exponent) -> d(Kv / Kvs) / ds
+
+    Raises:
+        ValueError: If the characteristic is not supported.
+    """
+    try:
+        return SLOPES[characteristic]
+    except KeyError:
+        raise ValueError(f"Unknown valve characteristic: {characteristic}") from None
+
+
+def characterized_kv(
+    x: ArrayLike,
+    kvs: float,
+    x0: float,
+    shape: Callable[[ArrayLike, float], ArrayLike],
+    exponent: float,
+) -> ArrayLike:
+    """
+    Evaluate Kv(x) for a scalar stroke or an array of strokes.
+
+    Strokes at or below x0 are masked to zero flow.
+
+    Args:
+        x (float | np.ndarray): Valve position (0-1)
+        kvs (float): Full-stroke Kv (m³/h·√kPa)
+        x0 (float): Minimum effective stroke (0-1)
+        shape (Callable): Resolved characteristic shape
+        exponent (float): Exponent for equal-percentage curve
+
+    Returns:
+        float | np.ndarray: Partial Kv, matching the shape of x
+    """
+    if np.ndim(x) == 0:
+        if x <= x0:
+            return 0.0
+        return kvs * shape((x - x0) / (1 - x0), exponent)
+
+    x = np.asarray(x, dtype=float)
+    open_ = x > x0
+    s = np.where(open_, (x - x0) / (1 - x0), 0.0)
+    return np.where(open_, kvs * shape(s, exponent), 0.0)
+
+
+def characterized_kv_slope(
+    x: ArrayLike,
+    kvs: float,
+    x0: float,
+    slope: Callable[[ArrayLike, float], ArrayLike],
+    exponent: float,
+) -> ArrayLike:
+    """
+    Evaluate dKv/dx for a scalar stroke or an array of strokes.
+
+    Zero at or below x0, where characterized_kv() is masked to zero flow.
+
+    Args:
+        x (float | np.ndarray): Valve position (0-1)
+        kvs (float): Full-stroke Kv (m³/h·√kPa)
+        x0 (float): Minimum effective stroke (0-1)
+        slope (Callable): Resolved characteristic slope
+        exponent (float): Exponent for equal-percentage curve
+
+    Returns:
+        float | np.ndarray: dKv/dx, matching the shape of x
+    """
+    if np.ndim(x) == 0:
+        if x <= x0:
+            return 0.0
+        return kvs * slope((x - x0) / (1 - x0), exponent) / (1 - x0)
+
+    x = np.asarray(x, dtype=float)
+    open_ = x > x0
+    s = np.where(open_, (x - x0) / (1 - x0), 1.0)
+    return np.where(open_, kvs * slope(s, exponent) / (1 - x0), 0.0)
+
+
+def sqrt_slope(value: ArrayLike, scale: ArrayLike) -> ArrayLike:
+    """
+    d(scale·√value)/d(value) = scale / (2√value), for scalars or arrays.
+
+    At value <= 0 the slope is infinite where scale > 0 and zero otherwise.
+    """
+    scalar = np.ndim(value) == 0 and np.ndim(scale) == 0
+    value = np.asarray(value, dtype=float)
+    scale = np.asarray(scale, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(
+            value > 0.0,
+            scale / (2 * np.sqrt(np.maximum(value, 0.0))),
+            np.where(scale > 0.0, np.inf, 0.0),
+        )
+    return float(slope) if scalar else slope
+
+
+def as_batch(*values: ArrayLike) -> Tuple[ArrayLike, ...]:
+    """
+    Convert inputs to float arrays if any of them is non-scalar.
+
+    Scalar-only calls are returned untouched so the scalar path keeps
+    returning plain Python floats.
+    """
+    if all(np.ndim(v) == 0 for v in values):
+        return values
+    return tuple(np.asarray(v, dtype=float) for v in values)
+
+
+def sqrt(value: ArrayLike) -> ArrayLike:
+    """math.sqrt for scalars, np.sqrt for arrays."""
+    if np.ndim(value) == 0:
+        return math.sqrt(value)
+    return np.sqrt(value)
+
+
+def required_kv(V_dot: ArrayLike, delta_p: ArrayLike) -> ArrayLike:
+    """
+    Flow coefficient needed to pass V_dot at delta_p: Kv = V̇ / √ΔP.
+
+    Never raises: a positive flow at ΔP <= 0 needs an infinite Kv, and zero
+    flow needs Kv = 0 regardless of ΔP.
+
+    Args:
+        V_dot (float | np.ndarray): Target volumetric flow (m³/h)
+        delta_p (float | np.ndarray): Pressure drop across valve (kPa)
+
+    Returns:
+        float | np.ndarray: Required Kv (m³/h·√kPa)
+    """
+    scalar = np.ndim(V_dot) == 0 and np.ndim(delta_p) == 0
+    V_dot = np.asarray(V_dot, dtype=float)
+    delta_p = np.asarray(delta_p, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kv = np.where(
+            V_dot == 0.0,
+            0.0,
+            np.where(delta_p > 0.0, V_dot / np.sqrt(np.maximum(delta_p, 0.0)), np.inf),
+        )
+    return float(kv) if scalar else kv
+
+
+def characterized_stroke(
+    kv: ArrayLike,
+    kvs: float,
+    x0: float,
+    inverse: Callable[[ArrayLike, float], ArrayLike],
+    exponent: float,
+) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
+    """
+    Closed-form stroke x giving a target Kv, for a scalar or an array.
+
+    Targets outside the valve range are clipped instead of raising:
+    Kv <= 0 pins the stroke at x0 (saturated low, valve shut) and
+    Kv > Kvs pins it at 1 (saturated high, valve fully open).
+
+    Args:
+        kv (float | np.ndarray): Target flow coefficient (m³/h·√kPa)
+        kvs (float): Full-stroke Kv (m³/h·√kPa)
+        x0 (float): Minimum effective stroke (0-1)
+        inverse (Callable): Resolved inverse characteristic
+        exponent (float): Exponent for equal-percentage curve
+
+    Returns:
+        Tuple: (x, saturated_low, saturated_high), matching the shape of kv
+    """
+    scalar = np.ndim(kv) == 0
+    r = np.asarray(kv, dtype=float) / kvs
+    saturated_low = r <= 0.0
+    saturated_high = r > 1.0
+    x = x0 + (1 - x0) * inverse(np.clip(r, 0.0, 1.0), exponent)
+    if scalar:
+        return float(x), bool(saturated_low), bool(saturated_high)
+    return x, saturated_low, saturated_high
+
+
+def clip_positive(value: ArrayLike) -> ArrayLike:
+    """max(value, 0) for scalars, np.maximum(value, 0) for arrays."""
+    if np.ndim(value) == 0:
+        return max(value, 0.0)
+    return np.maximum(value, 0.0)
@@ -0,0 +1,102 @@
+import datetime
+import math
+
+import numpy as np
+import pytest
+
+import energy_models as em
+
+DT = 1 / 60
+# One week from a Sunday, at the 1-minute resolution being replaced
+WEEK = (0.0, 168.0)
+
+
+def _fan(interpolate=False):
+    schedule = em.Scheduler(
+        default=[0.0] * 7 + [0.5] + [1.0] * 10 + [0.5] + [0.0] * 5,
+        weekend=[0.3] * 24,
+        interpolate=interpolate,
+        start_date=datetime.date(2023, 1, 1),
+    )
+    return em.ZoneExhaustFan(
+        V_dot_max=1.5,
+        delta_p=250.0,
+        rho=1.2,
+        eta_fan=0.6,
+        eta_total=0.5,
+        flow_fraction_schedule=em.make_flow_fraction_schedule(schedule),
+        availability_schedule=em.make_availability_schedule(schedule),
+    )
+
+
+def _fixed_step(component, inputs, keys, t_start, t_end):
+    # Reference: every dt_min timestep evaluated with compute()
+    n = round((t_end - t_start) / DT)
+    totals = {key: 0.0 for key in keys}
+    for k in range(n):
+        t = t_start + k * DT
+        args = {name: f(t) if callable(f) else f for name, f in inputs.items()}
+        result = component.compute(t=t, **args)
+        for key in keys:
+            totals[key] += result[key] * DT
+    return totals, n
+
+
+@pytest.mark.parametrize(
+    "h_in, rtol, share",
+    [
+        (4.2e4, 1e-3, 0.1),
+        (lambda t: 3e4 + 50.0 * t, 1e-3, 0.1),
+        # Smooth in t: the step test needs a tighter rtol to reach 1e-7
+        (lambda t: 4e4 + 5e3 * math.sin(2 * math.pi * t / 24), 3e-6, 0.8),
+    ],
+    ids=["constant", "ramp", "daily"],
+)
+def test_integrals_match_fixed_step(h_in, rtol, share):
+    fan = _fan()
+    keys = ["W_electric", "h_out"]
+    sim = em.AdaptiveSimulation(
+        fan, {"h_in": h_in}, integrate=keys, rtol=rtol, dt_min=DT
+    )
+    result = sim.run(*WEEK)
+    expected, n = _fixed_step(fan, {"h_in": h_in}, keys, *WEEK)
+    for key in keys:
+        assert result["integrals"][key] == pytest.approx(expected[key], rel=1e-7)
+        assert abs(result["integrals"][key] - expected[key]) <= max(
+            result["error"][key], 1e-9 * abs(expected[key])
+        )
+    assert result["evaluations"] < share * n
+
+
+def test_steps_tile_the_range_and_break_at_schedule_changes():
+    result = em.AdaptiveSimulation(_fan(), {"h_in": 4.2e4}, dt_min=DT).run(*WEEK)
+    t, dt = result["t"], result["dt"]
+    assert t[0] == WEEK[0]
+    np.testing.assert_allclose(t[1:], t[:-1] + dt[:-1])
+    assert t[-1] + dt[-1] == pytest.approx(WEEK[1])
+    assert dt.max() <= 1.0 + 1e-12
+    # Monday 07:00 and 08:00 are schedule changes
+    assert np.isclose(t, 31.0).any() and np.isclose(t, 32.0).any()
+    # Each step's mean times its length adds up to the integral
+    assert float(np.sum(result["mean"]["W_electric"] * dt)) == pytest.approx(
+        result["integrals"]["W_electric"], rel=1e-12
+    )
+
+
+def test_threshold_inside_a_ramp_is_the_documented_limit():
+    # The availability threshold is crossed between the samples of an
+    # hour-long step of an interpolated schedule (see the README)
+    fan = _fan(interpolate=True)
+    result = em.AdaptiveSimulation(fan, {"h_in": 4.2e4}, dt_min=DT).run(*WEEK)
+    expected, _ = _fixed_step(fan, {"h_in": 4.2e4}, ["W_electric"], *WEEK)
+    assert result["integrals"]["W_electric"] == pytest.approx(
+        expected["W_electric"], rel=2e-3
+    )
+
+
+def test_range_must_be_whole_steps():
+    sim = em.AdaptiveSimulation(_fan(), {"h_in": 4.2e4}, dt_min=DT)
+    with pytest.raises(ValueError):
+        sim.run(0.0, 0.005)
+    with pytest.raises(ValueError):
+        em.AdaptiveSimulation(_fan(), {"h_in": 4.2e4}, dt_min=1.0, dt_max=0.5)
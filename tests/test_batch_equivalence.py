@@ -0,0 +1,195 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+N = 97
+
+
+def _rng():
+    return np.random.default_rng(20240101)
+
+
+def _hours():
+    # Every hour of a weekday, schedule edges and off hours included
+    return np.linspace(0.0, 24.0, N, endpoint=False)
+
+
+def _schedule():
+    return em.Scheduler(
+        default=[0.0] * 7 + [0.5] + [1.0] * 10 + [0.5] + [0.0] * 5,
+        weekend=[0.0] * 24,
+        interpolate=True,
+    )
+
+
+def _fan_curve():
+    base = em.curve_quadratic(1200.0, 0.0, -40.0)
+
+    def fan_curve(Q, rpm):
+        ratio = rpm / 1500.0
+        return ratio**2 * base(Q / ratio)
+
+    return fan_curve
+
+
+def _cases():
+    schedule = _schedule()
+    flow_fraction = em.make_flow_fraction_schedule(schedule)
+    available = em.make_availability_schedule(schedule)
+    cap_temp = em.curve_biquadratic((1.0, 0.01, 0.0, -0.02, 0.0, 0.0))
+    cap_flow = em.curve_biquadratic((0.2, 0.5, 0.0, 0.3, 0.0, 0.0))
+    rng = _rng()
+    m_dot = rng.uniform(0.5, 3.0, N)
+    # A zero request switches the fan off
+    requested = np.concatenate([[0.0], rng.uniform(0.0, 3.0, N - 1)])
+    h_in = rng.uniform(2e4, 6e4, N)
+    t = _hours()
+    coil = {
+        "t": t,
+        "T_air_in": rng.uniform(20.0, 32.0, N),
+        "T_water_in": rng.uniform(6.0, 8.0, N),
+        "V_dot_air": np.concatenate([[0.0], rng.uniform(0.5, 2.5, N - 1)]),
+        "V_dot_water": np.concatenate([[0.0], rng.uniform(0.0005, 0.003, N - 1)]),
+        "h_in": rng.uniform(4e4, 7e4, N),
+    }
+    fan = {"rho": 1.2, "eta_fan": 0.7, "eta_motor": 0.9, "f_motor_to_air": 1.0}
+
+    return {
+        "ConstantVolumeFan": (
+            em.ConstantVolumeFan(delta_p=600.0, **fan),
+            {"m_dot": m_dot, "h_in": h_in},
+        ),
+        "VariableVolumeFan": (
+            em.VariableVolumeFan(
+                m_dot_design=3.0,
+                delta_p=600.0,
+                power_curve=em.curve_quartic(0.0408, 0.088, -0.0729, 0.9437, 0.0),
+                **fan,
+            ),
+            {"m_dot": m_dot, "h_in": h_in},
+        ),
+        "OnOffFan": (
+            em.OnOffFan(m_dot_design=3.0, delta_p=600.0, **fan),
+            {"m_dot_requested": requested, "h_in": h_in},
+        ),
+        "ComponentFan": (
+            em.ComponentFan(
+                rho=1.2,
+                area_outlet=0.5,
+                eta_fan=0.7,
+                eta_motor=0.92,
+                f_motor_to_air=1.0,
+                pressure_coeffs=(300.0, 50.0, -20.0, 1.0, 0.0, 0.0),
+                belt_loss_func=lambda w: 0.03 * w,
+                vfd_loss_func=lambda w: 0.02 * w,
+                static_reset_func=lambda Q: 150.0 + 25.0 * Q,
+            ),
+            {"Q": m_dot, "P_o": rng.uniform(-10.0, 10.0, N), "h_in": h_in},
+        ),
+        "ZoneExhaustFan": (
+            em.ZoneExhaustFan(
+                V_dot_max=1.5,
+                delta_p=250.0,
+                rho=1.2,
+                eta_fan=0.6,
+                eta_total=0.5,
+                flow_fraction_schedule=flow_fraction,
+                availability_schedule=available,
+            ),
+            {"t": t, "h_in": h_in},
+        ),
+        "NightVentilationFan": (
+            em.NightVentilationFan(
+                V_dot_design=2.0,
+                delta_p_day=500.0,
+                delta_p_night=300.0,
+                rho=1.2,
+                eta_fan=0.7,
+                eta_total=0.6,
+                flow_fraction_day=flow_fraction,
+                availability_schedule=lambda t: True,
+                is_night_ventilation=lambda t: t < 6 or t >= 22,
+            ),
+            {"t": t, "h_in": h_in},
+        ),
+        "CurveSpeedControlledFan": (
+            em.CurveSpeedControlledFan(
+                rho=1.2,
+                area_outlet=0.5,
+                eta_fan=0.7,
+                eta_motor=0.92,
+                f_motor_to_air=1.0,
+                fan_curve=_fan_curve(),
+                system_pressure_func=em.curve_quadratic(50.0, 0.0, 20.0),
+                belt_loss_func=lambda w: 0.03 * w,
+                vfd_loss_func=lambda w: 0.02 * w,
+            ),
+            {"rpm": rng.uniform(600.0, 1800.0, N), "h_in": h_in},
+        ),
+        "CoolingWaterCoil": (
+            em.CoolingWaterCoil(
+                Q_rated=50e3,
+                SHR=0.75,
+                rho_air=1.2,
+                availability_schedule=available,
+                cap_temp_curve=cap_temp,
+                cap_flow_curve=cap_flow,
+                pressure_drop_curve_air=em.curve_quadratic(0.0, 0.0, 40.0),
+                pressure_drop_curve_water=em.curve_quadratic(0.0, 0.0, 5e6),
+            ),
+            coil,
+        ),
+        "HeatingWaterCoil": (
+            em.HeatingWaterCoil(
+                Q_rated=40e3,
+                rho_air=1.2,
+                availability_schedule=available,
+                cap_temp_curve=cap_temp,
+                cap_flow_curve=cap_flow,
+            ),
+            coil,
+        ),
+        "ElectricHeatingCoil": (
+            em.ElectricHeatingCoil(
+                q_nominal=10e3,
+                eta=0.98,
+                rho_air=1.2,
+                availability_schedule=available,
+                load_fraction_func=flow_fraction,
+            ),
+            {"t": t, "m_dot_air": m_dot, "h_in": h_in},
+        ),
+        "SteamHeatingCoil": (
+            em.SteamHeatingCoil(
+                h_fg=2.257e6,
+                cp_cond=4180.0,
+                deltaT_subcool_total=5.0,
+                m_dot_max=0.02,
+                availability_schedule=available,
+                control_schedule=flow_fraction,
+            ),
+            {"t": t},
+        ),
+    }
+
+
+CASES = _cases()
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_compute_batch_matches_compute(name):
+    component, inputs = CASES[name]
+    batch = component.compute_batch(**inputs)
+    scalar = [
+        component.compute(**{key: value[i].item() for key, value in inputs.items()})
+        for i in range(N)
+    ]
+    # Some scalar paths return fewer keys when unavailable; the batch paths
+    # always return every key, zero where the scalar result omits it
+    assert set().union(*scalar) == set(batch)
+    for key, values in batch.items():
+        expected = np.array([result.get(key, 0.0) for result in scalar], dtype=float)
+        np.testing.assert_allclose(
+            np.broadcast_to(values, (N,)), expected, rtol=1e-9, atol=1e-9, err_msg=key
+        )
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+T = 2000
+FAN = {"rho": 1.2, "eta_motor": 0.9, "f_motor_to_air": 1.0}
+
+
+def _trend():
+    rng = np.random.default_rng(38)
+    return {"m_dot": rng.uniform(0.5, 3.0, T), "h_in": rng.uniform(2e4, 6e4, T)}
+
+
+def _component_fan(pressure_coeffs):
+    return {
+        "rho": 1.2,
+        "area_outlet": 0.5,
+        "eta_fan": 0.7,
+        "eta_motor": 0.92,
+        "f_motor_to_air": 1.0,
+        "pressure_coeffs": pressure_coeffs,
+        "belt_loss_func": lambda w: 0.03 * w,
+        "vfd_loss_func": lambda w: 0.02 * w,
+        "static_reset_func": lambda Q: 150.0 + 25.0 * Q,
+    }
+
+
+def test_fit_linear_recovers_efficiency_with_missing_samples():
+    inputs = _trend()
+    true = {**FAN, "delta_p": 600.0, "eta_fan": 0.63}
+    measured = em.ConstantVolumeFan(**true).compute_batch(**inputs)["W_electric"]
+    measured[::10] = np.nan
+    result = em.fit_linear(
+        em.ConstantVolumeFan,
+        {**true, "eta_fan": 0.8},
+        ["eta_fan"],
+        inputs,
+        "W_electric",
+        measured,
+    )
+    assert result["params"]["eta_fan"] == pytest.approx(0.63, rel=1e-9)
+    assert result["fit"]["n"] == T - T // 10
+    assert result["fit"]["cv_rmse"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_fit_linear_recovers_pressure_coefficients():
+    rng = np.random.default_rng(38)
+    inputs = {
+        "Q": rng.uniform(0.5, 3.0, T),
+        "P_o": rng.uniform(-10.0, 10.0, T),
+        "h_in": rng.uniform(2e4, 6e4, T),
+    }
+    true = (300.0, 50.0, -20.0, 1.0, 0.5, -0.1)
+    measured = em.ComponentFan(**_component_fan(true)).compute_batch(**inputs)[
+        "DeltaP_total"
+    ]
+    result = em.fit_linear(
+        em.ComponentFan,
+        _component_fan((250.0, 40.0, -10.0, 1.0, 0.0, 0.0)),
+        ["pressure_coeffs"],
+        inputs,
+        "DeltaP_total",
+        measured,
+    )
+    # The six columns are strongly correlated; the normal equations lose digits
+    np.testing.assert_allclose(result["params"]["pressure_coeffs"], true, rtol=1e-4)
+    np.testing.assert_allclose(result["predicted"], measured, rtol=1e-9)
+
+
+def test_fleet_fits_every_unit_at_once():
+    inputs = _trend()
+    eta_fan = np.array([0.55, 0.6, 0.7, 0.75])
+    fleet = {**FAN, "delta_p": np.array([400.0, 500.0, 600.0, 700.0])}
+    measured = em.ConstantVolumeFanFleet(**fleet, eta_fan=eta_fan).compute(**inputs)[
+        "W_electric"
+    ]
+    assert measured.shape == (4, T)
+    result = em.fit_linear(
+        em.ConstantVolumeFanFleet,
+        {**fleet, "eta_fan": 0.7},
+        ["eta_fan"],
+        inputs,
+        "W_electric",
+        measured,
+    )
+    np.testing.assert_allclose(result["params"]["eta_fan"], eta_fan, rtol=1e-9)
+    assert result["fit"]["r2"].shape == (4,)
+
+
+def _variable_fan(m_dot_design):
+    return {
+        **FAN,
+        "m_dot_design": m_dot_design,
+        "delta_p": 600.0,
+        "eta_fan": 0.7,
+        "power_curve": em.curve_quartic(0.0408, 0.088, -0.0729, 0.9437, 0.0),
+    }
+
+
+def test_nonlinear_parameter_needs_calibrate():
+    inputs = _trend()
+    measured = em.VariableVolumeFan(**_variable_fan(3.2)).compute_batch(**inputs)[
+        "W_electric"
+    ]
+    with pytest.raises(ValueError, match="calibrate"):
+        em.fit_linear(
+            em.VariableVolumeFan,
+            _variable_fan(3.0),
+            ["m_dot_design"],
+            inputs,
+            "W_electric",
+            measured,
+        )
+    pytest.importorskip("scipy")
+    result = em.calibrate(
+        em.VariableVolumeFan,
+        _variable_fan(3.0),
+        ["m_dot_design"],
+        inputs,
+        "W_electric",
+        measured,
+        bounds={"m_dot_design": (2.0, 5.0)},
+    )
+    assert result["success"]
+    assert result["params"]["m_dot_design"] == pytest.approx(3.2, rel=1e-6)
+
+
+def test_goodness_of_fit_per_unit():
+    measured = np.array([[1.0, 2.0, 3.0, np.nan], [2.0, 2.0, 2.0, 2.0]])
+    predicted = np.array([[1.0, 2.0, 3.0, 4.0], [1.0, 3.0, 1.0, 3.0]])
+    fit = em.goodness_of_fit(measured, predicted, n_params=1)
+    np.testing.assert_array_equal(fit["n"], [3, 4])
+    assert fit["r2"][0] == 1.0 and fit["rmse"][0] == 0.0
+    assert fit["rmse"][1] == 1.0
+    assert fit["cv_rmse"][1] == pytest.approx(np.sqrt(4 / 3) / 2)
+    assert fit["nmbe"][1] == 0.0
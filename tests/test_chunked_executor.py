@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+from test_batch_equivalence import CASES, N
+from test_hydronic_network import POSITIONS, _network
+
+
+def _assert_joined(joined, expected):
+    assert set(joined) == set(expected)
+    for key, value in expected.items():
+        if np.ndim(value) and np.shape(value)[-1] == N:
+            np.testing.assert_array_equal(joined[key], value, err_msg=key)
+        else:
+            # Values not over the timesteps: one per block
+            assert all(np.array_equal(v, value) for v in joined[key]), key
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_joined_blocks_match_compute_batch(name, workers):
+    component, inputs = CASES[name]
+    expected = component.compute_batch(**inputs)
+    # 97 timesteps in uneven blocks, the last one shorter
+    executor = em.ChunkedExecutor(max_workers=workers, chunk_size=10)
+    _assert_joined(executor.run(component.compute_batch, inputs), expected)
+
+
+def test_single_block_is_not_copied():
+    component, inputs = CASES["ConstantVolumeFan"]
+    expected = component.compute_batch(**inputs)
+    joined = em.ChunkedExecutor(chunk_size=N).run(component.compute_batch, inputs)
+    _assert_joined(joined, expected)
+
+
+def test_hydronic_positions_are_split():
+    x = np.array(POSITIONS * 5)
+    speed = np.tile([0.0, 1.0, 0.1, 0.5, 1.0], 9)
+    inputs = {"positions": {"v0": x}, "speeds": {"P0": speed}}
+    expected = _network().solve(**inputs)
+    executor = em.ChunkedExecutor(max_workers=4, chunk_size=8)
+    joined = executor.run(_network().solve, inputs)
+    assert len(joined["iterations"]) == 6
+    for group in ("V_dot", "m_dot", "delta_p", "p"):
+        assert set(joined[group]) == set(expected[group])
+        for name, value in expected[group].items():
+            np.testing.assert_allclose(
+                joined[group][name], value, rtol=1e-6, atol=1e-9, err_msg=name
+            )
+
+
+def test_inputs_must_agree_on_length():
+    component, inputs = CASES["ConstantVolumeFan"]
+    with pytest.raises(ValueError):
+        em.ChunkedExecutor().run(
+            component.compute_batch, {**inputs, "h_in": np.ones(N + 1)}
+        )
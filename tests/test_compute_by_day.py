@@ -0,0 +1,100 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import energy_models as em
+from energy_models.batch.batch import compute_by_day
+
+# A year of 15-minute timesteps starting on a Sunday, with two holidays
+START = datetime.date(2023, 1, 1)
+T = np.arange(0.0, 8760.0, 0.25)
+
+
+def _scheduler():
+    return em.Scheduler(
+        default=[0.0] * 7 + [0.5] + [1.0] * 10 + [0.5] + [0.0] * 5,
+        weekend=[0.2] * 24,
+        holiday=[0.0] * 12 + [0.3] * 12,
+        interpolate=True,
+        holiday_dates=[datetime.date(2023, 7, 4), datetime.date(2023, 12, 25)],
+        start_date=START,
+    )
+
+
+def _components():
+    schedule = _scheduler()
+    flow_fraction = em.make_flow_fraction_schedule(schedule)
+    available = em.make_availability_schedule(schedule)
+    return {
+        "ZoneExhaustFan": em.ZoneExhaustFan(
+            V_dot_max=1.5,
+            delta_p=250.0,
+            rho=1.2,
+            eta_fan=0.6,
+            eta_total=0.5,
+            flow_fraction_schedule=flow_fraction,
+            availability_schedule=available,
+        ),
+        "SteamHeatingCoil": em.SteamHeatingCoil(
+            h_fg=2.257e6,
+            cp_cond=4180.0,
+            deltaT_subcool_total=5.0,
+            m_dot_max=0.02,
+            availability_schedule=available,
+            control_schedule=flow_fraction,
+        ),
+    }
+
+
+def _counted(component):
+    # Record how many timesteps every compute_batch() call evaluates
+    sizes = []
+    batch = component.compute_batch
+
+    def compute_batch(t, *args):
+        sizes.append(np.size(t))
+        return batch(t, *args)
+
+    component.compute_batch = compute_batch
+    return sizes
+
+
+@pytest.mark.parametrize("name", ["ZoneExhaustFan", "SteamHeatingCoil"])
+def test_year_matches_compute_batch_with_one_day_per_day_type(name):
+    component = _components()[name]
+    args = (np.full(T.shape, 4.2e4),) if name == "ZoneExhaustFan" else ()
+    expected = component.compute_batch(T, *args)
+    sizes = _counted(component)
+    result = compute_by_day(component, T, *args)
+    # Weekday, weekend and holiday: 3 × 96 quarter hours
+    assert sizes == [288]
+    assert set(result) == set(expected)
+    for key, value in expected.items():
+        np.testing.assert_array_equal(result[key], value, err_msg=key)
+
+
+def test_varying_inputs_fall_back_to_compute_batch():
+    fan = _components()["ZoneExhaustFan"]
+    h_in = np.linspace(2e4, 6e4, T.size)
+    expected = fan.compute_batch(T, h_in)
+    sizes = _counted(fan)
+    result = compute_by_day(fan, T, h_in)
+    assert sizes == [T.size]
+    for key, value in expected.items():
+        np.testing.assert_array_equal(result[key], value, err_msg=key)
+
+
+def test_custom_schedule_falls_back_to_compute_batch():
+    fan = em.ZoneExhaustFan(
+        V_dot_max=1.5,
+        delta_p=250.0,
+        rho=1.2,
+        eta_fan=0.6,
+        eta_total=0.5,
+        flow_fraction_schedule=lambda t: 0.5,
+        availability_schedule=em.make_availability_schedule(_scheduler()),
+    )
+    sizes = _counted(fan)
+    compute_by_day(fan, T, 4.2e4)
+    assert sizes == [T.size]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+RATED = 5000.0
+ETA_MAX = 0.94
+TRANSITION = 0.3
+
+
+def _region_curves():
+    # Distinct level and slope per region, so every jump is visible
+    return (
+        lambda x: 0.80 + 0.3 * x,
+        lambda x: 0.95 + 0.05 * x,
+        lambda x: 0.98 - 0.1 * (x - 1.0),
+    )
+
+
+def _belt_eta(x):
+    f1, f2, f3 = _region_curves()
+    f = f1(x) if x < TRANSITION else f2(x) if x <= 1.0 else f3(x)
+    return ETA_MAX * f
+
+
+def _exact_loss(eta, P):
+    return P * (1.0 / eta(P / RATED) - 1.0)
+
+
+def _loads():
+    # Every region, and both sides of each boundary
+    x = np.concatenate(
+        [
+            np.linspace(0.02, 1.45, 200),
+            [TRANSITION * (1 - 1e-4), TRANSITION, TRANSITION * (1 + 1e-4)],
+            [1.0 - 1e-4, 1.0, 1.0 + 1e-4, 1.0001],
+        ]
+    )
+    return RATED * x
+
+
+def test_belt_loss_matches_closed_form_in_every_region():
+    belt = em.BeltLoss(RATED, ETA_MAX, part_load=_region_curves(), transition=0.3)
+    for P in _loads():
+        assert belt(float(P)) == pytest.approx(_exact_loss(_belt_eta, P), rel=2e-3)
+
+
+def test_belt_loss_jumps_at_full_load():
+    belt = em.BeltLoss(
+        RATED,
+        ETA_MAX,
+        part_load=(lambda x: 1.0, lambda x: 1.0, lambda x: 0.98),
+    )
+    P = 5000.5
+    assert belt(P) == pytest.approx(P * (1 / (ETA_MAX * 0.98) - 1), rel=1e-6)
+    assert belt(5000.0) == pytest.approx(5000.0 * (1 / ETA_MAX - 1), rel=1e-6)
+
+
+def test_array_call_matches_scalar_calls():
+    belt = em.BeltLoss(RATED, ETA_MAX, part_load=_region_curves(), transition=0.3)
+    P = np.concatenate([[-10.0, 0.0], _loads()])
+    expected = [belt(float(p)) for p in P]
+    np.testing.assert_allclose(belt(P), expected, rtol=1e-12)
+    assert belt(-10.0) == 0.0 and belt(0.0) == 0.0
+
+
+def test_motor_and_vfd_losses_match_closed_form():
+    motor = em.MotorLoss(RATED, 0.92, part_load=lambda x: 0.9 + 0.1 * x)
+    vfd = em.VFDLoss(RATED, lambda x: 0.97 - 0.05 * (1 - x) ** 2)
+    for P in RATED * np.linspace(0.05, 1.4, 100):
+        eta_m = 0.92 * (0.9 + 0.1 * P / RATED)
+        eta_v = 0.97 - 0.05 * (1 - P / RATED) ** 2
+        assert motor(P) == pytest.approx(P * (1 / eta_m - 1), rel=2e-3)
+        assert vfd(P) == pytest.approx(P * (1 / eta_v - 1), rel=2e-3)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+POSITIONS = [0.0, 0.1, 0.2, 0.3, 0.5, 0.7, 0.8, 0.9, 1.0]
+
+
+def _valve():
+    return em.TwoWayControlValve(
+        kvs=25.0, x0=0.02, characteristic="equal_percentage", exponent=3.5, rho=998
+    )
+
+
+def _network(pumps=1):
+    net = em.HydronicNetwork()
+    net.set_reference("tank", pressure=100.0)
+    for j in range(pumps):
+        net.add_pump(
+            f"P{j}", "tank", "s", head_curve=em.curve_quadratic(200.0, 0.0, -0.02)
+        )
+    for i in range(3):
+        net.add_valve(f"v{i}", "s", f"c{i}", valve=_valve())
+        net.add_coil(f"k{i}", f"c{i}", "r", k=0.05)
+    net.add_pipe("R", "r", "tank", k=0.001)
+    return net
+
+
+def _continuity(result):
+    V = result["V_dot"]
+    return V["P0"] - (V["v0"] + V["v1"] + V["v2"])
+
+
+@pytest.mark.parametrize("x", POSITIONS)
+def test_stopped_pump_is_at_rest(x):
+    result = _network().solve(positions={"v0": x}, speeds={"P0": 0.0})
+    assert all(q == 0.0 for q in result["V_dot"].values())
+    assert all(p == 100.0 for p in result["p"].values())
+    assert result["iterations"] == 0
+
+
+@pytest.mark.parametrize("speed", [0.02, 0.1, 0.5, 1.0])
+@pytest.mark.parametrize("x", POSITIONS)
+def test_partly_closed_valves_converge(speed, x):
+    result = _network().solve(positions={"v0": x}, speeds={"P0": speed})
+    V = result["V_dot"]
+    assert V["P0"] > 0.0
+    assert _continuity(result) == pytest.approx(0.0, abs=1e-6 * V["P0"])
+    # Equal branches share the flow equally; a valve more closed passes less
+    assert V["v1"] == pytest.approx(V["v2"])
+    assert V["v0"] <= V["v1"] * (1 + 1e-9)
+
+
+def test_batch_matches_scalar_solves():
+    x = np.array(POSITIONS * 2)
+    speed = np.array([0.0, 1.0, 0.0, 0.1, 0.05, 1.0, 0.0, 0.5, 1.0] * 2)
+    batch = _network().solve(positions={"v0": x}, speeds={"P0": speed})
+    for i in range(x.size):
+        scalar = _network().solve(positions={"v0": x[i]}, speeds={"P0": speed[i]})
+        for name, q in scalar["V_dot"].items():
+            assert batch["V_dot"][name][i] == pytest.approx(q, rel=1e-6, abs=1e-9)
+        for name, p in scalar["p"].items():
+            assert batch["p"][name][i] == pytest.approx(p, rel=1e-9)
+    assert np.all(batch["V_dot"]["P0"][speed == 0.0] == 0.0)
+
+
+def test_stopped_parallel_pump_blocks_backflow():
+    net = _network(pumps=2)
+    both = net.solve(speeds={"P0": 1.0, "P1": 1.0})
+    one = net.solve(speeds={"P0": 1.0, "P1": 0.0})
+    assert abs(one["V_dot"]["P1"]) < 1e-6
+    assert 0.0 < one["V_dot"]["P0"] < both["V_dot"]["P0"] + both["V_dot"]["P1"]
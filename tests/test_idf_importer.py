@@ -0,0 +1,278 @@
+import math
+import os
+
+import pytest
+
+import energy_models as em
+from energy_models.idf.IDFImporter import IDFImporter
+
+CURVES = """
+! Every supported curve class; a ";" in a comment does not end an object
+Curve:Linear, Lin, 0.5, 2.0, 0, 1;   Curve:Quadratic, Quad, 0.1, 0.2, 0.7, 0, 1;
+Curve:Cubic, Cub, 0.1, 0.2, 0.3, 0.4, 0, 1;
+Curve:Quartic,
+  Quart,     !- Name; not the end
+  0.0408, 0.088, -0.0729, 0.9437, 0.01,
+  0, 1;
+Curve:Exponent, Exp, 0.2, 0.8, 1.5, 0, 1;
+Curve:RectangularHyperbola2, Hyp, 0.97, 0.05, -0.01, 0, 1;
+Curve:QuadraticLinear, QL, 1, 2, 3, 4, 5, 6, 0, 1, 0, 1;
+Curve:CubicLinear, CL, 1, 2, 3, 4, 5, 6, 0, 1, 0, 1;
+Curve:Biquadratic, BQ, 1, 2, 3, 4, 5, 6, 0, 1, 0, 1;
+Curve:Bicubic, BC, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 0, 1, 0, 1;
+Curve:FanPressureRise, FPR, 1500, 300, 0, 1.2, 0, 10, 0, 500;
+"""
+
+SCHEDULES = """
+Schedule:Constant, Always On, Fraction, 1.0;
+Schedule:Constant, Never, Fraction, 0.0;
+Schedule:Day:Hourly, Hourly, Fraction,
+  0,0,0,0,0,0,0,0.5,1,1,1,1,1,1,1,1,1,1,0.5,0,0,0,0,0;
+Schedule:Compact,
+  Office,                  !- Name
+  Fraction,                !- Schedule Type Limits Name
+  Through: 12/31,
+  For: Weekdays,
+  Until: 07:00, 0.0,
+  Until: 19:00, 1.0,
+  Until: 24:00, 0.0,
+  For: AllOtherDays,
+  Until: 24:00, 0.2;
+"""
+
+COMPONENTS = """
+Fan:ConstantVolume, CV Fan, Always On, 0.63, 600, 2.5, 0.9, 1.0, In, Out;
+Fan:OnOff, OnOff Fan, Always On, 0.48, 500, 2.0, 0.8, 1.0, In, Out;
+Fan:VariableVolume, VAV Fan, Office, 0.63, 750, 3.0, Fraction, 0.2, , 0.9, 1.0,
+  0.0408, 0.088, -0.0729, 0.9437, 0, In, Out;
+Fan:ZoneExhaust, Exhaust, Office, 0.6, 250, 1.5, In, Out, General, Hourly;
+Coil:Heating:Electric, Heater, Always On, 0.98, 10000, In, Out;
+Coil:Heating:Water, HW Coil, Office, 100, 0.5, In, Out, WIn, WOut,
+  NominalCapacity, 40000;
+Coil:Cooling:Water, CHW Coil, Never, 0.002, 1.5, 7, 26, 13, 0.011, 0.008;
+Fan:ComponentModel,
+  Component Fan, In, Out, Always On,
+  3.0,            !- Maximum Flow Rate
+  0.5,            !- Minimum Flow Rate
+  1.0,            !- Fan Sizing Factor
+  0.6,            !- Fan Wheel Diameter
+  0.4,            !- Fan Outlet Area
+  0.7,            !- Maximum Fan Static Efficiency
+  5.0, 0.15,      !- Euler Number, Maximum Dimensionless Fan Airflow
+  0.5,            !- Motor Fan Pulley Ratio
+  40,             !- Belt Maximum Torque
+  1.0,            !- Belt Sizing Factor
+  0.17,           !- Belt Fractional Torque Transition
+  1800,           !- Motor Maximum Speed
+  5000,           !- Maximum Motor Output Power
+  1.1,            !- Motor Sizing Factor
+  1.0,            !- Motor In Airstream Fraction
+  Power,          !- VFD Efficiency Type
+  6000,           !- Maximum VFD Output Power
+  1.0,            !- VFD Sizing Factor
+  FPR,            !- Fan Pressure Rise Curve Name
+  Lin,            !- Duct Static Pressure Reset Curve Name
+  , , , ,         !- Fan efficiency and airflow curves
+  Belt Max,       !- Maximum Belt Efficiency Curve Name
+  Quad, Lin, Cub, !- Normalized Belt Efficiency Curves, Regions 1-3
+  Motor Max,      !- Maximum Motor Efficiency Curve Name
+  Motor PL,       !- Normalized Motor Efficiency Curve Name
+  Hyp;            !- VFD Efficiency Curve Name
+Curve:Quartic, Belt Max, -0.0989, 0.0225, -0.0049, 0.0005, -0.00002, -1, 8;
+Curve:Quadratic, Motor Max, 0.90, 0.005, 0, -1, 8;
+Curve:Quadratic, Motor PL, 0.9, 0.1, 0, 0, 1.5;
+"""
+
+
+@pytest.fixture
+def idf_path(tmp_path):
+    path = tmp_path / "building.idf"
+    path.write_text("Version, 9.6;\n" + CURVES + SCHEDULES + COMPONENTS)
+    return str(path)
+
+
+@pytest.fixture
+def idf(idf_path, tmp_path):
+    return IDFImporter(idf_path, cache_dir=str(tmp_path / "cache"))
+
+
+def test_curves_match_energyplus_forms(idf):
+    x, y = 0.7, 0.3
+    expected = {
+        "Lin": 0.5 + 2.0 * x,
+        "Quad": 0.1 + 0.2 * x + 0.7 * x**2,
+        "Cub": 0.1 + 0.2 * x + 0.3 * x**2 + 0.4 * x**3,
+        "Quart": 0.0408 + 0.088 * x - 0.0729 * x**2 + 0.9437 * x**3 + 0.01 * x**4,
+        "Exp": 0.2 + 0.8 * x**1.5,
+        "Hyp": 0.97 * x / (0.05 + x) - 0.01 * x,
+    }
+    for name, value in expected.items():
+        assert idf.curve(name)(x) == pytest.approx(value)
+    c = range(1, 11)
+    two = {
+        "QL": (c[0] + c[1] * x + c[2] * x**2) + (c[3] + c[4] * x + c[5] * x**2) * y,
+        "CL": (c[0] + c[1] * x + c[2] * x**2 + c[3] * x**3) + (c[4] + c[5] * x) * y,
+        "BQ": c[0] + c[1] * x + c[2] * x**2 + c[3] * y + c[4] * y**2 + c[5] * x * y,
+        "BC": c[0]
+        + c[1] * x
+        + c[2] * x**2
+        + c[3] * y
+        + c[4] * y**2
+        + c[5] * x * y
+        + c[6] * x**3
+        + c[7] * y**3
+        + c[8] * x**2 * y
+        + c[9] * x * y**2,
+    }
+    for name, value in two.items():
+        assert idf.curve(name)(x, y) == pytest.approx(value)
+    # ΔP = C1·Q² + C2·Q + C4·(Psm - Po)
+    Q, dP = 2.0, 150.0
+    assert idf.curve("FPR")(Q, dP) == pytest.approx(1500 * Q**2 + 300 * Q + 1.2 * dP)
+
+
+def test_names_are_case_insensitive_and_kept_as_written(idf):
+    assert idf.curve("quad") is idf.curve("QUAD")
+    assert idf.fields("curve:quadratic", "QUAD")[:4] == ["Quad", "0.1", "0.2", "0.7"]
+    assert idf.names("Curve:Quadratic") == ["Quad", "Motor Max", "Motor PL"]
+    assert idf.names("Curve:Triquadratic") == []
+    with pytest.raises(KeyError):
+        idf.curve("Missing")
+    with pytest.raises(KeyError):
+        idf.fields("Fan:OnOff", "CV Fan")
+
+
+def test_schedules(idf):
+    assert idf.schedule("Always On")(13.0) == 1.0
+    assert idf.schedule("")(13.0) == 1.0
+    hourly = idf.schedule("Hourly").scheduler
+    assert hourly.default == hourly.weekend
+    assert hourly.default[7:10] == [0.5, 1.0, 1.0]
+    office = idf.schedule("Office").scheduler
+    assert office.default == [0.0] * 7 + [1.0] * 12 + [0.0] * 5
+    assert office.weekend == office.holiday == [0.2] * 24
+    assert idf.availability("Never")(12.0) is False
+    assert idf.availability("Always On")(12.0)
+
+
+def test_components(idf_path):
+    # Water coil performance curves are not IDF fields
+    curves = {
+        "cap_temp_curve": em.curve_biquadratic((1.0, 0.01, 0.0, -0.02, 0.0, 0.0)),
+        "cap_flow_curve": em.curve_biquadratic((0.2, 0.5, 0.0, 0.3, 0.0, 0.0)),
+    }
+    idf = IDFImporter(idf_path, cache_dir="", defaults=curves)
+    built = idf.components()
+    assert {name: type(c).__name__ for name, c in built.items()} == {
+        "Component Fan": "ComponentFan",
+        "CV Fan": "ConstantVolumeFan",
+        "OnOff Fan": "OnOffFan",
+        "VAV Fan": "VariableVolumeFan",
+        "Exhaust": "ZoneExhaustFan",
+        "Heater": "ElectricHeatingCoil",
+        "HW Coil": "HeatingWaterCoil",
+        "CHW Coil": "CoolingWaterCoil",
+    }
+    cv = built["CV Fan"]
+    assert (cv.delta_p, cv.eta_motor) == (600.0, 0.9)
+    assert cv.eta_fan == pytest.approx(0.7)
+    assert built["VAV Fan"].m_dot_design == pytest.approx(3.0 * 1.2)
+    assert built["VAV Fan"].power_curve(1.0) == pytest.approx(
+        0.0408 + 0.088 - 0.0729 + 0.9437
+    )
+    assert built["Exhaust"].flow_fraction_schedule.scheduler.default[8] == 1.0
+    assert built["HW Coil"].Q_rated == 40000.0
+    chw = built["CHW Coil"]
+    assert 0.0 < chw.SHR < 1.0 and chw.Q_rated > 0.0
+    # Cached: a curve or component is built once
+    assert idf.component("cv fan") is cv
+
+
+def test_component_model_drive_losses(idf):
+    fan = idf.component("Component Fan")
+    assert fan.eta_motor == 1.0
+    assert (fan.C2, fan.C3, fan.C4) == (300.0, 1500.0, 1.2)
+    assert fan.static_reset_func(2.0) == pytest.approx(4.5)
+
+    belt, motor, vfd = fan.belt_loss_func, fan.motor_loss_func, fan.vfd_loss_func
+    assert isinstance(belt, em.BeltLoss)
+    assert belt.rated_power == pytest.approx(40 * 0.5 * 1800 * 2 * math.pi / 60)
+    assert belt.transition == 0.17
+    hp = math.log(belt.rated_power / 745.7)
+    eta_max = math.exp(
+        -0.0989 + 0.0225 * hp - 0.0049 * hp**2 + 0.0005 * hp**3 - 0.00002 * hp**4
+    )
+    assert belt.eta_max == pytest.approx(eta_max)
+    # Region 2 uses the linear curve
+    P = 0.5 * belt.rated_power
+    assert belt(P) == pytest.approx(P * (1 / (eta_max * (0.5 + 2.0 * 0.5)) - 1), 1e-3)
+
+    assert isinstance(motor, em.MotorLoss)
+    assert motor.rated_power == pytest.approx(5500.0)
+    assert motor.eta_max == pytest.approx(0.90 + 0.005 * math.log(5500 / 745.7))
+    assert isinstance(vfd, em.VFDLoss) and vfd.rated_power == 6000.0
+
+
+def test_component_model_without_drive_data_needs_defaults(tmp_path):
+    path = tmp_path / "bare.idf"
+    path.write_text(
+        CURVES + "Fan:ComponentModel, Bare, In, Out, , 3, 0.5, 1, 0.6, 0.4, 0.7, "
+        "5, 0.15, autosize, autosize, 1, 0.17, 1800, autosize, 1, 1, Power, "
+        "autosize, 1, FPR;\n"
+    )
+    fan = IDFImporter(str(path), cache_dir="").component("Bare")
+    # No drive losses: the ComponentFan defaults apply
+    assert fan.belt_loss_func(1000.0) == 0.0 and fan.motor_loss_func(1000.0) == 0.0
+    custom = em.VFDLoss(5000.0, 0.95)
+    fan = IDFImporter(
+        str(path), cache_dir="", defaults={"vfd_loss_func": custom}
+    ).component("Bare")
+    assert fan.vfd_loss_func is custom
+
+
+def test_missing_values_name_the_arguments(tmp_path):
+    path = tmp_path / "autosized.idf"
+    path.write_text("Fan:ConstantVolume, Auto Fan, , 0.6, autosize, 2.0;\n")
+    with pytest.raises(ValueError, match="delta_p"):
+        IDFImporter(str(path), cache_dir="").component("Auto Fan")
+    fan = IDFImporter(
+        str(path), cache_dir="", overrides={"auto fan": {"delta_p": 500.0}}
+    ).component("Auto Fan")
+    assert fan.delta_p == 500.0
+
+
+def test_cache_round_trip(idf_path, tmp_path, monkeypatch):
+    cache = str(tmp_path / "cache")
+    first = IDFImporter(idf_path, cache_dir=cache)
+    expected = {
+        n: first.fields("Curve:Bicubic", n) for n in first.names("Curve:Bicubic")
+    }
+    # A reload reads the cache, never the index of the whole file
+    monkeypatch.setattr(IDFImporter, "_parse", lambda self: pytest.fail("parsed"))
+    second = IDFImporter(idf_path, cache_dir=cache)
+    assert second.digest == first.digest
+    assert {n: second.fields("Curve:Bicubic", n) for n in expected} == expected
+    assert type(second.component("Component Fan").belt_loss_func) is em.BeltLoss
+    monkeypatch.undo()
+
+    # Touched but identical: hashed again, same entry
+    os.utime(idf_path, (1e9, 1e9))
+    assert IDFImporter(idf_path, cache_dir=cache).digest == first.digest
+
+    # Changed content: a new entry
+    with open(idf_path, "a") as f:
+        f.write("Curve:Linear, Extra, 1, 1, 0, 1;\n")
+    changed = IDFImporter(idf_path, cache_dir=cache)
+    assert changed.digest != first.digest
+    assert changed.curve("Extra")(1.0) == 2.0
+
+
+def test_damaged_or_planted_cache_is_rebuilt(idf_path, tmp_path):
+    cache = tmp_path / "cache"
+    digest = IDFImporter(idf_path, cache_dir=str(cache)).digest
+    for entry in (cache / f"{digest}.v3").iterdir():
+        entry.write_text("not json")
+    assert IDFImporter(idf_path, cache_dir=str(cache)).curve("Lin")(1.0) == 2.5
+    for pointer in cache.glob("*.ref"):
+        pointer.write_text("../../etc")
+    assert IDFImporter(idf_path, cache_dir=str(cache)).curve("Lin")(1.0) == 2.5
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+
+def _fan():
+    return em.ConstantVolumeFan(
+        delta_p=600.0, rho=1.2, eta_fan=0.7, eta_motor=0.9, f_motor_to_air=1.0
+    )
+
+
+def _heater():
+    schedule = em.Scheduler(default=[0.0] * 7 + [1.0] * 12 + [0.5] * 5)
+    return em.ElectricHeatingCoil(
+        q_nominal=10e3,
+        eta=0.98,
+        rho_air=1.2,
+        availability_schedule=lambda t: True,
+        load_fraction_func=em.make_flow_fraction_schedule(schedule),
+    )
+
+
+def _loop():
+    loop = em.AirLoop()
+    loop.add("fan", _fan())
+    loop.add("heater", _heater())
+    loop.connect("fan.h_out", "heater.h_in")
+    return loop
+
+
+def test_result_is_reused_within_tolerance():
+    fan = em.IncrementalComponent(_fan(), rtol=1e-4, tolerances={"h_in": 20.0})
+    first = fan.compute(2.0, 4.0e4)
+    assert fan.changed and (fan.hits, fan.misses) == (0, 1)
+    assert fan.compute(2.0 * (1 + 5e-5), h_in=4.0e4 + 15.0) is first
+    assert not fan.changed and fan.hits == 1
+    # Compared with the last computed inputs: drift adds up
+    assert fan.compute(2.0, 4.0e4 + 30.0) is not first
+    assert fan.changed and fan.misses == 2
+    assert fan.compute(2.0, 4.0e4 + 30.0) == _fan().compute(2.0, 4.0e4 + 30.0)
+
+
+def test_zero_tolerance_recomputes_on_any_change():
+    heater = em.IncrementalComponent(_heater(), rtol=0.1, tolerances={"t": 0.0})
+    heater.compute(7.5, 1.0, 3e4)
+    heater.compute(7.5, 1.0, 3e4)
+    heater.compute(7.5 + 1e-9, 1.0, 3e4)
+    assert (heater.hits, heater.misses) == (1, 2)
+
+
+def test_arrays_flags_and_invalidate():
+    calls = []
+
+    class Model:
+        def compute(self, x, mode="a"):
+            calls.append(mode)
+            return {"y": np.sum(x)}
+
+    model = em.IncrementalComponent(Model(), atol=1e-9)
+    x = np.ones(3)
+    model.compute(x)
+    x[1] = 2.0  # changed in place: still seen as a change
+    assert model.compute(x)["y"] == 4.0
+    model.compute(x, mode="b")
+    model.compute(np.ones(4), mode="b")  # shape change
+    model.compute(np.ones(4), mode="b")
+    model.invalidate()
+    model.compute(np.ones(4), mode="b")
+    assert len(calls) == 5 and model.hits == 1
+
+
+def test_plan_matches_direct_evaluation_every_tick():
+    fan, heater = _fan(), _heater()
+    plan = _loop().compile_incremental(
+        outputs=["fan.W_electric", "heater.h_out"],
+        rtol=1e-6,
+        tolerances={"heater": {"t": 0.0}},
+    )
+    rng = np.random.default_rng(36)
+    for t in np.arange(0.0, 24.0, 0.25):
+        # Steady most of the time, with occasional jumps
+        m_dot = 2.0 if rng.random() < 0.8 else rng.uniform(1.0, 3.0)
+        inputs = {"fan.m_dot": m_dot, "fan.h_in": 4.0e4, "t": t, "m_dot_air": 2.0}
+        result = plan.step(inputs)
+        f = fan.compute(m_dot, 4.0e4)
+        h = heater.compute(t, 2.0, f["h_out"])
+        assert result["fan.W_electric"] == pytest.approx(f["W_electric"], rel=1e-6)
+        assert result["heater.h_out"] == pytest.approx(h["h_out"], rel=1e-6)
+
+
+def test_dirty_flags_follow_the_chain():
+    plan = _loop().compile_incremental(rtol=1e-9, tolerances={"heater": {"t": 0.0}})
+    inputs = {"fan.m_dot": 2.0, "fan.h_in": 4.0e4, "t": 10.0, "m_dot_air": 2.0}
+    plan.step(inputs)
+    assert plan.recomputed == ["fan", "heater"]
+    plan.step(inputs)
+    assert plan.recomputed == []
+    # Only the heater reads t
+    plan.step({**inputs, "t": 10.25})
+    assert plan.recomputed == ["heater"]
+    # A fan change propagates through fan.h_out
+    plan.step({**inputs, "t": 10.25, "fan.h_in": 4.1e4})
+    assert plan.recomputed == ["fan", "heater"]
+    assert plan.components["fan"].misses == 2
+    # A change within tolerance recomputes nothing
+    plan.step({**inputs, "t": 10.25, "fan.h_in": 4.1e4 * (1 + 1e-12)})
+    assert plan.recomputed == []
+    with pytest.raises(ValueError, match="Missing input"):
+        plan.step({"fan.m_dot": 2.0})
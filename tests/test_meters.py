@@ -0,0 +1,120 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import energy_models as em
+
+HOURS = np.arange(8760.0)
+
+
+def _load():
+    # Daily cycle with a distinct peak hour, plus noise
+    rng = np.random.default_rng(41)
+    return 1000.0 + 800.0 * np.sin(2 * np.pi * HOURS / 24) + rng.uniform(0, 50, 8760)
+
+
+def _meter(**kwargs):
+    return em.Meter("Fan:Electricity", key="W", bins=np.linspace(0, 2000, 9), **kwargs)
+
+
+def test_scalar_and_batch_feeding_agree():
+    W = _load()
+    scalar, batch = _meter(threshold=500.0), _meter(threshold=500.0)
+    for t in range(8760):
+        scalar.feed({"W": float(W[t])}, float(t))
+    batch.feed({"W": W}, HOURS)
+    for meter in (scalar, batch):
+        assert meter.count == 8760
+        assert meter.total == pytest.approx(W.sum())
+        assert meter.runtime == np.count_nonzero(W > 500.0)
+        assert (meter.max, meter.max_t) == (W.max(), float(np.argmax(W)))
+    np.testing.assert_allclose(scalar.interval_energy(), W)
+    np.testing.assert_allclose(batch.interval_energy(), W)
+    np.testing.assert_array_equal(
+        scalar.histogram()["counts"], np.histogram(W, np.linspace(0, 2000, 9))[0]
+    )
+    np.testing.assert_array_equal(
+        batch.histogram()["counts"], scalar.histogram()["counts"]
+    )
+
+
+def test_monthly_totals_and_peak_demand():
+    W = _load()
+    meter = _meter()
+    meter.add(W, HOURS)
+    days = np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]) * 24
+    expected = [W[a:b].sum() for a, b in zip(days[:-1], days[1:])]
+    np.testing.assert_allclose(meter.totals("month"), expected)
+    np.testing.assert_allclose(meter.totals("day"), W.reshape(365, 24).sum(axis=1))
+    peak = meter.peak_demand("month")
+    assert peak["demand"][0] == W[: days[1]].max()
+    assert peak["t"][0] == float(np.argmax(W[: days[1]]))
+
+
+def test_long_timesteps_spread_over_demand_intervals():
+    # Constant 1 kW in 1-hour steps, 15-minute demand: the peak stays 1 kW
+    meter = em.Meter("Heater", interval=0.25)
+    meter.add(np.full(48, 1000.0), np.arange(48.0), timestep=1.0)
+    np.testing.assert_allclose(meter.interval_energy(), 250.0)
+    assert meter.peak_demand()["demand"][0] == pytest.approx(1000.0)
+    # A timestep straddling interval boundaries, fed as a scalar
+    meter = em.Meter("Heater", interval=0.25)
+    meter.add(1000.0, 0.1, timestep=0.5)
+    np.testing.assert_allclose(meter.interval_energy(), [150.0, 250.0, 100.0])
+
+
+def test_fleet_blocks_are_summed_over_units():
+    block = np.arange(12.0).reshape(3, 4)
+    meter = em.Meter("Fleet")
+    meter.add(block, np.arange(4.0))
+    np.testing.assert_allclose(meter.interval_energy(), block.sum(axis=0))
+
+
+def test_rollup_gives_the_coincident_peak():
+    # Two fans peaking at different hours
+    a, b = em.Meter("A"), em.Meter("B")
+    a.add(np.array([10.0, 1.0, 1.0]), np.arange(3.0))
+    b.add(np.array([1.0, 1.0, 10.0]), np.arange(3.0))
+    ahu = em.Meter("AHU", children=[a, b])
+    report = ahu.report()
+    assert report["total"] == 24.0
+    assert report["peak_demand"] == 11.0 and report["peak_t"] == 0.0
+    # max is the largest single value, not coincident
+    assert report["max"] == 10.0
+    # The parent itself holds nothing fed directly
+    assert ahu.total == 0.0
+
+
+def test_merge_of_split_workers_matches_one_meter():
+    W = _load()
+    whole = _meter(threshold=500.0)
+    whole.add(W, HOURS)
+    parts = []
+    for chunk in np.array_split(np.arange(8760), 4):
+        part = _meter(threshold=500.0)
+        part.add(W[chunk], HOURS[chunk])
+        # Meters travel between processes by pickling
+        parts.append(pickle.loads(pickle.dumps(part)))
+    merged = _meter(threshold=500.0)
+    for part in parts:
+        merged.merge(part)
+    assert merged.report()["total"] == pytest.approx(whole.total)
+    np.testing.assert_allclose(merged.interval_energy(), whole.interval_energy())
+    np.testing.assert_array_equal(
+        merged.histogram()["counts"], whole.histogram()["counts"]
+    )
+    assert (merged.runtime, merged.max, merged.max_t) == (
+        whole.runtime,
+        whole.max,
+        whole.max_t,
+    )
+
+
+def test_incompatible_meters_do_not_merge():
+    with pytest.raises(ValueError):
+        em.Meter("A").merge(em.Meter("B", interval=0.25))
+    with pytest.raises(ValueError):
+        em.Meter("A").merge(_meter())
+    with pytest.raises(ValueError):
+        em.Meter("A").add(np.ones(2), np.array([-1.0, 0.0]))
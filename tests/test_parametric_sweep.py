@@ -0,0 +1,100 @@
+import importlib
+import os
+
+import numpy as np
+import pytest
+
+import energy_models as em
+
+sweep_module = importlib.import_module("energy_models.sweep.ParametricSweep")
+
+GRID = {"delta_p": [400.0, 500.0, 600.0, 700.0], "eta_fan": [0.6, 0.65, 0.7]}
+BASE = {"rho": 1.2, "eta_motor": 0.9, "f_motor_to_air": 1.0}
+
+
+def _inputs():
+    rng = np.random.default_rng(31)
+    return {"m_dot": rng.uniform(0.5, 3.0, 8760), "h_in": rng.uniform(2e4, 6e4, 8760)}
+
+
+def _direct(variant, inputs):
+    return em.ConstantVolumeFan(**BASE, **variant).compute_batch(**inputs)
+
+
+def _sweep(**kwargs):
+    kwargs.setdefault("chunk_size", 5)
+    return em.ParametricSweep(
+        em.ConstantVolumeFan, GRID, _inputs(), base=BASE, **kwargs
+    )
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_grid_results_in_variant_order(workers):
+    inputs = _inputs()
+    sweep = _sweep(max_workers=workers)
+    assert len(sweep) == 12
+    runs = list(sweep.run())
+    assert [index for index, _, _ in runs] == list(range(12))
+    # Cartesian product, last name varying fastest
+    assert [variant for _, variant, _ in runs][:4] == [
+        {"delta_p": 400.0, "eta_fan": 0.6},
+        {"delta_p": 400.0, "eta_fan": 0.65},
+        {"delta_p": 400.0, "eta_fan": 0.7},
+        {"delta_p": 500.0, "eta_fan": 0.6},
+    ]
+    for _, variant, result in runs:
+        expected = _direct(variant, inputs)
+        assert set(result) == set(expected)
+        for key, value in expected.items():
+            np.testing.assert_array_equal(result[key], value, err_msg=key)
+
+
+@pytest.mark.parametrize("reduce", ["sum", "max", np.mean])
+def test_outputs_and_reduce(reduce):
+    inputs = _inputs()
+    sweep = _sweep(max_workers=0, outputs=["W_electric"], reduce=reduce)
+    name = reduce if isinstance(reduce, str) else "mean"
+    for _, variant, result in sweep.run():
+        expected = getattr(np, name)(_direct(variant, inputs)["W_electric"])
+        assert list(result) == ["W_electric"]
+        assert result["W_electric"] == pytest.approx(expected, rel=1e-12)
+
+
+def test_checkpoints_resume_only_missing_chunks(tmp_path, monkeypatch):
+    directory = str(tmp_path)
+    first = list(_sweep(max_workers=0, checkpoint_dir=directory).run())
+    files = sorted(os.listdir(directory))
+    assert len(files) == 3 and all(name.endswith(".pkl") for name in files)
+
+    calls = []
+    run_chunk = sweep_module._run_chunk
+
+    def counted(*args):
+        calls.append(len(args[2]))
+        return run_chunk(*args)
+
+    monkeypatch.setattr(sweep_module, "_run_chunk", counted)
+    # A crash after the first two chunks: only the last one is computed
+    os.remove(os.path.join(directory, files[-1]))
+    second = list(_sweep(max_workers=0, checkpoint_dir=directory).run())
+    assert calls == [2]
+    for (i, a, x), (j, b, y) in zip(first, second):
+        assert (i, a) == (j, b)
+        np.testing.assert_array_equal(x["W_electric"], y["W_electric"])
+    # Different inputs never reuse the chunks
+    sweep = _sweep(max_workers=0, checkpoint_dir=directory)
+    sweep.inputs = {**sweep.inputs, "h_in": sweep.inputs["h_in"] + 1.0}
+    list(sweep.run())
+    assert calls == [2, 5, 5, 2]
+
+
+def test_explicit_variants_and_invalid_arguments():
+    variants = [{"delta_p": 450.0, "eta_fan": 0.62}, {"delta_p": 800.0, "eta_fan": 0.7}]
+    sweep = em.ParametricSweep(
+        em.ConstantVolumeFan, variants, _inputs(), base=BASE, max_workers=0
+    )
+    assert [variant for _, variant, _ in sweep.run()] == variants
+    with pytest.raises(ValueError):
+        _sweep(reduce="median")
+    with pytest.raises(ValueError):
+        _sweep(chunk_size=0)
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+import energy_models as em
+
+SLEEP = 0.02
+
+
+def _slow_curve(x):
+    time.sleep(SLEEP)
+    return 1.0
+
+
+def _fan():
+    return em.VariableVolumeFan(
+        m_dot_design=3.0,
+        delta_p=600.0,
+        rho=1.2,
+        eta_fan=0.7,
+        eta_motor=0.9,
+        f_motor_to_air=1.0,
+        power_curve=_slow_curve,
+    )
+
+
+def test_self_time_excludes_injected_callables():
+    fan = _fan()
+    with em.Profiler() as profiler:
+        label = profiler.attach(fan)
+        for _ in range(5):
+            fan.compute(1.5, 4.0e4)
+    compute = profiler.stats[f"{label}.compute"]
+    curve = profiler.stats[f"{label}.power_curve"]
+    assert compute["calls"] == curve["calls"] == 5
+    assert curve["self_s"] == pytest.approx(curve["total_s"])
+    assert curve["total_s"] >= 5 * SLEEP
+    assert 0.0 <= compute["self_s"] < 0.5 * SLEEP * 5
+    assert compute["total_s"] >= curve["total_s"]
+
+
+def test_self_time_per_thread():
+    # Calls overlapping in threads, as under ChunkedExecutor
+    fans = [_fan() for _ in range(4)]
+    barrier = threading.Barrier(len(fans))
+
+    def run(fan):
+        barrier.wait()
+        for _ in range(5):
+            fan.compute(1.5, 4.0e4)
+
+    with em.Profiler() as profiler:
+        labels = [profiler.attach(fan) for fan in fans]
+        threads = [threading.Thread(target=run, args=(fan,)) for fan in fans]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    for label in labels:
+        compute = profiler.stats[f"{label}.compute"]
+        curve = profiler.stats[f"{label}.power_curve"]
+        assert compute["calls"] == 5
+        assert curve["self_s"] == pytest.approx(curve["total_s"])
+        assert 0.0 <= compute["self_s"] < 0.5 * SLEEP * 5
+
+
+def test_detach_restores_the_class():
+    fan = _fan()
+    compute = type(fan).compute
+    with em.Profiler() as profiler:
+        profiler.attach(fan)
+        assert type(fan).compute is not compute
+    assert type(fan).compute is compute
+    assert fan.power_curve is _slow_curve
@@ -0,0 +1,222 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from energy_models import ConstantVolumeFan
+from energy_models.realtime.RealtimeService import RealtimeService
+
+
+class FakeBMS:
+    """In-process stand-in for a BMS point feed: replays scripted updates."""
+
+    def __init__(self, updates, delay=0.0):
+        self.updates = list(updates)
+        self.delay = delay
+
+    async def run(self, service):
+        for key, points in self.updates:
+            await service.submit(key, points)
+            if self.delay:
+                await asyncio.sleep(self.delay)
+
+
+def _fan():
+    return ConstantVolumeFan(
+        delta_p=600.0, rho=1.2, eta_fan=0.7, eta_motor=0.9, f_motor_to_air=1.0
+    )
+
+
+async def _collect(service):
+    return [result async for result in service.stream()]
+
+
+def test_results_match_model_on_latest_state():
+    fan = _fan()
+    source = FakeBMS(
+        [
+            ("AHU-1", {"m_dot": 3.2, "h_in": 4.1e4}),
+            ("AHU-2", {"m_dot": 1.8, "h_in": 4.0e4}),
+            ("AHU-1", {"m_dot": 3.4}),
+            ("AHU-3", {"m_dot": 2.0}),  # never gets h_in: not evaluated
+        ]
+    )
+
+    async def main():
+        service = RealtimeService(fan.compute_batch, window=0.01)
+        service.start()
+        consumer = asyncio.ensure_future(_collect(service))
+        await source.run(service)
+        await service.stop()
+        return service, await consumer
+
+    service, results = asyncio.run(main())
+    latest = {r["key"]: r for r in results}
+    assert set(latest) == {"AHU-1", "AHU-2"}
+    expected = fan.compute(3.4, 4.1e4)
+    for name, value in expected.items():
+        assert latest["AHU-1"][name] == pytest.approx(value)
+    assert service.state["AHU-3"] == {"m_dot": 2.0}
+    assert service.stats["updates"] == 4
+    assert service.stats["dropped"] == 0
+
+
+def test_updates_within_a_window_are_one_batch():
+    calls = []
+
+    def model(m_dot, h_in):
+        calls.append(len(m_dot))
+        return {"W": m_dot * h_in}
+
+    updates = [(f"dev-{i}", {"m_dot": float(i), "h_in": 2.0}) for i in range(50)]
+    updates += [("dev-0", {"m_dot": 7.0})]
+
+    async def main():
+        service = RealtimeService(model, window=0.2)
+        async with service:
+            await FakeBMS(updates).run(service)
+        return service, [service.results.get_nowait() for _ in range(50)]
+
+    service, results = asyncio.run(main())
+    assert calls == [50]
+    assert {r["key"]: r["W"] for r in results}["dev-0"] == 14.0
+    assert service.stats["batches"] == 1
+
+
+def test_outputs_and_constants():
+    fan = _fan()
+
+    async def main():
+        service = RealtimeService(
+            fan.compute_batch,
+            window=0.0,
+            constants={"h_in": 4.0e4},
+            outputs=["W_electric"],
+        )
+        async with service:
+            await service.submit("AHU-1", {"m_dot": 2.0})
+        return await service.results.get()
+
+    result = asyncio.run(main())
+    assert result == {
+        "key": "AHU-1",
+        "W_electric": pytest.approx(fan.compute(2.0, 4.0e4)["W_electric"]),
+    }
+
+
+def test_model_error_is_reported_per_device():
+    def model(x):
+        raise RuntimeError("sensor fault")
+
+    async def main():
+        service = RealtimeService(model, window=0.0)
+        service.start()
+        consumer = asyncio.ensure_future(_collect(service))
+        await FakeBMS([("a", {"x": 1.0}), ("b", {"x": 2.0})]).run(service)
+        await service.stop()
+        return service, await consumer
+
+    service, results = asyncio.run(main())
+    assert {r["key"] for r in results} == {"a", "b"}
+    assert all("sensor fault" in r["error"] for r in results)
+    assert service.stats["errors"] >= 1
+
+
+def test_try_submit_drops_when_queue_is_full():
+    async def main():
+        service = RealtimeService(lambda x: {"y": x}, window=1.0, maxsize=2)
+        service.start()
+        accepted = [service.try_submit(i, {"x": 1.0}) for i in range(5)]
+        await service.stop()
+        return accepted
+
+    assert asyncio.run(main()) == [True, True, False, False, False]
+
+
+def test_submit_waits_while_evaluation_is_behind():
+    evaluated = []
+
+    def model(x):
+        evaluated.extend(np.asarray(x).tolist())
+        return {"y": x}
+
+    updates = [(i, {"x": float(i)}) for i in range(20)]
+
+    async def main():
+        service = RealtimeService(model, window=0.0, max_batch=2, maxsize=2)
+        service.start()
+        consumer = asyncio.ensure_future(_collect(service))
+        await FakeBMS(updates).run(service)
+        await service.stop()
+        return await consumer
+
+    results = asyncio.run(main())
+    assert sorted(r["key"] for r in results) == list(range(20))
+    assert sorted(evaluated) == [float(i) for i in range(20)]
+
+
+def test_stop_without_consumer_does_not_deadlock():
+    updates = [(i, {"x": float(i)}) for i in range(10)]
+
+    async def main():
+        service = RealtimeService(lambda x: {"y": x}, window=0.01, maxsize=3)
+        service.start()
+        await FakeBMS(updates).run(service)
+        await asyncio.wait_for(service.stop(), timeout=5.0)
+        return service
+
+    service = asyncio.run(main())
+    assert service.results.qsize() == 3
+    assert service.stats["dropped"] == 10 - 3
+    assert service.stats["evaluated"] == 10
+
+
+def test_stop_with_slow_consumer_delivers_everything():
+    updates = [(i, {"x": float(i)}) for i in range(10)]
+
+    async def slow_collect(service):
+        results = []
+        async for result in service.stream():
+            results.append(result)
+            await asyncio.sleep(0.001)
+        return results
+
+    async def main():
+        service = RealtimeService(lambda x: {"y": x}, window=0.05, maxsize=2)
+        service.start()
+        consumer = asyncio.ensure_future(slow_collect(service))
+        await FakeBMS(updates).run(service)
+        await service.stop()
+        return service, await consumer
+
+    service, results = asyncio.run(main())
+    assert sorted(r["key"] for r in results) == list(range(10))
+    assert service.stats["dropped"] == 0
+
+
+def test_non_numeric_point_fails_only_its_device():
+    fan = _fan()
+    updates = [
+        ("AHU-1", {"m_dot": 3.2, "h_in": 4.1e4}),
+        ("AHU-2", {"m_dot": None, "h_in": 4.0e4}),
+        ("AHU-3", {"m_dot": "n/a", "h_in": 4.0e4}),
+    ]
+    # More updates than the queues hold: the service must keep evaluating
+    updates += [(f"dev-{i}", {"m_dot": 1.0, "h_in": 4.0e4}) for i in range(20)]
+
+    async def main():
+        service = RealtimeService(fan.compute_batch, window=0.01, maxsize=4)
+        service.start()
+        consumer = asyncio.ensure_future(_collect(service))
+        await asyncio.wait_for(FakeBMS(updates).run(service), timeout=5.0)
+        await service.stop()
+        return service, await consumer
+
+    service, results = asyncio.run(main())
+    latest = {r["key"]: r for r in results}
+    assert "error" in latest["AHU-2"] and "error" in latest["AHU-3"]
+    assert latest["AHU-1"]["W_electric"] == pytest.approx(
+        fan.compute(3.2, 4.1e4)["W_electric"]
+    )
+    assert service.stats["evaluated"] == 21
+    assert service.stats["errors"] == 2
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+from energy_models.cache.ResultCache import ResultCache, fingerprint
+
+# Read by _scaled() through the module globals
+SCALE = 2.0
+
+
+def _scaled(x):
+    return SCALE * x
+
+
+def _fan(delta_p=600.0):
+    return em.ConstantVolumeFan(
+        delta_p=delta_p, rho=1.2, eta_fan=0.7, eta_motor=0.9, f_motor_to_air=1.0
+    )
+
+
+def _inputs():
+    rng = np.random.default_rng(7)
+    return rng.uniform(0.5, 3.0, 24), rng.uniform(2e4, 6e4, 24)
+
+
+def _network():
+    net = em.HydronicNetwork()
+    net.set_reference("tank", pressure=100.0)
+    net.add_pump("P", "tank", "s", head_curve=em.curve_quadratic(200.0, 0.0, -0.02))
+    valve = em.TwoWayControlValve(
+        kvs=25.0, x0=0.02, characteristic="equal_percentage", exponent=3.5, rho=998
+    )
+    net.add_valve("v0", "s", "c", valve=valve)
+    net.add_coil("k0", "c", "tank", k=0.05)
+    return net
+
+
+def test_repeated_call_hits(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    fan = _fan()
+    m_dot, h_in = _inputs()
+    first = cache.compute(fan, m_dot, h_in)
+    second = cache.compute(fan, m_dot=m_dot, h_in=h_in)
+    assert (cache.hits, cache.misses) == (1, 1)
+    for key, value in fan.compute_batch(m_dot, h_in).items():
+        np.testing.assert_array_equal(first[key], value)
+        np.testing.assert_array_equal(second[key], value)
+
+
+def test_scalar_results_come_back_as_floats(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    fan = _fan()
+    cache.compute(fan, 2.0, 4.0e4, method="compute")
+    result = cache.compute(fan, 2.0, 4.0e4, method="compute")
+    assert cache.hits == 1
+    assert result == pytest.approx(fan.compute(2.0, 4.0e4))
+    assert all(isinstance(v, float) for v in result.values())
+
+
+def test_changed_parameter_or_input_misses(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    m_dot, h_in = _inputs()
+    cache.compute(_fan(), m_dot, h_in)
+    cache.compute(_fan(delta_p=601.0), m_dot, h_in)
+    changed = m_dot.copy()
+    changed[5] += 1e-9
+    cache.compute(_fan(), changed, h_in)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_curve_coefficients_and_globals_are_part_of_the_key(monkeypatch):
+    assert fingerprint(em.curve_quadratic(1.0, 2.0, 3.0)) == fingerprint(
+        em.curve_quadratic(1.0, 2.0, 3.0)
+    )
+    assert fingerprint(em.curve_quadratic(1.0, 2.0, 3.0)) != fingerprint(
+        em.curve_quadratic(1.0, 2.0, 3.5)
+    )
+    before = fingerprint(_scaled)
+    monkeypatch.setitem(globals(), "SCALE", 3.0)
+    assert fingerprint(_scaled) != before
+
+
+def test_network_solves_share_an_entry(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    net = _network()
+    x = np.linspace(0.0, 1.0, 7)
+    results = [
+        cache.compute(net, method="solve", positions={"v0": x}) for _ in range(3)
+    ]
+    assert (cache.hits, cache.misses) == (2, 1)
+    np.testing.assert_allclose(
+        results[2]["V_dot"]["P"], net.solve(positions={"v0": x})["V_dot"]["P"]
+    )
+    scalar = cache.compute(net, method="solve", positions={"v0": 0.5})
+    assert isinstance(scalar["V_dot"]["P"], float)
+    assert cache.compute(net, method="solve", positions={"v0": 0.5}) == scalar
+    assert cache.hits == 3
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    fan = _fan()
+    m_dot, h_in = _inputs()
+    cache = ResultCache(str(tmp_path), max_bytes=1)
+    cache.compute(fan, m_dot, h_in)
+    cache.compute(fan, m_dot * 2, h_in)
+    # Only the newest entry stays
+    assert len(list(tmp_path.iterdir())) == 1
+    cache.compute(fan, m_dot * 2, h_in)
+    cache.compute(fan, m_dot, h_in)
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.clear()
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+UNITS, STEPS = 11, 168
+
+
+def _fleet():
+    rng = np.random.default_rng(47)
+    params = {
+        "m_dot_design": rng.uniform(1.0, 3.0, UNITS),
+        "delta_p": rng.uniform(300.0, 900.0, UNITS),
+        "eta_fan": rng.uniform(0.5, 0.8, UNITS),
+        "eta_motor": 0.9,
+        "f_motor_to_air": 1.0,
+        "rho": 1.2,
+    }
+    # A shared timeseries and a full (units, timesteps) block; zero requests
+    # switch the fans off
+    requested = rng.uniform(0.0, 3.0, STEPS)
+    requested[::7] = 0.0
+    inputs = {
+        "m_dot_requested": requested,
+        "h_in": rng.uniform(2e4, 6e4, (UNITS, STEPS)),
+    }
+    return params, inputs
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_fleet_result_matches_direct_evaluation(workers):
+    params, inputs = _fleet()
+    expected = em.OnOffFanFleet(**params).compute(**inputs)
+    # Uneven blocks in both directions
+    with em.SharedMemoryPool(
+        max_workers=workers, units_per_task=3, steps_per_task=50
+    ) as pool:
+        result = pool.run(em.OnOffFanFleet, params, inputs)
+    assert set(result) == set(expected)
+    for key, value in expected.items():
+        assert result[key].shape == (UNITS, STEPS)
+        np.testing.assert_array_equal(result[key], value, err_msg=key)
+
+
+def test_shared_inputs_and_selected_outputs():
+    params, inputs = _fleet()
+    expected = em.OnOffFanFleet(**params).compute(**inputs)
+    with em.SharedMemoryPool(max_workers=0) as pool:
+        h_in = pool.share(inputs["h_in"])
+        column = pool.share(inputs["h_in"][:, :1])
+        result = pool.run(
+            em.OnOffFanFleet,
+            params,
+            {**inputs, "h_in": h_in},
+            outputs=["W_electric_avg"],
+        )
+        per_unit = pool.run(em.OnOffFanFleet, params, {**inputs, "h_in": column})
+    assert list(result) == ["W_electric_avg"]
+    np.testing.assert_array_equal(result["W_electric_avg"], expected["W_electric_avg"])
+    np.testing.assert_array_equal(
+        per_unit["h_out"],
+        em.OnOffFanFleet(**params).compute(inputs["m_dot_requested"], column)["h_out"],
+    )
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+import energy_models as em
+
+FAN = {"rho": 1.2, "eta_motor": 0.9, "f_motor_to_air": 1.0}
+DISTRIBUTIONS = {
+    "delta_p": ("uniform", 500.0, 700.0),
+    "eta_fan": ("triangular", 0.55, 0.65, 0.7),
+    "h_in": ("normal", 0.0, 500.0),
+}
+
+
+def _trend():
+    rng = np.random.default_rng(39)
+    return {"m_dot": rng.uniform(0.5, 3.0, 8760), "h_in": rng.uniform(2e4, 6e4, 8760)}
+
+
+def _analysis(**kwargs):
+    return em.UncertaintyAnalysis(
+        em.ConstantVolumeFan, DISTRIBUTIONS, _trend(), base=FAN, seed=39, **kwargs
+    )
+
+
+@pytest.mark.parametrize("reduce", ["sum", "max", lambda x: x[:, :24].mean(axis=-1)])
+def test_chunks_match_one_model_per_sample(reduce):
+    inputs = _trend()
+    analysis = _analysis(output="h_out", reduce=reduce, chunk_size=7)
+    samples = analysis.sample(20)
+    values = analysis.evaluate(samples)
+    for i in range(20):
+        fan = em.ConstantVolumeFan(
+            **FAN, delta_p=samples["delta_p"][i], eta_fan=samples["eta_fan"][i]
+        )
+        # h_in is sampled as an offset on the input timeseries
+        h_out = fan.compute_batch(inputs["m_dot"], inputs["h_in"] + samples["h_in"][i])
+        expected = h_out["h_out"][None, :]
+        if callable(reduce):
+            expected = reduce(expected)[0]
+        else:
+            expected = getattr(np, reduce)(expected)
+        assert values[i] == pytest.approx(expected, rel=1e-12)
+
+
+def test_latin_hypercube_fills_every_stratum():
+    n = 50
+    samples = _analysis().sample(n)
+    strata = np.floor((samples["delta_p"] - 500.0) / 200.0 * n)
+    np.testing.assert_array_equal(np.sort(strata), np.arange(n))
+    assert np.all((samples["eta_fan"] >= 0.55) & (samples["eta_fan"] <= 0.7))
+    # The same seed gives the same samples
+    np.testing.assert_array_equal(_analysis().sample(n)["h_in"], samples["h_in"])
+
+
+def test_run_reports_spread():
+    result = _analysis(reduce="mean").run(n=200, percentiles=(5, 50, 95))
+    values = result["values"]
+    assert values.shape == (200,)
+    assert result["mean"] == pytest.approx(values.mean())
+    low, median, high = result["percentiles"].values()
+    assert values.min() <= low < median < high <= values.max()
+    assert result["std"] > 0.0
+
+
+class _Additive:
+    # y = x1 + 2·x2 at every timestep: S1 = ST = (0.2, 0.8) for uniform x
+    def __init__(self, x1, x2):
+        self.x1, self.x2 = x1, x2
+
+    def compute_batch(self, t):
+        return {"y": self.x1 + 2.0 * self.x2 + 0.0 * t}
+
+
+def test_sobol_indices_of_an_additive_model():
+    analysis = em.UncertaintyAnalysis(
+        _Additive,
+        {"x1": ("uniform", 0.0, 1.0), "x2": ("uniform", 0.0, 1.0)},
+        {"t": np.arange(24.0)},
+        output="y",
+        reduce="mean",
+        seed=39,
+    )
+    result = analysis.sobol(n=4000)
+    assert result["variance"] == pytest.approx(5 / 12, rel=0.05)
+    for key in ("S1", "ST"):
+        assert result[key]["x1"] == pytest.approx(0.2, abs=0.05)
+        assert result[key]["x2"] == pytest.approx(0.8, abs=0.05)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        _analysis(reduce="median")
+    with pytest.raises(ValueError):
+        _analysis().sample(10, method="sobol")
+    with pytest.raises(ValueError):
+        em.UncertaintyAnalysis(
+            em.ConstantVolumeFan, {"delta_p": ("beta", 1, 2)}, _trend(), base=FAN
+        ).sample(10)